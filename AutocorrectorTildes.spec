@@ -4,6 +4,8 @@ from PyInstaller.utils.hooks import collect_all
 datas = [('data', 'data'), ('config', 'config')]
 binaries = []
 hiddenimports = ['PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets', 'keyboard', 'pyautogui', 'pystray', 'PIL']
+# core.backends importa cada backend por nombre (importlib): PyInstaller no los ve
+hiddenimports += ['core.backends.system', 'core.backends.simulated', 'core.backends.evdev_backend']
 tmp_ret = collect_all('PyQt6')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
@@ -0,0 +1,6 @@
+# ============================================================================
+# benchmarks/__init__.py
+# ============================================================================
+"""
+Benchmarks del motor de corrección (se ejecutan sin pantalla ni teclado)
+"""
\ No newline at end of file
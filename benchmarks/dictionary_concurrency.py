@@ -0,0 +1,250 @@
+# benchmarks/dictionary_concurrency.py
+"""
+Benchmark de concurrencia del diccionario.
+
+Varios hilos consultan get_corrected_word sin parar mientras otros dan
+de alta y de baja palabras de usuario, como harían los hilos de
+corrección mientras alguien edita el diccionario desde la ventana:
+
+    python -m benchmarks.dictionary_concurrency
+    python -m benchmarks.dictionary_concurrency --readers 8 --writers 2 --duration 5 -o resultados.json
+
+Se mide primero solo con lectores y después con lectores y escritores.
+Se informa de las consultas por segundo en cada fase, la latencia de las
+consultas y de las escrituras, las versiones publicadas y los errores de
+consistencia: un lector que vea retroceder la versión o que una versión
+cambie mientras la recorre. Trabaja sobre una copia de data/ en una
+carpeta temporal; el diccionario del usuario no se toca.
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.dictionary_manager import DictionaryManager
+
+from .keystroke_replay import percentiles_ms
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+SAMPLE_SIZE = 10_000
+
+
+def prepare_data_dir(target: Path, dictionary: Optional[Path] = None):
+    """Copia el diccionario base (y las reglas de contexto) a 'target'."""
+    source = dictionary or DATA_DIR / "default_dictionary.json"
+    shutil.copyfile(source, target / "default_dictionary.json")
+    rules = DATA_DIR / "context_rules.tsv"
+    if rules.exists():
+        shutil.copyfile(rules, target / "context_rules.tsv")
+    (target / "user_dictionary.json").write_text("{}", encoding="utf-8")
+
+
+class _Phase:
+    """Lectores (y escritores) durante un tiempo fijo."""
+
+    def __init__(self, manager: DictionaryManager, words: List[str], batch: int):
+        self.manager = manager
+        self.words = words
+        self.batch = batch
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.lookups = 0
+        self.writes = 0
+        self.lookup_latencies: List[float] = []   # por consulta, promedio de cada lote
+        self.write_latencies: List[float] = []
+        self.errors: List[str] = []
+
+    def reader(self, seed: int):
+        rng = random.Random(seed)
+        get_corrected_word = self.manager.get_corrected_word
+        lookups = 0
+        latencies = []
+        last_version = -1
+        rounds = 0
+
+        while not self.stop.is_set():
+            snapshot = self.manager.snapshot()
+            if snapshot.version < last_version:
+                self._error(f"la versión retrocedió: {last_version} -> {snapshot.version}")
+            last_version = snapshot.version
+
+            rounds += 1
+            if rounds % 50 == 0:
+                # Recorrer una versión mientras se publican otras: con un
+                # dict compartido esto fallaría ("changed size during iteration")
+                try:
+                    count = sum(1 for _ in snapshot.user.items())
+                    if count != len(snapshot.user):
+                        self._error("una versión cambió mientras se recorría")
+                except RuntimeError as e:
+                    self._error(f"una versión cambió mientras se recorría: {e}")
+
+            sample = rng.choices(self.words, k=self.batch)
+            started = time.perf_counter()
+            try:
+                for word in sample:
+                    get_corrected_word(word)
+            except Exception as e:
+                self._error(repr(e))
+            latencies.append((time.perf_counter() - started) / self.batch)
+            lookups += self.batch
+
+        with self.lock:
+            self.lookups += lookups
+            self.lookup_latencies.extend(latencies)
+
+    def writer(self, writer_id: int):
+        writes = 0
+        latencies = []
+        pending: List[str] = []
+        i = 0
+
+        while not self.stop.is_set():
+            # Alta de una palabra nueva y baja de la más antigua (máximo 50 vivas)
+            word = f"zzbench{writer_id}x{i}"
+            i += 1
+            started = time.perf_counter()
+            ok, message = self.manager.add_word(word, word.replace("bench", "bénch"))
+            latencies.append(time.perf_counter() - started)
+            if not ok:
+                self._error(f"alta rechazada: {message}")
+                continue
+            pending.append(word)
+            writes += 1
+
+            if len(pending) > 50:
+                started = time.perf_counter()
+                ok, message = self.manager.remove_word(pending.pop(0))
+                latencies.append(time.perf_counter() - started)
+                if not ok:
+                    self._error(f"baja rechazada: {message}")
+                writes += 1
+
+        with self.lock:
+            self.writes += writes
+            self.write_latencies.extend(latencies)
+
+    def _error(self, message: str):
+        with self.lock:
+            if len(self.errors) < 20:
+                self.errors.append(message)
+
+    def run(self, readers: int, writers: int, duration: float) -> Dict:
+        threads = [threading.Thread(target=self.reader, args=(n,)) for n in range(readers)]
+        threads += [threading.Thread(target=self.writer, args=(n,)) for n in range(writers)]
+        version_before = self.manager.version
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        self.stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        return {
+            "readers": readers,
+            "writers": writers,
+            "seconds": round(elapsed, 3),
+            "lookups": self.lookups,
+            "lookups_per_second": round(self.lookups / elapsed),
+            "lookup_latency_us": {k: (round(v * 1000, 2) if v is not None else None)
+                                  for k, v in percentiles_ms(self.lookup_latencies).items()},
+            "writes": self.writes,
+            "writes_per_second": round(self.writes / elapsed, 1),
+            "write_latency_ms": percentiles_ms(self.write_latencies),
+            "versions_published": self.manager.version - version_before,
+            "consistency_errors": self.errors,
+        }
+
+
+def run(readers: int = 4, writers: int = 1, duration: float = 3.0, batch: int = 100,
+        dictionary: Optional[Path] = None) -> Dict:
+    with tempfile.TemporaryDirectory(prefix="autocorrector-bench-") as tmp:
+        data_dir = Path(tmp)
+        prepare_data_dir(data_dir, dictionary)
+        manager = DictionaryManager(data_dir)
+        try:
+            base = manager.base_dictionary
+            rng = random.Random(0)
+            step = max(base.count // SAMPLE_SIZE, 1)
+            # Palabras del base, con y sin mayúsculas, y otras que no están
+            words = [base.key_at(i) for i in range(0, base.count, step)]
+            words += [w.capitalize() for w in words[::4]]
+            words += [f"{w}zz" for w in words[::8]]
+            rng.shuffle(words)
+
+            readers_only = _Phase(manager, words, batch).run(readers, 0, duration)
+            with_writers = _Phase(manager, words, batch).run(readers, writers, duration)
+            manager.user_store.flush()
+        finally:
+            manager.close()
+
+    baseline = readers_only["lookups_per_second"]
+    return {
+        "config": {
+            "readers": readers,
+            "writers": writers,
+            "duration": duration,
+            "batch": batch,
+            "base_words": base.count,
+            "sampled_words": len(words),
+        },
+        "readers_only": readers_only,
+        "with_writers": with_writers,
+        "throughput_ratio": round(with_writers["lookups_per_second"] / baseline, 3) if baseline else None,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.dictionary_concurrency",
+        description="Consultas al diccionario mientras otros hilos lo editan."
+    )
+    parser.add_argument("--readers", type=int, default=4, help="hilos que consultan (por defecto 4)")
+    parser.add_argument("--writers", type=int, default=1, help="hilos que editan (por defecto 1)")
+    parser.add_argument("--duration", type=float, default=3.0, help="segundos por fase (por defecto 3)")
+    parser.add_argument("--batch", type=int, default=100, help="consultas por lote medido")
+    parser.add_argument("--dictionary", help="diccionario base JSON (por defecto, data/default_dictionary.json)")
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.readers < 1 or args.writers < 0 or args.batch < 1:
+        print("Error: hace falta al menos un lector y lotes de al menos una consulta", file=sys.stderr)
+        return 2
+
+    dictionary = Path(args.dictionary) if args.dictionary else None
+    try:
+        # Los mensajes del diccionario van a stderr para no mezclarse con el JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run(args.readers, args.writers, args.duration, args.batch, dictionary)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+# benchmarks/keystroke_replay.py
+"""
+Benchmark de reproducción de pulsaciones.
+
+Escribe un texto tecla a tecla, al ritmo indicado, a través del mismo
+KeyboardListener y AutocorrectEngine que usa la aplicación, pero con el
+backend simulado: las teclas inyectadas y el portapapeles van a un
+editor en memoria. No necesita pantalla, así que se puede ejecutar en el servidor
+de integración:
+
+    python -m benchmarks.keystroke_replay
+    python -m benchmarks.keystroke_replay --wpm 0 --repeat 20 -o resultados.json
+    python -m benchmarks.keystroke_replay --corpus texto_con_tildes.txt --wpm 90
+
+El texto de referencia se escribe sin tildes (la ñ se conserva) y al
+final se compara lo que queda en el editor con el original. Se informa
+de la latencia por palabra (percentiles), el rendimiento, los triggers
+descartados y la precisión.
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.autocorrect_engine import AutocorrectEngine
+from core.backends.simulated import SimulatedBackend
+from core.dictionary_manager import DictionaryManager
+from core.keyboard_listener import KeyboardListener
+from core.text_corrector import WORD_PATTERN
+
+DEFAULT_CORPUS = (
+    "El camión salió temprano de la estación y llegó a la ciudad después "
+    "del mediodía. Mi papá dijo que el teléfono no funcionaba, así que "
+    "tuvimos que buscar una solución rápida. ¿Sabes dónde está la oficina "
+    "de información? Él no sabía qué hacer con la canción que escribió "
+    "para su mamá. La educación pública necesita más atención, según la "
+    "opinión de muchos; aún así, la situación económica también es difícil.\n"
+    "Después de la reunión, el árbitro explicó la decisión y el público "
+    "aplaudió. Tú también estás invitado a la celebración del próximo sábado.\n"
+)
+
+# Lo que escribiría alguien sin tildes (la ñ se conserva)
+_STRIP_ACCENTS = str.maketrans("áéíóúüÁÉÍÓÚÜ", "aeiouuAEIOUU")
+
+
+# ────────────────────────────────
+# Motor instrumentado
+# ────────────────────────────────
+class ReplayEngine(AutocorrectEngine):
+    """AutocorrectEngine que guarda la latencia exacta de cada trigger."""
+
+    def __init__(self, dictionary_manager, backend):
+        super().__init__(dictionary_manager, backend)
+        self.latencies: List[float] = []
+
+    def process_trigger(self, event=None, word=None, previous=(), received=None, anchor=None):
+        if received is None:
+            received = time.perf_counter()
+        super().process_trigger(event, word, previous, received, anchor)
+        # Latencias exactas, además de los histogramas por buckets del motor
+        self.latencies.append(time.perf_counter() - received)
+
+    async def process_trigger_async(self, event=None, word=None, previous=(), received=None, anchor=None):
+        if received is None:
+            received = time.perf_counter()
+        await super().process_trigger_async(event, word, previous, received, anchor)
+        self.latencies.append(time.perf_counter() - received)
+
+
+# ────────────────────────────────
+# Reproducción
+# ────────────────────────────────
+def strip_accents(text: str) -> str:
+    return text.translate(_STRIP_ACCENTS)
+
+
+def word_accuracy(result: str, expected: str) -> float:
+    """Fracción de palabras de 'expected' que aparecen igual en 'result'."""
+    expected_words = WORD_PATTERN.findall(expected)
+    result_words = WORD_PATTERN.findall(result)
+    if not expected_words:
+        return 1.0
+    matches = sum(1 for a, b in zip(result_words, expected_words) if a == b)
+    return matches / len(expected_words)
+
+
+def percentiles_ms(samples: List[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"p50": None, "p90": None, "p99": None, "max": None, "mean": None}
+    ordered = sorted(samples)
+
+    def pick(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 3)
+
+    return {
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": round(ordered[-1] * 1000, 3),
+        "mean": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+def run(expected: str, wpm: float, wait_scale: float = 1.0,
+        context_enabled: bool = True, drain_timeout: float = 30.0,
+        use_asyncio: bool = False, sees_injected: bool = False) -> Dict:
+    """
+    Escribe 'expected' sin tildes a 'wpm' palabras por minuto (5
+    caracteres por palabra; 0 = sin pausas) y devuelve los resultados.
+    """
+    typed = strip_accents(expected)
+
+    manager = DictionaryManager()
+    manager.context_enabled = context_enabled
+    # Referencia: el mismo texto corregido de una vez, sin teclado
+    reference, _ = manager.correct_text(typed)
+
+    # Las esperas tras Ctrl+C/Ctrl+V, escaladas respecto al backend real
+    # sees_injected: el hook ve también las teclas del motor, como con
+    # el backend system
+    backend = SimulatedBackend(settle_delay=0.05 * wait_scale, sees_injected=sees_injected)
+    keys = backend.key_source
+    engine = ReplayEngine(manager, backend)
+    listener = KeyboardListener(engine, use_asyncio=use_asyncio)
+    engine.activate()
+    listener.start()
+
+    interval = 60.0 / (wpm * 5) if wpm > 0 else 0.0
+    started = time.perf_counter()
+    deadline = started
+
+    for char in typed:
+        # El sistema escribe la tecla en la aplicación y el hook la ve
+        keys.type_char(char)
+
+        if interval:
+            deadline += interval
+            pause = deadline - time.perf_counter()
+            if pause > 0:
+                time.sleep(pause)
+
+    typing_time = time.perf_counter() - started
+
+    # Esperar a que el worker termine lo que quede en cola y aplique las
+    # correcciones aplazadas (tras engine.catch_up_idle sin teclear)
+    wait_until = time.perf_counter() + drain_timeout
+    while time.perf_counter() < wait_until:
+        stats = listener.get_worker_stats()
+        if (stats['processed'] + stats['coalesced'] + stats['dropped'] >= stats['submitted']
+                and not engine.pending_count()):
+            break
+        time.sleep(0.005)
+    listener.stop()
+    elapsed = time.perf_counter() - started
+
+    worker = listener.get_worker_stats()
+    counters = engine.metrics.snapshot()["counters"]
+    words = len(WORD_PATTERN.findall(typed))
+    result = backend.editor.text
+    manager.close()
+
+    return {
+        "config": {
+            "wpm": wpm,
+            "backend": backend.name,
+            "wait_scale": wait_scale,
+            "context_enabled": context_enabled,
+            "engine_core": "asyncio" if use_asyncio else "threads",
+            "sees_injected": sees_injected,
+            "characters": len(typed),
+            "words": words,
+        },
+        "latency_ms": percentiles_ms(engine.latencies),
+        "throughput": {
+            "typing_seconds": round(typing_time, 3),
+            "total_seconds": round(elapsed, 3),
+            "words_per_second": round(words / elapsed, 1) if elapsed else None,
+            "triggers_per_second": round(len(engine.latencies) / elapsed, 1) if elapsed else None,
+        },
+        "triggers": {
+            "submitted": worker['submitted'],
+            "processed": worker['processed'],
+            "coalesced": worker['coalesced'],
+            "dropped": worker['dropped'],
+            "max_queue_depth": worker['max_depth'],
+            "skipped": counters.get("autocorrect_skipped_total", 0),
+            "clipboard_reads": counters.get("autocorrect_clipboard_reads_total", 0),
+            "deferred": counters.get("autocorrect_deferred_total", 0),
+            "catch_ups": counters.get("autocorrect_catch_ups_total", 0),
+            "stale": counters.get("autocorrect_stale_total", 0),
+            "corrections": counters.get("autocorrect_corrections_total", 0),
+            "errors": counters.get("autocorrect_errors_total", 0),
+        },
+        "accuracy": {
+            # Frente al texto original con tildes
+            "expected": round(word_accuracy(result, expected), 4),
+            # Frente a la corrección del mismo texto sin teclado: lo que
+            # se pierde por el camino en tiempo real
+            "reference": round(word_accuracy(result, reference), 4),
+            "reference_expected": round(word_accuracy(reference, expected), 4),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.keystroke_replay",
+        description="Reproduce pulsaciones contra el motor con un editor en memoria."
+    )
+    parser.add_argument("--corpus", help="texto de referencia CON tildes (por defecto, uno de ejemplo)")
+    parser.add_argument("--repeat", type=int, default=1, help="veces que se repite el texto")
+    parser.add_argument("--wpm", type=float, default=100,
+                        help="palabras por minuto (5 caracteres por palabra; 0 = sin pausas)")
+    parser.add_argument("--wait-scale", type=float, default=1.0,
+                        help="escala de las esperas del portapapeles (0 = sin esperas)")
+    parser.add_argument("--no-context", action="store_true", help="desactivar la desambiguación por contexto")
+    parser.add_argument("--sees-injected", action="store_true",
+                        help="el hook ve también las teclas del motor (como el backend system)")
+    parser.add_argument("--asyncio", action="store_true",
+                        help="usar el núcleo asyncio (esperas con timers del bucle)")
+    parser.add_argument("--min-accuracy", type=float, default=0.9,
+                        help="precisión mínima frente a la corrección por lotes; "
+                             "por debajo se avisa y se sale con código 1 (por defecto 0.9)")
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.corpus:
+        try:
+            expected = Path(args.corpus).read_text(encoding="utf-8")
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    else:
+        expected = DEFAULT_CORPUS
+    expected *= max(args.repeat, 1)
+
+    # Los mensajes del motor ("Corregido: ...") van a stderr para no
+    # mezclarse con el JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run(expected, args.wpm, args.wait_scale, not args.no_context,
+                      use_asyncio=args.asyncio, sees_injected=args.sees_injected)
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+    # Lo que se pierde por el camino en tiempo real es un fallo, no un resultado
+    accuracy = results["accuracy"]["reference"]
+    if accuracy < args.min_accuracy:
+        print(f"[Aviso] Precisión frente a la corrección por lotes {accuracy:.4f} "
+              f"< {args.min_accuracy}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# benchmarks/replay_regression.py
+"""
+Regresión de precisión en tiempo real.
+
+Reproduce el texto de ejemplo de keystroke_replay a velocidad de
+escritura real (120 y 240 palabras por minuto, con las esperas del
+portapapeles del backend real), con y sin que el hook vea las teclas del
+motor (como el backend system) y con los dos núcleos. Falla (código de
+salida 1) si lo que queda en el editor se aleja de la corrección por
+lotes del mismo texto:
+
+    python -m benchmarks.replay_regression
+    python -m benchmarks.replay_regression --min-accuracy 0.98
+"""
+
+import argparse
+import contextlib
+import sys
+from typing import List, NamedTuple
+
+from .keystroke_replay import DEFAULT_CORPUS, run
+
+
+class Case(NamedTuple):
+    wpm: float
+    sees_injected: bool
+    use_asyncio: bool
+
+    def __str__(self):
+        return (f"{self.wpm:g} ppm, "
+                f"{'ve' if self.sees_injected else 'no ve'} las teclas del motor, "
+                f"núcleo {'asyncio' if self.use_asyncio else 'threads'}")
+
+
+CASES: List[Case] = [
+    Case(120, sees_injected=False, use_asyncio=False),
+    Case(120, sees_injected=True, use_asyncio=False),
+    Case(240, sees_injected=True, use_asyncio=True),
+    Case(240, sees_injected=False, use_asyncio=True),
+]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.replay_regression",
+        description="Comprueba la precisión de la corrección en tiempo real a velocidad de escritura real."
+    )
+    parser.add_argument("--min-accuracy", type=float, default=0.95,
+                        help="precisión mínima frente a la corrección por lotes (por defecto 0.95)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    failures = 0
+    for case in CASES:
+        # Los mensajes del motor van a stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run(DEFAULT_CORPUS, case.wpm,
+                          use_asyncio=case.use_asyncio, sees_injected=case.sees_injected)
+        accuracy = results["accuracy"]["reference"]
+        triggers = results["triggers"]
+        ok = accuracy >= args.min_accuracy and not triggers["errors"]
+        failures += not ok
+        print(f"[{'OK' if ok else 'FALLO'}] {case}: precisión {accuracy:.4f}, "
+              f"{triggers['clipboard_reads']} lecturas del portapapeles de "
+              f"{triggers['submitted']} triggers, {triggers['errors']} errores")
+
+    if failures:
+        print(f"{failures} de {len(CASES)} casos por debajo de {args.min_accuracy}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -58,6 +58,9 @@ pyinstaller --onefile ^
     --hidden-import=pyautogui ^
     --hidden-import=pystray ^
     --hidden-import=PIL ^
+    --hidden-import=core.backends.system ^
+    --hidden-import=core.backends.simulated ^
+    --hidden-import=core.backends.evdev_backend ^
     --collect-all=PyQt6 ^
     main.py
 
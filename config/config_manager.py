@@ -1,26 +1,93 @@
 # config/config_manager.py
+import atexit
 import json
 import os
 import sys
+import threading
+import time
 import winreg
 from pathlib import Path
+from typing import NamedTuple, Tuple
+
+from core.file_utils import atomic_write_text
+
+
+class Settings(NamedTuple):
+    """
+    Configuración ya validada, de solo lectura. Se carga una vez y se
+    sustituye entera en cada cambio, así que se puede leer desde cualquier
+    hilo sin cerrojos ni acceso a disco: config.values.hotkey
+    """
+    hotkey: str = 'ctrl+shift+a'
+    start_with_windows: bool = False
+    run_in_background: bool = True
+    first_run: bool = True
+    ask_background_on_startup: bool = True
+    context_disambiguation: bool = True
+    input_backend: str = 'system'
+    watch_dictionaries: bool = True
+    language: str = 'es'
+    enabled_languages: Tuple[str, ...] = ('es',)
+    language_hotkey: str = 'ctrl+shift+l'     # '' = sin atajo de idioma
+    language_memory_mb: int = 64
+    engine_core: str = 'threads'
+
+
+# Nombres de core.backends.BACKENDS (sin importar el motor desde aquí)
+INPUT_BACKENDS = ('system', 'evdev', 'simulated')
+
+
+def _is_hotkey(value: str) -> bool:
+    """Teclas no vacías unidas por '+' ('ctrl+shift+a'); cada backend
+    comprueba además que las conoce al registrar el atajo."""
+    return all(part.strip() for part in value.split("+"))
+
+
+# Claves que además deben cumplir una condición
+_CHECKS = {
+    'language_memory_mb': lambda value: value > 0,
+    'engine_core': lambda value: value in ('threads', 'asyncio'),
+    'input_backend': lambda value: value in INPUT_BACKENDS,
+    'hotkey': _is_hotkey,
+    'language_hotkey': _is_hotkey,
+}
+
+# Claves de texto que se pueden dejar vacías (o a null) para desactivarlas
+_OPTIONAL = {'language_hotkey'}
+
 
 class ConfigManager:
-    """Gestiona la configuración de la aplicación"""
+    """
+    Gestiona la configuración de la aplicación.
+    
+    set_setting valida el valor y actualiza la vista en memoria (values);
+    el archivo se escribe en un hilo de fondo, una sola vez por ráfaga de
+    cambios (debounce segundos después del último) y de forma atómica
+    (temporal + rename): un cierre a mitad nunca deja settings.json cortado.
+    """
     
-    def __init__(self):
+    def __init__(self, debounce: float = 0.5):
         self.base_dir = Path(__file__).parent.parent
         self.config_dir = self.base_dir / "config"
         self.config_file = self.config_dir / "settings.json"
+        self.debounce = debounce
         
         self.settings = {}
         self.default_settings = {
-            'hotkey': 'ctrl+shift+a',
-            'start_with_windows': False,
-            'run_in_background': True,
-            'first_run': True,
-            'ask_background_on_startup': True
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in Settings()._asdict().items()
         }
+        self.values = Settings()
+        
+        # Escritura en segundo plano (_write_lock: de una en una y siempre
+        # con el contenido más reciente)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._dirty_since = None     # instante del último cambio sin guardar
+        self._thread = None
+        self._closed = False
+        atexit.register(self.close)
         
         self._ensure_config_file()
         self.load()
@@ -30,50 +97,193 @@ class ConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         if not self.config_file.exists():
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.default_settings, f, ensure_ascii=False, indent=2)
+            atomic_write_text(
+                self.config_file,
+                json.dumps(self.default_settings, ensure_ascii=False, indent=2)
+            )
     
     def load(self):
         """Carga la configuración desde el archivo"""
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.settings = json.load(f)
-            
-            # Asegurar que todas las claves por defecto existan
-            for key, value in self.default_settings.items():
-                if key not in self.settings:
-                    self.settings[key] = value
-            
+                settings = json.load(f)
+            if not isinstance(settings, dict):
+                raise ValueError("el archivo no contiene un objeto JSON")
+        except FileNotFoundError:
+            settings = {}
         except Exception as e:
-            print(f"Error cargando configuración: {e}")
-            self.settings = self.default_settings.copy()
+            print(f"[Error] Cargando configuración: {e}")
+            # Se aparta el archivo dañado en lugar de pisarlo al guardar
+            try:
+                os.replace(self.config_file, self.config_file.with_suffix(".json.corrupt"))
+            except OSError:
+                pass
+            settings = {}
+        
+        # Asegurar que todas las claves por defecto existan y sean válidas
+        for key, value in self.default_settings.items():
+            if key not in settings:
+                settings[key] = value
+            else:
+                valid, settings[key] = self._validate(key, settings[key])
+                if not valid:
+                    print(f"[Aviso] Valor no válido para '{key}' en settings.json, se usa el de por defecto")
+        
+        with self._lock:
+            self.settings = settings
+            self._publish()
     
     def save(self):
-        """Guarda la configuración en el archivo"""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error guardando configuración: {e}")
-            return False
+        """
+        Programa la escritura del archivo (en segundo plano, agrupando los
+        cambios seguidos). Para esperar a que esté en disco: flush()
+        """
+        with self._lock:
+            self._schedule()
+        if self._closed:
+            # Tras close() (cierre de la aplicación) se escribe en el momento
+            return self.flush()
+        return True
+    
+    def flush(self) -> bool:
+        """Escribe ya los cambios pendientes. Returns: False si falló"""
+        with self._write_lock:
+            with self._lock:
+                if self._dirty_since is None:
+                    return True
+                self._dirty_since = None
+                content = json.dumps(self.settings, ensure_ascii=False, indent=2)
+            try:
+                atomic_write_text(self.config_file, content)
+                return True
+            except Exception as e:
+                print(f"[Error] Guardando configuración: {e}")
+                # Sigue pendiente: el hilo de fondo lo reintenta tras la
+                # pausa de siempre (y close() al cerrar)
+                with self._lock:
+                    if self._dirty_since is None:
+                        self._dirty_since = time.monotonic()
+                    self._changed.notify_all()
+                return False
+    
+    def close(self):
+        """Escribe lo pendiente y detiene el hilo de fondo"""
+        if self._closed:
+            return
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+        if self._thread is not None:
+            self._thread.join(5.0)
+            self._thread = None
+        self.flush()
     
     def get_setting(self, key, default=None):
         """Obtiene un valor de configuración"""
         return self.settings.get(key, default)
     
     def set_setting(self, key, value):
-        """Establece un valor de configuración"""
-        self.settings[key] = value
+        """
+        Establece un valor de configuración (validado) y programa su
+        escritura. Returns: False si el valor no es válido
+        """
+        valid, normalized = self._validate(key, value)
+        if not valid:
+            print(f"[Aviso] Valor no válido para '{key}': {value!r}")
+            return False
+        value = normalized
+        
+        with self._lock:
+            if self.settings.get(key) == value:
+                return True
+            self.settings = {**self.settings, key: value}
+            self._publish()
+            self._schedule()
+        if self._closed:
+            self.flush()
+        return True
     
     def is_first_run(self):
         """Verifica si es la primera ejecución"""
-        return self.get_setting('first_run', True)
+        return self.values.first_run
     
     def mark_first_run_complete(self):
         """Marca que la primera ejecución se completó"""
         self.set_setting('first_run', False)
-        self.save()
+        self.flush()
+    
+    # ────────────────────────────────
+    # Validación y escritura
+    # ────────────────────────────────
+    def _validate(self, key, value):
+        """
+        Comprueba el tipo (el de Settings) y las condiciones de una clave.
+        Returns: (es_válido, valor normalizado o el de por defecto si no lo es)
+        Las claves desconocidas se guardan tal cual.
+        """
+        if key not in self.default_settings:
+            return True, value
+        
+        if key in _OPTIONAL and (value is None or (isinstance(value, str) and not value.strip())):
+            return True, ''
+        
+        default = self.default_settings[key]
+        expected = type(default)
+        if expected is list:
+            valid = (isinstance(value, (list, tuple)) and
+                     all(isinstance(v, str) and v.strip() for v in value))
+            if valid:
+                value = [v.strip().lower() for v in value]
+        elif expected is int:
+            valid = isinstance(value, int) and not isinstance(value, bool)
+        elif expected is str:
+            valid = isinstance(value, str) and bool(value.strip())
+            if valid:
+                value = value.strip().lower()
+        else:
+            valid = isinstance(value, expected)
+        
+        if valid and key in _CHECKS:
+            valid = _CHECKS[key](value)
+        return (True, value) if valid else (False, default)
+    
+    def _publish(self):
+        # Vista tipada: una sola asignación (se llama con _lock tomado)
+        fields = {key: self.settings[key] for key in Settings._fields}
+        fields['enabled_languages'] = tuple(fields['enabled_languages'])
+        self.values = Settings(**fields)
+    
+    def _schedule(self):
+        # Se llama con _lock tomado
+        self._dirty_since = time.monotonic()
+        if self._closed:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="SettingsWriter",
+                daemon=True
+            )
+            self._thread.start()
+        self._changed.notify_all()
+    
+    def _run(self):
+        """Hilo de fondo: guarda debounce segundos después del último cambio."""
+        with self._lock:
+            while not self._closed:
+                if self._dirty_since is None:
+                    self._changed.wait()
+                    continue
+                remaining = self._dirty_since + self.debounce - time.monotonic()
+                if remaining > 0:
+                    self._changed.wait(remaining)
+                    continue
+                
+                self._lock.release()
+                try:
+                    self.flush()
+                finally:
+                    self._lock.acquire()
     
     def set_startup(self, enable=True):
         """
@@ -5,8 +5,21 @@
 Módulo core - Lógica principal del autocorrector
 """
 
-from .dictionary_manager import DictionaryManager
-from .autocorrect_engine import AutocorrectEngine
-from .keyboard_listener import KeyboardListener
+import importlib
 
-__all__ = ['DictionaryManager', 'AutocorrectEngine', 'KeyboardListener']
\ No newline at end of file
+__all__ = ['DictionaryManager', 'AutocorrectEngine', 'KeyboardListener']
+
+# Importación diferida: el modo por lotes (python -m core.batch) solo
+# necesita el diccionario, no pyautogui ni keyboard
+_EXPORTS = {
+    'DictionaryManager': '.dictionary_manager',
+    'AutocorrectEngine': '.autocorrect_engine',
+    'KeyboardListener': '.keyboard_listener',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
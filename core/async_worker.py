@@ -0,0 +1,280 @@
+# core/async_worker.py
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from .word_buffer import Anchor
+
+
+class AsyncCorrectionWorker:
+    """
+    Núcleo de corrección sobre un bucle asyncio en un solo hilo.
+
+    Misma interfaz que CorrectionWorker (start, stop, submit, stats). Cada
+    trigger se procesa como una tarea del bucle, en orden; las esperas a
+    la aplicación de destino y la pausa antes de catch_up son timers del
+    bucle en vez de sleeps, así que se pueden cancelar: un trigger nuevo
+    cancela el timer de catch_up y stop() cancela la tarea en curso.
+
+    El hook de teclado vive en otro hilo y entrega los triggers con
+    call_soon_threadsafe. schedule() y call_later() dejan que otras partes
+    (persistencia, IPC) usen el mismo bucle.
+    """
+
+    def __init__(self, engine, max_pending: int = 64):
+        self.engine = engine
+        self.metrics = engine.metrics
+        self.max_pending = max_pending
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.is_running = False
+
+        self._lock = threading.Lock()
+        self._queue: deque = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._catch_up_timer: Optional[asyncio.TimerHandle] = None
+        self._catch_up_due = False
+        self._ready = threading.Event()
+        self._fallback_pending = False
+        self._fallback_anchor: Optional[Anchor] = None
+        self._fallback_previous: Tuple[str, ...] = ()
+        self._stats = {
+            'submitted': 0,
+            'processed': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'max_depth': 0,
+        }
+
+    # -------------------------------
+    # Control del bucle
+    # -------------------------------
+
+    def start(self):
+        """
+        Arranca el hilo con el bucle de eventos. Si el de un stop()
+        anterior sigue vivo lanza RuntimeError: dos bucles sobre la misma
+        cola romperían el orden y se pisarían al inyectar.
+        """
+        if self.is_running:
+            return
+        if self.thread is not None and self.thread.is_alive():
+            raise RuntimeError("El bucle de corrección anterior todavía no ha terminado")
+
+        self.is_running = True
+        self._ready.clear()
+        self.thread = threading.Thread(
+            target=self._run,
+            name="AsyncCorrectionWorker",
+            daemon=True
+        )
+        self.thread.start()
+        self._ready.wait(1.0)
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Detiene el bucle tras vaciar lo que quede en la cola. Si no termina
+        a tiempo ni cancelando la tarea en curso, sigue en self.thread (se
+        puede volver a llamar a stop).
+        """
+        thread = self.thread
+        if thread is None:
+            return
+
+        self.is_running = False
+        loop = self.loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._wake)
+            except RuntimeError:
+                pass
+
+        thread.join(timeout)
+        if thread.is_alive() and loop is not None:
+            # La cola no se vació a tiempo: se cancela la tarea en curso
+            try:
+                loop.call_soon_threadsafe(self._cancel)
+            except RuntimeError:
+                pass
+            thread.join(timeout)
+        if thread.is_alive():
+            print("[Aviso] El bucle de corrección sigue ocupado; terminará al vaciar la cola")
+        else:
+            self.thread = None
+
+    # -------------------------------
+    # Encolado (desde cualquier hilo)
+    # -------------------------------
+
+    def submit(self, event=None, word: Optional[str] = None,
+               previous: Tuple[str, ...] = (), anchor: Optional[Anchor] = None) -> bool:
+        """
+        Encola un trigger. word=None indica que hay que leer la palabra
+        del portapapeles; previous son las palabras anteriores (contexto)
+        y anchor el final de la palabra en el buffer.
+        Returns: True si se encoló (o se fusionó), False si se descartó.
+        """
+        received = time.perf_counter()
+        self.metrics.triggers.inc()
+
+        with self._lock:
+            self._stats['submitted'] += 1
+
+            if word is None:
+                # Se lee la palabra bajo el cursor: vale el último trigger
+                self._fallback_anchor = anchor
+                self._fallback_previous = previous
+                if self._fallback_pending:
+                    self._stats['coalesced'] += 1
+                    self.metrics.coalesced.inc()
+                    return True
+                self._fallback_pending = True
+
+            loop = self.loop
+            if len(self._queue) >= self.max_pending or loop is None or loop.is_closed():
+                if word is None:
+                    self._fallback_pending = False
+                self._stats['dropped'] += 1
+                self.metrics.dropped.inc()
+                print("[Aviso] Cola de corrección llena, trigger descartado")
+                return False
+
+            self._queue.append((event, word, previous, received, anchor))
+            depth = len(self._queue)
+            if depth > self._stats['max_depth']:
+                self._stats['max_depth'] = depth
+
+        try:
+            loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # El bucle se cerró entre medias; stop() ya no lo procesará
+            pass
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Devuelve los contadores del worker y la profundidad actual de la cola."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['depth'] = len(self._queue)
+        return stats
+
+    def schedule(self, coro: Awaitable):
+        """Ejecuta una corrutina en el bucle (desde cualquier hilo).
+        Returns: concurrent.futures.Future con el resultado"""
+        if self.loop is None:
+            raise RuntimeError("El worker asyncio no está en marcha")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_later(self, delay: float, callback: Callable, *args):
+        """Programa 'callback' en el bucle dentro de 'delay' segundos (desde cualquier hilo)."""
+        if self.loop is None:
+            raise RuntimeError("El worker asyncio no está en marcha")
+        self.loop.call_soon_threadsafe(self.loop.call_later, delay, callback, *args)
+
+    # -------------------------------
+    # Bucle principal
+    # -------------------------------
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        try:
+            loop.run_until_complete(self._main())
+        finally:
+            self._cancel_catch_up()
+            with self._lock:
+                self.loop = None
+            loop.close()
+
+    async def _main(self):
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.current_task()
+        self._ready.set()
+        try:
+            while True:
+                with self._lock:
+                    item = self._queue.popleft() if self._queue else None
+                if item is None:
+                    if self._catch_up_due:
+                        self._catch_up_due = False
+                        await self._catch_up()
+                        continue
+                    if not self.is_running:
+                        break
+                    # Si el usuario no paró todavía (o el cerrojo estaba
+                    # ocupado) el timer se vuelve a armar
+                    self._arm_catch_up()
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                # Llega un trigger: la pausa para catch_up vuelve a empezar
+                self._cancel_catch_up()
+                self._catch_up_due = False
+                await self._process(item)
+        except asyncio.CancelledError:
+            pass
+
+    async def _process(self, item):
+        event, word, previous, received, anchor = item
+        if word is None:
+            with self._lock:
+                self._fallback_pending = False
+                anchor = self._fallback_anchor
+                previous = self._fallback_previous
+
+        try:
+            await self.engine.process_trigger_async(event, word, previous, received, anchor)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.metrics.errors.inc()
+            print(f"[Error] En el worker de corrección: {e}")
+        finally:
+            with self._lock:
+                self._stats['processed'] += 1
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    # -------------------------------
+    # Correcciones aplazadas
+    # -------------------------------
+
+    def _arm_catch_up(self):
+        """Programa catch_up para cuando el usuario lleve la pausa necesaria."""
+        self._cancel_catch_up()
+        timeout = self.engine.catch_up_timeout()
+        if timeout is not None:
+            self._catch_up_timer = self.loop.call_later(timeout, self._on_catch_up)
+
+    def _cancel_catch_up(self):
+        if self._catch_up_timer is not None:
+            self._catch_up_timer.cancel()
+            self._catch_up_timer = None
+
+    def _on_catch_up(self):
+        # catch_up puede leer con el portapapeles (con esperas): lo ejecuta
+        # _main, en orden con los triggers
+        self._catch_up_timer = None
+        self._catch_up_due = True
+        self._wake()
+
+    async def _catch_up(self):
+        try:
+            await self.engine.catch_up_async()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.metrics.errors.inc()
+            print(f"[Error] En el worker de corrección: {e}")
@@ -1,25 +1,129 @@
 # core/autocorrect_engine.py
 import re
 import time
-import pyautogui
-import pyperclip
-import threading  # <-- 1. Importamos threading
-from typing import Optional
+import threading
+from typing import Generator, List, NamedTuple, Optional, Tuple, TypeVar
+
+from .backends import Backend, create_backend
+from .metrics import PipelineMetrics
+from .word_buffer import Anchor, WordBuffer
+
+
+def minimal_edit(typed: str, corrected: str) -> Tuple[int, int, str]:
+    """
+    Calcula la edición mínima para pasar de 'typed' a 'corrected'.
+    Returns: (sufijo_comun, caracteres_a_borrar, texto_a_insertar)
+    
+    Ej: 'administracion' → 'administración' = (1, 1, 'ó'): retroceder
+    sobre la 'n', borrar la 'o' y escribir 'ó'.
+    """
+    limit = min(len(typed), len(corrected))
+    
+    prefix = 0
+    while prefix < limit and typed[prefix] == corrected[prefix]:
+        prefix += 1
+    
+    suffix = 0
+    while (suffix < limit - prefix and
+           typed[-1 - suffix] == corrected[-1 - suffix]):
+        suffix += 1
+    
+    return suffix, len(typed) - prefix - suffix, corrected[prefix:len(corrected) - suffix]
+
+
+# ────────────────────────────────
+# Pasos con esperas
+# ────────────────────────────────
+# Lo que tiene que esperar a la aplicación de destino (Ctrl+C antes de
+# leer el portapapeles...) se escribe como un generador que cede los
+# segundos de cada espera. El worker de hilos lo ejecuta durmiendo; el
+# núcleo asyncio, con timers del bucle que se pueden cancelar.
+T = TypeVar("T")
+Steps = Generator[float, None, T]
+
+
+def run_steps(steps: Steps) -> T:
+    """Ejecuta los pasos durmiendo el hilo en cada espera."""
+    try:
+        while True:
+            delay = next(steps)
+            if delay > 0:
+                time.sleep(delay)
+    except StopIteration as stop:
+        return stop.value
+    finally:
+        steps.close()
+
+
+async def run_steps_async(steps: Steps) -> T:
+    """
+    Ejecuta los pasos esperando con asyncio.sleep. Si se cancela la tarea,
+    el generador se cierra y sus finally (fin de la inyección) se ejecutan.
+    """
+    import asyncio
+    try:
+        while True:
+            await asyncio.sleep(next(steps))
+    except StopIteration as stop:
+        return stop.value
+    finally:
+        steps.close()
+
+
+class PendingCorrection(NamedTuple):
+    """
+    Corrección aplazada hasta que el usuario haga una pausa. word=None:
+    la palabra se lee con el portapapeles en la pausa.
+    """
+    word: Optional[str]
+    corrected: Optional[str]
+    anchor: Anchor      # final de la palabra en el texto escrito
+    previous: Tuple[str, ...] = ()     # palabras anteriores (contexto)
+
 
 class AutocorrectEngine:
     """Motor de autocorrección de palabras"""
     
-    def __init__(self, dictionary_manager):
+    def __init__(self, dictionary_manager, backend: Optional[Backend] = None):
         self.dict_manager = dictionary_manager
+        
+        # Origen de las teclas, salida de las correcciones y portapapeles
+        self.backend = backend if backend is not None else create_backend()
         self.is_active = False
         self.last_word = ""
         
-        # 2. Reemplazamos la variable 'correction_in_progress' por un Lock
+        # Una corrección a la vez (automática o manual)
         self.correction_lock = threading.Lock()
         
-        # Configuración de pyautogui
-        pyautogui.PAUSE = 0.01  # Reducir delay entre acciones
-        pyautogui.FAILSAFE = False
+        # Palabra en curso, alimentada por KeyboardListener
+        self.word_buffer = WordBuffer()
+        
+        # Ventana temporal en la que estamos enviando teclas sintéticas.
+        # El listener ignora los eventos que caen dentro para no
+        # confundirlos con lo que escribe el usuario.
+        self._injecting = False
+        self._injection_window = (0.0, 0.0)
+        
+        # Si el hook también ve nuestras teclas (sees_injected), cuántas
+        # hemos enviado que aún no nos ha devuelto: solo las que sobran
+        # son del usuario. Pasado injected_grace segundos del final de la
+        # inyección se dejan de esperar
+        self.injected_grace = 0.5
+        self._expected_keys = 0
+        self._expected_lock = threading.Lock()
+        
+        # Teclas del usuario recibidas mientras inyectábamos
+        self._interleaved = False
+        
+        # Modo de recuperación: si el usuario ya escribió más allá de la
+        # palabra, corregirla ahora movería el cursor mientras teclea. Se
+        # guarda su posición y se corrigen todas juntas en una pausa
+        self.catch_up_idle = 0.4       # segundos sin teclear
+        self.max_pending = 64
+        self._pending: List[PendingCorrection] = []
+        
+        # Contadores e histogramas de latencia de cada etapa
+        self.metrics = PipelineMetrics()
     
     def activate(self):
         """Activa el motor de corrección"""
@@ -34,148 +138,560 @@ class AutocorrectEngine:
         self.is_active = not self.is_active
         return self.is_active
     
+    def is_injected_event(self, event_time: float) -> bool:
+        """
+        Indica si el listener debe ignorar un evento de teclado: lo
+        generamos nosotros o llegó mientras corregíamos.
+        """
+        start, end = self._injection_window
+        if self.backend.key_source.sees_injected:
+            with self._expected_lock:
+                if self._expected_keys:
+                    if event_time <= end + self.injected_grace:
+                        self._expected_keys -= 1
+                        return True
+                    # El hook no devolvió todas nuestras teclas: ya no se
+                    # sabe cuáles de las recibidas eran del usuario
+                    self._expected_keys = 0
+                    self.word_buffer.invalidate()
+                    return False
+        
+        if not (self._injecting or start <= event_time <= end):
+            return False
+        # Tecla del usuario en mitad de la corrección: ha caído donde
+        # estuviera el cursor en ese momento
+        self._interleaved = True
+        if not self._injecting:
+            self.word_buffer.invalidate()
+        return True
+    
+    def _begin_injection(self):
+        self._interleaved = False
+        self._injection_window = (time.time(), float("inf"))
+        self._injecting = True
+    
+    def _end_injection(self):
+        self._injection_window = (self._injection_window[0], time.time())
+        self._injecting = False
+        # Nuestras ediciones ya las anota quien las hace (replace_typed) y
+        # la lectura por portapapeles deja el cursor donde estaba: el
+        # buffer solo deja de cuadrar si el usuario tecleó entre medias
+        if self._interleaved:
+            self.word_buffer.invalidate()
+    
+    def _expect(self, keys: int):
+        """Anota 'keys' pulsaciones sintéticas que el hook nos devolverá."""
+        if keys > 0 and self.backend.key_source.sees_injected:
+            with self._expected_lock:
+                self._expected_keys += keys
+    
+    # ────────────────────────────────
+    # Salida de teclas
+    # ────────────────────────────────
+    def _press(self, key: str, times: int = 1):
+        """Pulsa una tecla varias veces en una sola llamada."""
+        if times > 0:
+            self._expect(times)
+            self.backend.sink.press(key, times)
+    
+    def _type_text(self, text: str):
+        """Escribe un texto de una sola vez."""
+        if text:
+            self._expect(len(text))
+            self.backend.sink.write(text)
+    
+    def _shortcut(self, action):
+        """Envía un atajo del TextSink (Ctrl+C...): una tecla más los modificadores."""
+        self._expect(1)
+        action()
+    
     def get_last_word_from_clipboard(self) -> Optional[str]:
         """
-        Intenta obtener la última palabra usando el portapapeles
+        Intenta obtener la última palabra usando el portapapeles.
+        Solo se usa cuando el buffer de teclado no es válido.
         """
+        result = self._read_word_via_clipboard()
+        return result[0] if result else None
+    
+    def _read_word_via_clipboard(self) -> Optional[Tuple[str, int]]:
+        """
+        Selecciona y copia la palabra anterior al cursor.
+        Returns: (palabra, caracteres entre la palabra y el cursor) o None
+        """
+        return run_steps(self._clipboard_word_steps())
+    
+    def _clipboard_word_steps(self) -> Steps[Optional[Tuple[str, int]]]:
+        """Pasos de _read_word_via_clipboard (ceden las esperas)."""
+        self._begin_injection()
         try:
-            # Guardar contenido actual del portapapeles
-            original_clipboard = pyperclip.paste()
-            
-            # Seleccionar palabra anterior (Ctrl+Shift+Left)
-            pyautogui.hotkey('ctrl', 'shift', 'left')
-            time.sleep(0.05)
-            
-            # Copiar al portapapeles
-            pyautogui.hotkey('ctrl', 'c')
-            time.sleep(0.05)
-            
-            # Obtener palabra
-            word = pyperclip.paste()
-            
-            # Restaurar portapapeles original
-            pyperclip.copy(original_clipboard)
-            
-            # Limpiar palabra
-            word = word.strip()
-            
-            # Verificar que sea una palabra válida
-            if word and re.match(r'^[a-záéíóúüñA-ZÁÉÍÓÚÜÑ]+$', word):
-                return word
-            
-            return None
-            
+            return (yield from self._copy_word_steps())
         except Exception as e:
+            self.metrics.errors.inc()
             print(f"[Error] Obteniendo palabra: {e}")
             return None
+        finally:
+            self._end_injection()
     
-    def correct_word(self, word: str) -> bool:
+    def _copy_word_steps(self, distance: int = 0) -> Steps[Optional[Tuple[str, int]]]:
+        """
+        Selecciona y copia la palabra que acaba 'distance' caracteres a la
+        izquierda del cursor y deja el cursor donde estaba.
+        Returns: (palabra, caracteres entre la palabra y ese punto) o None
+        
+        NOTA: Se llama con la inyección ya empezada (_begin_injection).
+        """
+        sink, clipboard = self.backend.sink, self.backend.clipboard
+        
+        # Guardar contenido actual del portapapeles
+        original_clipboard = clipboard.paste()
+        
+        # Ir al final de la palabra y seleccionarla (Ctrl+Shift+Left)
+        self._press('left', distance)
+        self._shortcut(sink.select_previous_word)
+        yield self.backend.settle_delay
+        
+        # Copiar al portapapeles
+        self._shortcut(sink.copy_selection)
+        yield self.backend.settle_delay
+        
+        # Obtener palabra
+        raw = clipboard.paste()
+        
+        # Deshacer la selección: el cursor vuelve a donde estaba
+        self._press('right')
+        self._press('right', distance)
+        
+        # Restaurar portapapeles original
+        clipboard.copy(original_clipboard)
+        
+        # Limpiar palabra
+        word = raw.strip()
+        
+        # Verificar que sea una palabra válida
+        if word and re.match(r'^[a-záéíóúüñA-ZÁÉÍÓÚÜÑ]+$', word):
+            return word, len(raw) - len(raw.rstrip())
+        
+        return None
+    
+    def correct_word(self, word: str, trailing: int = 1, previous: Tuple[str, ...] = ()) -> bool:
         """
         Corrige una palabra si encuentra coincidencia en el diccionario
         Returns: True si se hizo corrección, False si no
         
+        trailing: caracteres escritos entre el final de la palabra y el
+        cursor (el propio trigger). Solo se reescriben los caracteres que
+        cambian: 'camion ' → ← ← ⌫ 'ó' → →
+        previous: palabras anteriores, para las palabras ambiguas (el/él...)
+        
         NOTA: Esta función asume que self.correction_lock ya ha sido adquirido.
         """
         if not word:
             return False
         
-        corrected = self.dict_manager.get_corrected_word(word)
+        with self.metrics.lookup.time():
+            corrected = self.dict_manager.get_corrected_word(word, previous)
         
         # Si no hay cambio, no hacer nada
         if corrected == word:
             return False
         
+        if not self._inject_edits(len(word) + trailing, [(0, word, corrected)]):
+            return False
+        self._corrected(word, corrected)
+        return True
+    
+    def _corrected(self, word: str, corrected: str):
+        """Anota una corrección ya aplicada (métricas y estadísticas de uso)."""
+        self.last_word = corrected
+        self.metrics.corrections.inc()
         try:
-            # 3. Eliminamos las referencias a 'correction_in_progress'
-            
-            # Seleccionar la palabra nuevamente
-            pyautogui.hotkey('ctrl', 'shift', 'left')
-            time.sleep(0.03)
-            
-            # Escribir palabra corregida
-            pyautogui.write(corrected, interval=0.01)
-            
+            self.dict_manager.record_correction(word)
+        except Exception as e:
+            print(f"[Error] Guardando estadísticas de uso: {e}")
+    
+    def _inject_edits(self, length: int, edits: List[Tuple[int, str, str]]) -> bool:
+        """
+        Aplica varias correcciones en una sola inyección (ver _apply_edits).
+        Returns: False si no se pudo
+        """
+        started = time.perf_counter()
+        self._begin_injection()
+        try:
+            self._apply_edits(length, edits)
             return True
             
         except Exception as e:
+            self.metrics.errors.inc()
             print(f"[Error] Corrigiendo palabra: {e}")
             return False
+        finally:
+            self._end_injection()
+            self.metrics.injection.observe(time.perf_counter() - started)
+    
+    def _apply_edits(self, length: int, edits: List[Tuple[int, str, str]]):
+        """
+        Envía las teclas de varias correcciones (con la inyección ya empezada).
+        
+        length: caracteres entre el inicio de la zona y el cursor
+        edits: (posición, texto escrito, corrección), en orden creciente
+        
+        Se recorren de derecha a izquierda para que las posiciones de las
+        que faltan no cambien; al final el cursor vuelve a su sitio.
+        """
+        caret = length     # posición del cursor en el texto ya editado
+        right = 0          # flechas para volver a la posición original
+        for position, typed, corrected in reversed(edits):
+            suffix, delete, insert = minimal_edit(typed, corrected)
+            
+            # Colocar el cursor justo después de lo que cambia
+            target = position + len(typed) - suffix
+            self._press('left', caret - target)
+            right += caret - target
+            
+            # Borrar solo los caracteres distintos y escribir los nuevos
+            self._press('backspace', delete)
+            self._type_text(insert)
+            caret = target - delete + len(insert)
+        
+        # Volver a la posición original
+        self._press('right', right)
     
-    def process_trigger(self, event=None):
+    # ────────────────────────────────
+    # Triggers
+    # ────────────────────────────────
+    def process_trigger(self, event=None, word: Optional[str] = None,
+                        previous: Tuple[str, ...] = (),
+                        received: Optional[float] = None,
+                        anchor: Optional[Anchor] = None):
         """
         Procesa un trigger (espacio, enter, puntuación)
         Intenta corregir la última palabra escrita
         
-        NOTA: Este método es llamado en un hilo separado por KeyboardListener
+        word: palabra obtenida del buffer de teclado. Si es None se
+        recurre al portapapeles.
+        previous: palabras anteriores según el buffer (contexto)
+        received: instante (time.perf_counter) en que llegó el trigger,
+        para medir la latencia de extremo a extremo
+        anchor: final de la palabra en el buffer (WordEnd.anchor). Con él
+        se sabe si el usuario ya siguió escribiendo; sin él se supone que
+        el cursor está justo detrás del trigger
+        
+        NOTA: Este método es llamado desde el CorrectionWorker, un único
+        hilo que procesa los triggers en orden
         """
         if not self.is_active:
             return
         
-        # 4. Usamos el Lock. Si no se puede adquirir, es porque
-        # ya hay otra corrección en curso, así que salimos.
-        if not self.correction_lock.acquire(blocking=False):
+        if received is None:
+            received = time.perf_counter()
+        
+        # El Lock solo evita solaparse con la corrección
+        # manual; los triggers ya llegan serializados por el worker.
+        self.correction_lock.acquire()
+        
+        try:
+            run_steps(self._trigger_steps(word, previous, received, anchor))
+        finally:
+            self.metrics.trigger_latency.observe(time.perf_counter() - received)
+            self.correction_lock.release()
+    
+    async def process_trigger_async(self, event=None, word: Optional[str] = None,
+                                    previous: Tuple[str, ...] = (),
+                                    received: Optional[float] = None,
+                                    anchor: Optional[Anchor] = None):
+        """
+        process_trigger para el núcleo asyncio (AsyncCorrectionWorker): las
+        esperas son timers del bucle y la tarea se puede cancelar.
+        """
+        if not self.is_active:
             return
         
+        import asyncio
+        if received is None:
+            received = time.perf_counter()
+        
+        # La corrección manual puede tener el Lock: se espera sin bloquear el bucle
+        while not self.correction_lock.acquire(blocking=False):
+            await asyncio.sleep(0.005)
+        
+        try:
+            await run_steps_async(self._trigger_steps(word, previous, received, anchor))
+        finally:
+            self.metrics.trigger_latency.observe(time.perf_counter() - received)
+            self.correction_lock.release()
+    
+    def _trigger_steps(self, word: Optional[str], previous: Tuple[str, ...],
+                       received: float, anchor: Optional[Anchor]) -> Steps[None]:
+        """Pasos de process_trigger, con correction_lock ya adquirido."""
+        metrics = self.metrics
         try:
-            word = self.get_last_word_from_clipboard()
+            started = time.perf_counter()
+            metrics.queue_wait.observe(started - received)
+            
+            if word is not None and anchor is not None:
+                metrics.word_acquire.observe(time.perf_counter() - started)
+                self._correct_buffered(word, previous, anchor)
+                return
+            
+            trailing = 1
+            if word is None:
+                if anchor is not None:
+                    # No se sabe dónde empieza la palabra: se lee con el
+                    # portapapeles en la siguiente pausa. Seleccionarla ahora
+                    # no es seguro: lo que el usuario siga tecleando
+                    # reemplazaría la selección
+                    self._defer(PendingCorrection(None, None, anchor, previous))
+                    return
+                metrics.clipboard_reads.inc()
+                result = yield from self._clipboard_word_steps()
+                if result:
+                    word, trailing = result
+            metrics.word_acquire.observe(time.perf_counter() - started)
             
             if word:
-                corrected = self.correct_word(word)
+                corrected = self.correct_word(word, trailing, previous)
                 if corrected:
-                    print(f"Corregido: {word} → {self.dict_manager.get_corrected_word(word)}")
+                    print(f"Corregido: {word} → {self.last_word}")
+                    if len(self.last_word) != len(word):
+                        # No sabemos dónde empezaba la palabra: las
+                        # posiciones guardadas ya no cuadran
+                        self.word_buffer.invalidate()
             
         except Exception as e:
+            metrics.errors.inc()
             print(f"[Error] En process_trigger: {e}")
+    
+    def _correct_buffered(self, word: str, previous: Tuple[str, ...], anchor: Anchor):
+        """
+        Corrige una palabra del buffer. Si el usuario ya escribió más allá
+        del trigger (o hay correcciones esperando) se aplaza hasta la
+        siguiente pausa en lugar de mover el cursor mientras teclea.
+        """
+        metrics = self.metrics
+        with metrics.lookup.time():
+            corrected = self.dict_manager.get_corrected_word(word, previous)
+        if corrected == word:
+            return
+        
+        typed = self.word_buffer.typed_since(anchor)
+        if typed is None:
+            # El cursor se movió: corregir ahora tocaría otro texto
+            metrics.stale.inc()
+            return
+        
+        if len(typed) > 1:
+            self._defer(PendingCorrection(word, corrected, anchor, previous))
+            return
+        
+        if self._inject_edits(len(word) + len(typed), [(0, word, corrected)]):
+            self.word_buffer.replace_typed(self._word_start(word, anchor), word, corrected)
+            self._corrected(word, corrected)
+            print(f"Corregido: {word} → {corrected}")
+    
+    @staticmethod
+    def _word_start(word: str, anchor: Anchor) -> Anchor:
+        return anchor._replace(position=anchor.position - len(word))
+    
+    def _defer(self, correction: PendingCorrection):
+        """Guarda una corrección para la siguiente pausa."""
+        if len(self._pending) >= self.max_pending:
+            self._pending.pop(0)
+            self.metrics.stale.inc()
+        self._pending.append(correction)
+        self.metrics.deferred.inc()
+    
+    # ────────────────────────────────
+    # Modo de recuperación
+    # ────────────────────────────────
+    def pending_count(self) -> int:
+        """Correcciones aplazadas a la espera de una pausa."""
+        return len(self._pending)
+    
+    def catch_up_timeout(self) -> Optional[float]:
+        """
+        Segundos que puede esperar el worker antes de llamar a catch_up.
+        None si no hay nada pendiente.
+        """
+        if not self._pending:
+            return None
+        return max(self.catch_up_idle - self.word_buffer.idle_time(), 0.01)
+    
+    def catch_up(self) -> bool:
+        """
+        Aplica de una vez las correcciones aplazadas si el usuario lleva
+        catch_up_idle segundos sin teclear. Las palabras cuyo texto ya no
+        coincide (las borró, movió el cursor...) se descartan.
+        Returns: True si se corrigió algo
+        
+        NOTA: Se llama desde el CorrectionWorker cuando la cola está vacía.
+        """
+        if not self._catch_up_ready() or not self.correction_lock.acquire(blocking=False):
+            return False
+        try:
+            return run_steps(self._catch_up_steps())
         finally:
-            # 5. Siempre liberamos el Lock al finalizar
             self.correction_lock.release()
     
+    async def catch_up_async(self) -> bool:
+        """catch_up para el núcleo asyncio: las esperas son timers del bucle."""
+        if not self._catch_up_ready() or not self.correction_lock.acquire(blocking=False):
+            return False
+        try:
+            return await run_steps_async(self._catch_up_steps())
+        finally:
+            self.correction_lock.release()
+    
+    def _catch_up_ready(self) -> bool:
+        if not self._pending:
+            return False
+        if not self.is_active:
+            self._pending.clear()
+            return False
+        return self.word_buffer.idle_time() >= self.catch_up_idle
+    
+    def _catch_up_steps(self) -> Steps[bool]:
+        """Pasos de catch_up, con correction_lock ya adquirido."""
+        metrics = self.metrics
+        pending, self._pending = self._pending, []
+        
+        # Una palabra que hay que leer con el portapapeles abre una
+        # generación nueva del buffer: lo anterior ya no se puede situar
+        head = None
+        for index in range(len(pending) - 1, -1, -1):
+            if pending[index].word is None:
+                head = pending[index]
+                metrics.stale.inc(index)
+                pending = pending[index + 1:]
+                break
+        
+        starts = [self._word_start(p.word, p.anchor) for p in pending]
+        start = head.anchor if head is not None else starts[0]
+        snapshot = self.word_buffer.offsets_since(start, starts)
+        if snapshot is None:
+            metrics.stale.inc(len(pending) + (head is not None))
+            return False
+        
+        text, offsets = snapshot
+        edits, end = [], 0
+        for correction, position in zip(pending, offsets):
+            word = correction.word
+            if position is None or position < end or text[position:position + len(word)] != word:
+                metrics.stale.inc()
+                continue
+            edits.append((position, word, correction.corrected))
+            end = position + len(word)
+        
+        if head is None and not edits:
+            return False
+        
+        # Todo en una sola inyección: leer la palabra de cabeza (si la hay)
+        # y aplicar las correcciones
+        read = None
+        started = time.perf_counter()
+        self._begin_injection()
+        try:
+            length, injected = len(text), edits
+            if head is not None:
+                metrics.clipboard_reads.inc()
+                result = yield from self._copy_word_steps(len(text))
+                if self._interleaved:
+                    # El usuario volvió a teclear: la selección ya no es fiable
+                    metrics.stale.inc(len(edits) + 1)
+                    return False
+                if result:
+                    word = result[0]
+                    with metrics.lookup.time():
+                        corrected = self.dict_manager.get_corrected_word(word, head.previous)
+                    if corrected != word:
+                        read = (word, corrected)
+                        length += len(word)
+                        injected = [(0, word, corrected)] + [
+                            (position + len(word), typed, fixed) for position, typed, fixed in edits
+                        ]
+            if not injected:
+                return False
+            self._apply_edits(length, injected)
+            
+        except Exception as e:
+            metrics.errors.inc()
+            print(f"[Error] En catch_up: {e}")
+            return False
+        finally:
+            self._end_injection()
+            metrics.injection.observe(time.perf_counter() - started)
+        
+        # Anotar en el buffer lo que ha cambiado
+        if read is not None:
+            word, corrected = read
+            if (not self.word_buffer.replace_typed(self._word_start(word, start), word, corrected)
+                    and len(corrected) != len(word)):
+                # La palabra empieza antes de lo que guarda el buffer: no
+                # se sabe cuánto se desplaza lo que va detrás
+                self.word_buffer.invalidate()
+            edits.insert(0, (None, word, corrected))
+        if len(edits) > (read is not None):
+            new_text, last = [], 0
+            for position, word, corrected in edits:
+                if position is None:
+                    continue
+                new_text += [text[last:position], corrected]
+                last = position + len(word)
+            new_text.append(text[last:])
+            self.word_buffer.replace_typed(start, text, "".join(new_text))
+        
+        for _, word, corrected in edits:
+            self._corrected(word, corrected)
+        metrics.catch_ups.inc()
+        print("Corregido en pausa: " + ", ".join(f"{w} → {c}" for _, w, c in edits))
+        return True
+    
     def manual_correct_selection(self):
         """
         Corrige la selección actual manualmente
         Útil para corregir texto ya escrito
         """
         
-        # 6. Usamos el Lock también para la corrección manual
         if not self.correction_lock.acquire(blocking=False):
             print("Corrección manual omitida, autocorrección en progreso.")
             return
         
+        sink, clipboard = self.backend.sink, self.backend.clipboard
+        
+        self._begin_injection()
         try:
-            # 7. Eliminamos las referencias a 'correction_in_progress'
-            
             # Guardar clipboard original
-            original_clipboard = pyperclip.paste()
+            original_clipboard = clipboard.paste()
             
             # Copiar selección
-            pyautogui.hotkey('ctrl', 'c')
-            time.sleep(0.05)
+            self._shortcut(sink.copy_selection)
+            self.backend.settle()
             
-            selected_text = pyperclip.paste()
+            selected_text = clipboard.paste()
             if not selected_text:
                 return
             
-            words = re.findall(r'[a-záéíóúüñA-ZÁÉÍÓÚÜÑ]+', selected_text)
-            corrected_text = selected_text
-            
-            for word in words:
-                corrected = self.dict_manager.get_corrected_word(word)
-                if corrected != word:
-                    # Usamos una forma más segura de reemplazar para evitar
-                    # reemplazar sub-palabras accidentalmente.
-                    # Esto asume que las palabras están separadas por espacios
-                    # o signos, lo cual es razonable.
-                    corrected_text = corrected_text.replace(word, corrected)
+            # Una sola pasada sobre el texto; solo se cambian palabras completas
+            corrected_text, spans = self.dict_manager.correct_text(selected_text)
             
-            # Si hubo cambios, reemplazar
-            if corrected_text != selected_text:
-                pyautogui.write(corrected_text, interval=0.01)
+            # Si hubo cambios, reemplazar la selección pegando el resultado
+            # (escribirlo tecla a tecla sería muy lento en textos largos)
+            if spans:
+                clipboard.copy(corrected_text)
+                self._shortcut(sink.paste)
+                self.backend.settle()
+                for span in spans:
+                    self.dict_manager.record_correction(span.original)
+                print(f"Corrección manual: {len(spans)} palabras corregidas")
             
             # Restaurar clipboard
-            pyperclip.copy(original_clipboard)
+            clipboard.copy(original_clipboard)
             
         except Exception as e:
+            self.metrics.errors.inc()
             print(f"[Error] En corrección manual: {e}")
         finally:
-            # 8. Siempre liberamos el Lock al finalizar
+            self._end_injection()
+            # El texto pegado puede cambiar de longitud: las posiciones
+            # guardadas ya no sirven
+            self.word_buffer.invalidate()
             self.correction_lock.release()
\ No newline at end of file
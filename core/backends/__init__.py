@@ -0,0 +1,54 @@
+# ============================================================================
+# core/backends/__init__.py
+# ============================================================================
+"""
+Backends de entrada/salida: de dónde llegan las pulsaciones del usuario
+y cómo se envían las correcciones.
+
+    system     keyboard + pyautogui + pyperclip (Windows, por defecto)
+    evdev      /dev/input + uinput (Linux, X11 y Wayland)
+    simulated  editor en memoria (benchmarks, ejecución sin pantalla)
+"""
+
+import importlib
+from typing import List
+
+from .base import KEY_DOWN, KEY_UP, Backend, Clipboard, KeyEvent, KeySource, TextSink, is_valid_hotkey
+
+__all__ = [
+    'Backend', 'KeySource', 'TextSink', 'Clipboard', 'KeyEvent',
+    'KEY_DOWN', 'KEY_UP', 'BACKENDS', 'create_backend', 'available_backends',
+    'is_valid_hotkey',
+]
+
+DEFAULT_BACKEND = 'system'
+
+# Cada backend se importa solo cuando se usa: sus dependencias son opcionales
+BACKENDS = {
+    'system': ('.system', 'SystemBackend'),
+    'evdev': ('.evdev_backend', 'EvdevBackend'),
+    'simulated': ('.simulated', 'SimulatedBackend'),
+}
+
+
+def create_backend(name: str = DEFAULT_BACKEND, **options) -> Backend:
+    """Crea el backend 'name' ('system', 'evdev' o 'simulated')."""
+    if name not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {name!r} (disponibles: {', '.join(BACKENDS)})")
+    module_name, class_name = BACKENDS[name]
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)(**options)
+
+
+def available_backends() -> List[str]:
+    """Backends cuyas dependencias se pueden importar en este sistema."""
+    available = []
+    for name, (module_name, _) in BACKENDS.items():
+        try:
+            module = importlib.import_module(module_name, __name__)
+        except Exception:
+            continue
+        if name == 'evdev' and module.evdev is None:
+            continue
+        available.append(name)
+    return available
\ No newline at end of file
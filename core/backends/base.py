@@ -0,0 +1,139 @@
+# core/backends/base.py
+
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+KEY_DOWN = "down"
+KEY_UP = "up"
+
+
+class KeyEvent:
+    """
+    Evento de teclado independiente del backend. Tiene los mismos campos
+    que los eventos de la librería keyboard que usa KeyboardListener.
+
+    time: segundos de time.time() en que se produjo la pulsación.
+    """
+
+    __slots__ = ("name", "event_type", "time", "scan_code")
+
+    def __init__(self, name: str, event_type: str = KEY_DOWN,
+                 event_time: Optional[float] = None, scan_code: int = 0):
+        self.name = name
+        self.event_type = event_type
+        self.time = time.time() if event_time is None else event_time
+        self.scan_code = scan_code
+
+    def __repr__(self):
+        return f"KeyEvent({self.name!r}, {self.event_type!r})"
+
+
+def is_valid_hotkey(hotkey: str) -> bool:
+    """Comprobación común a todos los backends: teclas no vacías unidas por '+'."""
+    return bool(hotkey) and all(part.strip() for part in hotkey.split("+"))
+
+
+class KeySource(ABC):
+    """
+    Origen de las pulsaciones del usuario (hook global de teclado).
+
+    sees_injected: el hook también recibe las teclas que envía el TextSink.
+    Si no las ve, toda tecla recibida mientras se corrige es del usuario.
+    """
+
+    sees_injected = True
+
+    @abstractmethod
+    def start(self, on_key: Callable, on_click: Optional[Callable] = None):
+        """
+        Empieza a entregar eventos: on_key(evento) por cada pulsación y
+        on_click() por cada clic (si el backend puede verlos).
+        """
+
+    @abstractmethod
+    def stop(self):
+        """Deja de entregar eventos."""
+
+    @abstractmethod
+    def add_hotkey(self, hotkey: str, callback: Callable):
+        """Registra un atajo global ('ctrl+shift+a')."""
+
+    @abstractmethod
+    def remove_hotkey(self, hotkey: str):
+        """Elimina un atajo registrado con add_hotkey."""
+
+    def is_valid_hotkey(self, hotkey: str) -> bool:
+        """Indica si el backend entiende la combinación de teclas."""
+        return is_valid_hotkey(hotkey)
+
+
+class TextSink(ABC):
+    """Destino de las teclas sintéticas con las que se corrige el texto."""
+
+    @abstractmethod
+    def press(self, key: str, times: int = 1):
+        """Pulsa una tecla ('left', 'backspace'...) varias veces."""
+
+    @abstractmethod
+    def hotkey(self, *keys: str):
+        """Pulsa una combinación de teclas."""
+
+    @abstractmethod
+    def write(self, text: str):
+        """Escribe un texto (puede contener vocales con tilde)."""
+
+    # Atajos de edición: los backends los cambian si su plataforma usa otros
+    def select_previous_word(self):
+        self.hotkey("ctrl", "shift", "left")
+
+    def copy_selection(self):
+        self.hotkey("ctrl", "c")
+
+    def paste(self):
+        self.hotkey("ctrl", "v")
+
+
+class Clipboard(ABC):
+    """Portapapeles del sistema."""
+
+    @abstractmethod
+    def paste(self) -> str:
+        """Devuelve el texto del portapapeles."""
+
+    @abstractmethod
+    def copy(self, text: str):
+        """Pone un texto en el portapapeles."""
+
+
+class Backend:
+    """
+    Conjunto de origen de teclas, destino de teclas y portapapeles que
+    usan KeyboardListener y AutocorrectEngine.
+
+    settle_delay: segundos que hay que esperar tras un atajo para que la
+    aplicación de destino lo procese (p. ej. antes de leer el portapapeles
+    después de Ctrl+C).
+    """
+
+    name = "base"
+
+    def __init__(self, key_source: KeySource, sink: TextSink,
+                 clipboard: Clipboard, settle_delay: float = 0.05):
+        self.key_source = key_source
+        self.sink = sink
+        self.clipboard = clipboard
+        self.settle_delay = settle_delay
+
+    def settle(self, factor: float = 1.0):
+        """Espera a que la aplicación de destino procese lo enviado."""
+        delay = self.settle_delay * factor
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self):
+        """Libera los recursos del backend (dispositivos, hilos...)."""
+        self.key_source.stop()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r}>"
@@ -0,0 +1,18 @@
+# core/backends/clipboard.py
+
+from .base import Clipboard
+
+
+class PyperclipClipboard(Clipboard):
+    """
+    Portapapeles con pyperclip (Windows, macOS, X11 y Wayland). Se importa
+    al usarlo por primera vez.
+    """
+
+    def paste(self) -> str:
+        import pyperclip
+        return pyperclip.paste()
+
+    def copy(self, text: str):
+        import pyperclip
+        pyperclip.copy(text)
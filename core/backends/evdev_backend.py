@@ -0,0 +1,357 @@
+# core/backends/evdev_backend.py
+"""
+Backend para Linux sobre evdev/uinput.
+
+Lee las pulsaciones directamente de /dev/input (funciona igual en X11,
+Wayland y consola) y escribe las correcciones con un teclado virtual de
+uinput. Necesita el paquete 'evdev' y permisos sobre /dev/input y
+/dev/uinput (normalmente, pertenecer al grupo 'input').
+
+Limitaciones: los nombres de tecla siguen la distribución US; los
+caracteres sin tecla propia (vocales con tilde) se escriben con la
+entrada Unicode de GTK/IBus (Ctrl+Shift+U, código, espacio).
+"""
+
+import os
+import select
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import evdev
+    from evdev import ecodes
+except ImportError:
+    evdev = None
+    ecodes = None
+
+from .base import KEY_DOWN, KEY_UP, Backend, KeyEvent, KeySource, TextSink
+from .clipboard import PyperclipClipboard
+
+UINPUT_NAME = "autocorrector-uinput"
+
+# Teclas con nombre, como las llama la librería keyboard
+_NAMED_KEYS = {
+    "KEY_SPACE": "space", "KEY_ENTER": "enter", "KEY_KPENTER": "enter",
+    "KEY_TAB": "tab", "KEY_BACKSPACE": "backspace", "KEY_DELETE": "delete",
+    "KEY_ESC": "esc", "KEY_INSERT": "insert",
+    "KEY_LEFT": "left", "KEY_RIGHT": "right", "KEY_UP": "up", "KEY_DOWN": "down",
+    "KEY_HOME": "home", "KEY_END": "end",
+    "KEY_PAGEUP": "page up", "KEY_PAGEDOWN": "page down",
+    "KEY_LEFTSHIFT": "left shift", "KEY_RIGHTSHIFT": "right shift",
+    "KEY_CAPSLOCK": "caps lock",
+    "KEY_LEFTCTRL": "left ctrl", "KEY_RIGHTCTRL": "right ctrl",
+    "KEY_LEFTALT": "left alt", "KEY_RIGHTALT": "alt gr",
+    "KEY_LEFTMETA": "left windows", "KEY_RIGHTMETA": "right windows",
+}
+
+# Teclas que escriben un carácter: (sin mayúsculas, con mayúsculas)
+_CHAR_KEYS = {
+    "KEY_1": ("1", "!"), "KEY_2": ("2", "@"), "KEY_3": ("3", "#"),
+    "KEY_4": ("4", "$"), "KEY_5": ("5", "%"), "KEY_6": ("6", "^"),
+    "KEY_7": ("7", "&"), "KEY_8": ("8", "*"), "KEY_9": ("9", "("),
+    "KEY_0": ("0", ")"),
+    "KEY_DOT": (".", ">"), "KEY_COMMA": (",", "<"),
+    "KEY_SEMICOLON": (";", ":"), "KEY_SLASH": ("/", "?"),
+    "KEY_APOSTROPHE": ("'", '"'), "KEY_MINUS": ("-", "_"),
+    "KEY_EQUAL": ("=", "+"), "KEY_LEFTBRACE": ("[", "{"),
+    "KEY_RIGHTBRACE": ("]", "}"), "KEY_BACKSLASH": ("\\", "|"),
+    "KEY_GRAVE": ("`", "~"),
+}
+
+# Nombres genéricos de modificadores, para los atajos
+_MODIFIER_ALIASES = {
+    "left shift": "shift", "right shift": "shift",
+    "left ctrl": "ctrl", "right ctrl": "ctrl",
+    "left alt": "alt", "alt gr": "alt",
+    "left windows": "windows", "right windows": "windows",
+}
+
+
+def _require_evdev():
+    if evdev is None:
+        raise RuntimeError("El backend evdev necesita el paquete 'evdev' (pip install evdev)")
+
+
+class _Keymap:
+    """Traducción entre códigos de evdev y nombres de tecla."""
+
+    def __init__(self):
+        _require_evdev()
+        self.names: Dict[int, str] = {}
+        self.chars: Dict[int, Tuple[str, str]] = {}
+
+        for letter in "abcdefghijklmnopqrstuvwxyz":
+            self.chars[ecodes.ecodes[f"KEY_{letter.upper()}"]] = (letter, letter.upper())
+        for key, pair in _CHAR_KEYS.items():
+            self.chars[ecodes.ecodes[key]] = pair
+        for key, name in _NAMED_KEYS.items():
+            self.names[ecodes.ecodes[key]] = name
+
+        # Para escribir: nombre o carácter → (código, con mayúsculas)
+        self.codes: Dict[str, Tuple[int, bool]] = {}
+        for code, (plain, shifted) in self.chars.items():
+            self.codes[plain] = (code, False)
+            self.codes[shifted] = (code, True)
+        for code, name in self.names.items():
+            self.codes.setdefault(name, (code, False))
+        self.codes.update({
+            " ": (ecodes.KEY_SPACE, False), "\n": (ecodes.KEY_ENTER, False),
+            "\t": (ecodes.KEY_TAB, False),
+            "shift": (ecodes.KEY_LEFTSHIFT, False), "ctrl": (ecodes.KEY_LEFTCTRL, False),
+            "alt": (ecodes.KEY_LEFTALT, False), "windows": (ecodes.KEY_LEFTMETA, False),
+        })
+
+    def name(self, code: int, shift: bool) -> Optional[str]:
+        if code in self.chars:
+            return self.chars[code][1 if shift else 0]
+        return self.names.get(code)
+
+
+def _parse_hotkey(hotkey: str) -> Tuple[FrozenSet[str], str]:
+    parts = [p.strip().lower() for p in hotkey.split("+")]
+    if not parts or not all(parts):
+        raise ValueError(f"Atajo no válido: {hotkey!r}")
+    modifiers = frozenset(_MODIFIER_ALIASES.get(p, p) for p in parts[:-1])
+    return modifiers, parts[-1]
+
+
+class EvdevKeySource(KeySource):
+    """Lee teclados (y ratones, para los clics) de /dev/input en un hilo."""
+
+    # El teclado virtual de UInputSink no se lee
+    sees_injected = False
+
+    def __init__(self, device_paths: Optional[List[str]] = None):
+        self.device_paths = device_paths
+        self._keymap: Optional[_Keymap] = None
+        self._devices = []
+        self._hotkeys: Dict[Tuple[FrozenSet[str], str], Callable] = {}
+        self._pressed = set()
+        self._caps_lock = False
+        self._thread: Optional[threading.Thread] = None
+        self._wake = None
+        self._on_key: Optional[Callable] = None
+        self._on_click: Optional[Callable] = None
+
+    def start(self, on_key: Callable, on_click: Optional[Callable] = None):
+        if self._thread is not None:
+            return
+        _require_evdev()
+        self._keymap = self._keymap or _Keymap()
+        self._on_key = on_key
+        self._on_click = on_click
+        self._devices = self._open_devices()
+        if not self._devices:
+            raise RuntimeError("No hay teclados accesibles en /dev/input (¿falta el grupo 'input'?)")
+
+        self._wake = os.pipe()
+        self._thread = threading.Thread(target=self._run, name="EvdevKeySource", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        os.write(self._wake[1], b"x")
+        self._thread.join(1.0)
+        self._thread = None
+        for fd in self._wake:
+            os.close(fd)
+        self._wake = None
+        for device in self._devices:
+            try:
+                device.close()
+            except OSError:
+                pass
+        self._devices = []
+        self._pressed.clear()
+
+    def add_hotkey(self, hotkey: str, callback: Callable):
+        self._hotkeys[_parse_hotkey(hotkey)] = callback
+
+    def remove_hotkey(self, hotkey: str):
+        self._hotkeys.pop(_parse_hotkey(hotkey), None)
+
+    def is_valid_hotkey(self, hotkey: str) -> bool:
+        try:
+            _parse_hotkey(hotkey)
+            return True
+        except ValueError:
+            return False
+
+    # ────────────────────────────────
+    # Lectura
+    # ────────────────────────────────
+    def _open_devices(self):
+        paths = self.device_paths if self.device_paths is not None else evdev.list_devices()
+        devices = []
+        for path in paths:
+            try:
+                device = evdev.InputDevice(path)
+            except OSError:
+                continue
+            keys = device.capabilities().get(ecodes.EV_KEY, [])
+            # Nuestro teclado virtual no cuenta: sus teclas son inyectadas
+            if device.name != UINPUT_NAME and (ecodes.KEY_A in keys or ecodes.BTN_LEFT in keys):
+                devices.append(device)
+            else:
+                device.close()
+        return devices
+
+    def _run(self):
+        by_fd = {device.fd: device for device in self._devices}
+        wake_fd = self._wake[0]
+        while True:
+            try:
+                ready, _, _ = select.select(list(by_fd) + [wake_fd], [], [])
+            except OSError:
+                break
+            if wake_fd in ready:
+                break
+            for fd in ready:
+                device = by_fd[fd]
+                try:
+                    for event in device.read():
+                        if event.type == ecodes.EV_KEY:
+                            self._handle(event)
+                except BlockingIOError:
+                    pass
+                except OSError:
+                    # Dispositivo desconectado
+                    del by_fd[fd]
+            if not by_fd:
+                break
+
+    def _handle(self, event):
+        code, value = event.code, event.value
+        if code in (ecodes.BTN_LEFT, ecodes.BTN_RIGHT, ecodes.BTN_MIDDLE):
+            if value == 1 and self._on_click is not None:
+                self._on_click()
+            return
+
+        shift = bool(self._pressed & {"left shift", "right shift"})
+        if self._caps_lock and code in self._keymap.chars and self._keymap.chars[code][0].isalpha():
+            shift = not shift
+        name = self._keymap.name(code, shift)
+        if name is None:
+            name = f"unknown {code}"
+
+        # value: 1 = pulsada, 2 = autorrepetición, 0 = soltada
+        event_type = KEY_UP if value == 0 else KEY_DOWN
+        if event_type == KEY_DOWN:
+            if name == "caps lock" and value == 1:
+                self._caps_lock = not self._caps_lock
+            self._pressed.add(name)
+        else:
+            self._pressed.discard(name)
+
+        if self._on_key is not None:
+            self._on_key(KeyEvent(name, event_type, event.timestamp(), code))
+
+        if event_type == KEY_DOWN and value == 1:
+            self._check_hotkeys(name)
+
+    def _check_hotkeys(self, name: str):
+        modifiers = {_MODIFIER_ALIASES.get(k, k) for k in self._pressed} - {name.lower()}
+        for (required, key), callback in list(self._hotkeys.items()):
+            if key == name.lower() and required <= modifiers:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error en atajo de teclado: {e}")
+
+
+class UInputSink(TextSink):
+    """Teclado virtual de uinput."""
+
+    def __init__(self):
+        self._keymap: Optional[_Keymap] = None
+        self._device = None
+        self._lock = threading.Lock()
+
+    def _ui(self):
+        if self._device is None:
+            _require_evdev()
+            self._keymap = _Keymap()
+            self._device = evdev.UInput(name=UINPUT_NAME)
+            # El entorno gráfico tarda un poco en reconocer el dispositivo nuevo
+            time.sleep(0.2)
+        return self._device
+
+    def _code(self, key: str) -> Tuple[int, bool]:
+        self._ui()
+        code = self._keymap.codes.get(key) or self._keymap.codes.get(key.lower())
+        if code is None:
+            raise ValueError(f"Tecla no soportada por uinput: {key!r}")
+        return code
+
+    def _tap(self, code: int, shift: bool = False):
+        ui = self._ui()
+        if shift:
+            ui.write(ecodes.EV_KEY, ecodes.KEY_LEFTSHIFT, 1)
+        ui.write(ecodes.EV_KEY, code, 1)
+        ui.write(ecodes.EV_KEY, code, 0)
+        if shift:
+            ui.write(ecodes.EV_KEY, ecodes.KEY_LEFTSHIFT, 0)
+        ui.syn()
+
+    def press(self, key: str, times: int = 1):
+        if times <= 0:
+            return
+        code, shift = self._code(key)
+        with self._lock:
+            for _ in range(times):
+                self._tap(code, shift)
+
+    def hotkey(self, *keys: str):
+        codes = [self._code(key)[0] for key in keys]
+        with self._lock:
+            ui = self._ui()
+            for code in codes:
+                ui.write(ecodes.EV_KEY, code, 1)
+            ui.syn()
+            for code in reversed(codes):
+                ui.write(ecodes.EV_KEY, code, 0)
+            ui.syn()
+
+    def write(self, text: str):
+        with self._lock:
+            for char in text:
+                self._ui()
+                code = self._keymap.codes.get(char)
+                if code is not None:
+                    self._tap(*code)
+                else:
+                    self._write_unicode(char)
+
+    def _write_unicode(self, char: str):
+        # Entrada Unicode de GTK/IBus: Ctrl+Shift+U, código en hexadecimal, espacio
+        ui = self._ui()
+        for code in (ecodes.KEY_LEFTCTRL, ecodes.KEY_LEFTSHIFT, ecodes.KEY_U):
+            ui.write(ecodes.EV_KEY, code, 1)
+        for code in (ecodes.KEY_U, ecodes.KEY_LEFTSHIFT, ecodes.KEY_LEFTCTRL):
+            ui.write(ecodes.EV_KEY, code, 0)
+        ui.syn()
+        for digit in f"{ord(char):x}":
+            self._tap(self._keymap.codes[digit][0])
+        self._tap(ecodes.KEY_SPACE)
+
+    def close(self):
+        if self._device is not None:
+            self._device.close()
+            self._device = None
+
+
+class EvdevBackend(Backend):
+    """Backend de Linux: evdev para leer, uinput para escribir."""
+
+    name = "evdev"
+
+    def __init__(self, device_paths: Optional[List[str]] = None):
+        _require_evdev()
+        super().__init__(EvdevKeySource(device_paths), UInputSink(),
+                         PyperclipClipboard(), settle_delay=0.05)
+
+    def close(self):
+        super().close()
+        self.sink.close()
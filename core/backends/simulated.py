@@ -0,0 +1,217 @@
+# core/backends/simulated.py
+
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .base import KEY_DOWN, KEY_UP, Backend, Clipboard, KeyEvent, KeySource, TextSink
+
+# Nombre que da la librería keyboard a cada carácter especial
+KEY_NAMES = {" ": "space", "\n": "enter", "\t": "tab"}
+_KEY_CHARS = {name: char for char, name in KEY_NAMES.items()}
+
+
+class SimulatedEditor(TextSink, Clipboard):
+    """
+    Caja de texto en memoria: cursor, selección y portapapeles. Entiende
+    las teclas que envía el motor (flechas, retroceso, Ctrl+Shift+Izquierda,
+    Ctrl+C, Ctrl+V), así que hace a la vez de destino de teclas y de
+    portapapeles.
+    """
+
+    def __init__(self, text: str = ""):
+        self._chars: List[str] = list(text)
+        self.caret = len(self._chars)
+        self.anchor: Optional[int] = None   # extremo fijo de la selección
+        self.clipboard = ""
+        # Si no es None, recibe las teclas que envía el motor (como el hook
+        # del sistema, que también las ve): echo(['ctrl', 'c'])
+        self.echo: Optional[Callable[[Sequence[str]], None]] = None
+        # Reentrante: SimulatedKeySource lo toma para que escribir una tecla
+        # y entregarla al listener sea un solo paso
+        self._lock = threading.RLock()
+
+    @property
+    def text(self) -> str:
+        with self._lock:
+            return "".join(self._chars)
+
+    # ────────────────────────────────
+    # TextSink
+    # ────────────────────────────────
+    def press(self, key: str, times: int = 1):
+        with self._lock:
+            for _ in range(times):
+                self._press(key)
+                self._echo((key,))
+
+    def hotkey(self, *keys: str):
+        with self._lock:
+            self._echo(keys)
+            combo = tuple(k.lower() for k in keys)
+            if combo == ("ctrl", "shift", "left"):
+                if self.anchor is None:
+                    self.anchor = self.caret
+                self.caret = self._previous_word_start(self.caret)
+            elif combo == ("ctrl", "c"):
+                start, end = self._selection()
+                if start != end:
+                    self.clipboard = "".join(self._chars[start:end])
+            elif combo == ("ctrl", "v"):
+                self._insert(self.clipboard)
+
+    def write(self, text: str):
+        with self._lock:
+            for char in text:
+                self._insert(char)
+                self._echo((KEY_NAMES.get(char, char),))
+
+    # ────────────────────────────────
+    # Clipboard
+    # ────────────────────────────────
+    def paste(self) -> str:
+        return self.clipboard
+
+    def copy(self, text: str):
+        self.clipboard = text
+
+    # ────────────────────────────────
+    # Edición
+    # ────────────────────────────────
+    def _echo(self, keys: Sequence[str]):
+        if self.echo is not None:
+            self.echo(keys)
+
+    def _insert(self, text: str):
+        self._delete_selection()
+        self._chars[self.caret:self.caret] = text
+        self.caret += len(text)
+
+    def _press(self, key: str):
+        if len(key) == 1 or key in _KEY_CHARS:
+            self._insert(_KEY_CHARS.get(key, key))
+        elif key == "left":
+            if self.anchor is not None:
+                self.caret = self._selection()[0]
+                self.anchor = None
+            elif self.caret > 0:
+                self.caret -= 1
+        elif key == "right":
+            if self.anchor is not None:
+                self.caret = self._selection()[1]
+                self.anchor = None
+            elif self.caret < len(self._chars):
+                self.caret += 1
+        elif key == "backspace":
+            if not self._delete_selection() and self.caret > 0:
+                self.caret -= 1
+                del self._chars[self.caret]
+
+    def _selection(self):
+        if self.anchor is None:
+            return self.caret, self.caret
+        return min(self.anchor, self.caret), max(self.anchor, self.caret)
+
+    def _delete_selection(self) -> bool:
+        start, end = self._selection()
+        self.anchor = None
+        if start == end:
+            return False
+        del self._chars[start:end]
+        self.caret = start
+        return True
+
+    def _previous_word_start(self, position: int) -> int:
+        # Como en Windows: salta los espacios y luego la palabra (o un
+        # único signo de puntuación)
+        while position > 0 and self._chars[position - 1].isspace():
+            position -= 1
+        if position > 0 and not self._chars[position - 1].isalnum():
+            return position - 1
+        while position > 0 and self._chars[position - 1].isalnum():
+            position -= 1
+        return position
+
+
+class SimulatedKeySource(KeySource):
+    """
+    Origen de teclas controlado desde el código: cada tecla se escribe en
+    el editor (como haría el sistema) y luego se entrega al listener.
+    """
+
+    def __init__(self, editor: SimulatedEditor, sees_injected: bool = False):
+        self.editor = editor
+        self.hotkeys: Dict[str, Callable] = {}
+        self._on_key: Optional[Callable] = None
+        self._on_click: Optional[Callable] = None
+
+        # Por defecto las teclas del motor van directas al editor, sin
+        # pasar por aquí; con sees_injected se entregan también al
+        # listener, como hace el backend system
+        self.sees_injected = sees_injected
+        if sees_injected:
+            editor.echo = self._deliver
+
+    def start(self, on_key: Callable, on_click: Optional[Callable] = None):
+        self._on_key = on_key
+        self._on_click = on_click
+
+    def stop(self):
+        self._on_key = None
+        self._on_click = None
+
+    def add_hotkey(self, hotkey: str, callback: Callable):
+        self.hotkeys[hotkey] = callback
+
+    def remove_hotkey(self, hotkey: str):
+        self.hotkeys.pop(hotkey, None)
+
+    # ────────────────────────────────
+    # Entrada simulada
+    # ────────────────────────────────
+    def tap(self, name: str):
+        """Pulsa y suelta una tecla ('a', 'space', 'left'...)."""
+        on_key = self._on_key
+        # Como el hook del sistema: el listener ve la tecla a la vez que
+        # llega al editor, sin que el motor pueda colarse entre medias
+        with self.editor._lock:
+            self.editor._press(name)
+            if on_key is not None:
+                on_key(KeyEvent(name, KEY_DOWN))
+        if on_key is not None:
+            on_key(KeyEvent(name, KEY_UP))
+
+    def _deliver(self, keys: Sequence[str]):
+        """Entrega al listener una tecla o combinación enviada por el motor."""
+        on_key = self._on_key
+        if on_key is None:
+            return
+        for name in keys:
+            on_key(KeyEvent(name, KEY_DOWN))
+        for name in reversed(keys):
+            on_key(KeyEvent(name, KEY_UP))
+
+    def type_char(self, char: str):
+        """Escribe un carácter como lo haría el usuario."""
+        self.tap(KEY_NAMES.get(char, char))
+
+    def click(self):
+        """Simula un clic (el cursor puede haberse movido)."""
+        if self._on_click is not None:
+            self._on_click()
+
+    def fire_hotkey(self, hotkey: str):
+        callback = self.hotkeys.get(hotkey)
+        if callback is not None:
+            callback()
+
+
+class SimulatedBackend(Backend):
+    """Backend en memoria, para benchmarks y para ejecutar sin pantalla."""
+
+    name = "simulated"
+
+    def __init__(self, editor: Optional[SimulatedEditor] = None, settle_delay: float = 0.0,
+                 sees_injected: bool = False):
+        editor = editor if editor is not None else SimulatedEditor()
+        super().__init__(SimulatedKeySource(editor, sees_injected), editor, editor, settle_delay)
+        self.editor = editor
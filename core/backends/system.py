@@ -0,0 +1,114 @@
+# core/backends/system.py
+
+from typing import Callable, Optional
+
+import keyboard
+
+try:
+    import mouse  # Opcional: permite invalidar el buffer al hacer clic
+except ImportError:
+    mouse = None
+
+from .base import Backend, KeySource, TextSink
+from .clipboard import PyperclipClipboard
+
+_pyautogui = None
+
+
+def _gui():
+    """
+    Importa pyautogui la primera vez que se usa: en un servidor sin
+    pantalla falla al importarse.
+    """
+    global _pyautogui
+    if _pyautogui is None:
+        import pyautogui
+        pyautogui.PAUSE = 0.01  # Reducir delay entre acciones
+        pyautogui.FAILSAFE = False
+        _pyautogui = pyautogui
+    return _pyautogui
+
+
+class KeyboardKeySource(KeySource):
+    """Hook global de la librería keyboard (y de mouse, si está instalada)."""
+
+    def __init__(self):
+        self._key_handler = None
+        self._mouse_handler = None
+
+    def start(self, on_key: Callable, on_click: Optional[Callable] = None):
+        if self._key_handler is not None:
+            return
+
+        # Un único hook para todas las teclas
+        self._key_handler = keyboard.hook(on_key, suppress=False)
+
+        if on_click is not None and mouse is not None:
+            def on_mouse(event):
+                if getattr(event, 'event_type', None) == 'down':
+                    on_click()
+            self._mouse_handler = mouse.hook(on_mouse)
+
+    def stop(self):
+        if self._key_handler is not None:
+            try:
+                keyboard.unhook(self._key_handler)
+            except Exception as e:
+                print(f"Advertencia al desregistrar handler: {e}")
+            self._key_handler = None
+
+        if self._mouse_handler is not None:
+            try:
+                mouse.unhook(self._mouse_handler)
+            except Exception as e:
+                print(f"Advertencia al desregistrar hook de ratón: {e}")
+            self._mouse_handler = None
+
+    def add_hotkey(self, hotkey: str, callback: Callable):
+        keyboard.add_hotkey(hotkey, callback)
+
+    def remove_hotkey(self, hotkey: str):
+        keyboard.remove_hotkey(hotkey)
+
+    def is_valid_hotkey(self, hotkey: str) -> bool:
+        try:
+            keyboard.parse_hotkey(hotkey)
+            return True
+        except Exception:
+            return False
+
+
+class PyAutoGuiSink(TextSink):
+    """
+    Teclas con pyautogui; el texto, de una sola llamada con keyboard.write
+    (admite Unicode, así que también sirve para las vocales con tilde).
+    batch=False escribe carácter a carácter con pyautogui.
+    """
+
+    def __init__(self, batch: bool = True):
+        self.batch = batch
+
+    def press(self, key: str, times: int = 1):
+        if times > 0:
+            _gui().press(key, presses=times, interval=0)
+
+    def hotkey(self, *keys: str):
+        _gui().hotkey(*keys)
+
+    def write(self, text: str):
+        if not text:
+            return
+        if self.batch:
+            keyboard.write(text, delay=0)
+        else:
+            _gui().write(text, interval=0.01)
+
+
+class SystemBackend(Backend):
+    """Backend por defecto: keyboard + pyautogui + pyperclip."""
+
+    name = "system"
+
+    def __init__(self, batch_output: bool = True):
+        super().__init__(KeyboardKeySource(), PyAutoGuiSink(batch_output),
+                         PyperclipClipboard(), settle_delay=0.05)
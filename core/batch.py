@@ -0,0 +1,265 @@
+# core/batch.py
+"""
+Corrector por lotes sin interfaz gráfica.
+
+Corrige las tildes de archivos de texto (o de la entrada estándar) con
+el mismo diccionario que la aplicación de escritorio:
+
+    python -m core.batch documento.txt -o documento_corregido.txt
+    python -m core.batch *.srt --in-place -j 8
+    type tickets.csv | python -m core.batch > tickets_corregidos.csv
+
+El texto se procesa en bloques repartidos entre varios procesos. Los
+bytes fuera de las palabras corregidas se conservan tal cual (incluso si
+el archivo no es UTF-8 válido). Al terminar se imprimen en stderr las
+estadísticas de rendimiento.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional, Tuple
+
+from .text_corrector import TextCorrector
+
+if TYPE_CHECKING:
+    from .dictionary_snapshot import DictionarySnapshot
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+_corrector = None
+
+
+# ────────────────────────────────
+# Trabajo de cada proceso
+# ────────────────────────────────
+def open_snapshot(context_enabled: bool = True, data_dir: Optional[Path] = None) -> "DictionarySnapshot":
+    """
+    Diccionarios de solo lectura para corregir por lotes: el base compilado
+    (por mmap), la tabla de contexto y las palabras del usuario.
+
+    No usa DictionaryManager: no toma el cerrojo del diccionario de
+    usuario, no abre las estadísticas de uso ni vigila los archivos.
+    """
+    from .dictionary_snapshot import DictionarySnapshot
+    from .language_packs import DEFAULT_LANGUAGE, discover_packs
+    from .user_dictionary_store import read_user_words
+
+    if data_dir is None:
+        data_dir = Path(__file__).resolve().parent.parent / "data"
+    data_dir = Path(data_dir)
+
+    # Compila el base y la tabla de contexto si cambiaron sus fuentes
+    pack = discover_packs(data_dir)[DEFAULT_LANGUAGE].open()
+    user = read_user_words(data_dir / "user_dictionary.json", data_dir / "user_dictionary.journal")
+    # Sin tabla de contexto no hay palabras ambiguas: se corrigen todas
+    context_model = pack.context_model if context_enabled else None
+    return DictionarySnapshot.create(1, pack.base, user, context_model)
+
+
+def _init_worker(context_enabled: bool):
+    """Abre los diccionarios una vez por proceso (el base va por mmap)."""
+    global _corrector
+    # Un corrector por proceso: su caché de palabras dura entre bloques
+    _corrector = TextCorrector(open_snapshot(context_enabled))
+
+
+def correct_chunk(chunk: bytes) -> Tuple[bytes, int, int]:
+    """
+    Corrige un bloque de bytes.
+    Returns: (bloque corregido, palabras, correcciones)
+    """
+    text = chunk.decode("utf-8", errors="surrogateescape")
+    words_before = _corrector.words_seen
+    text, spans = _corrector.correct(text)
+    words = _corrector.words_seen - words_before
+    return text.encode("utf-8", errors="surrogateescape"), words, len(spans)
+
+
+# ────────────────────────────────
+# Lectura por bloques
+# ────────────────────────────────
+def iter_chunks(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Lee el flujo en bloques que terminan en un salto de línea (o, si no
+    hay, en un byte ASCII que no sea letra), para no partir palabras ni
+    caracteres UTF-8 de varios bytes.
+    """
+    pending = b""
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        data = pending + data
+
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            cut = _last_ascii_separator(data) + 1
+        if cut == 0:
+            # Ningún punto de corte seguro: acumular con el siguiente bloque
+            pending = data
+            continue
+
+        pending = data[cut:]
+        yield data[:cut]
+
+    if pending:
+        yield pending
+
+
+def _last_ascii_separator(data: bytes) -> int:
+    for i in range(len(data) - 1, -1, -1):
+        byte = data[i]
+        if byte < 0x80 and not (0x41 <= byte <= 0x5A or 0x61 <= byte <= 0x7A
+                                or 0x30 <= byte <= 0x39 or byte == 0x5F):
+            return i
+    return -1
+
+
+# ────────────────────────────────
+# Procesamiento de un flujo
+# ────────────────────────────────
+class BatchStats:
+    """Contadores acumulados de una ejecución."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.words = 0
+        self.corrections = 0
+        self.files = 0
+        self.started = time.perf_counter()
+
+    def add(self, size: int, words: int, corrections: int):
+        self.bytes += size
+        self.words += words
+        self.corrections += corrections
+
+    def report(self) -> str:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        mb = self.bytes / (1024 * 1024)
+        return (
+            f"{self.files} archivo(s), {mb:.2f} MB, {self.words} palabras, "
+            f"{self.corrections} correcciones en {elapsed:.2f} s "
+            f"({mb / elapsed:.2f} MB/s, {self.words / elapsed:,.0f} palabras/s)"
+        )
+
+
+def process_stream(source: BinaryIO, target: BinaryIO, pool: Optional[Pool],
+                   chunk_size: int, stats: BatchStats):
+    """Corrige 'source' y escribe el resultado en 'target', en orden."""
+    chunks = iter_chunks(source, chunk_size)
+    if pool is None:
+        results = map(correct_chunk, chunks)
+    else:
+        results = pool.imap(correct_chunk, chunks)
+
+    for corrected, words, corrections in results:
+        target.write(corrected)
+        stats.add(len(corrected), words, corrections)
+    stats.files += 1
+
+
+def _process_in_place(path: Path, pool: Optional[Pool], chunk_size: int, stats: BatchStats):
+    """Corrige un archivo escribiendo a un temporal que luego lo reemplaza."""
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with open(path, "rb") as source, os.fdopen(fd, "wb") as target:
+            process_stream(source, target, pool, chunk_size, stats)
+            target.flush()
+            os.fsync(target.fileno())
+        # mkstemp crea el temporal con permisos 0600: se copian los del original
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# ────────────────────────────────
+# Línea de comandos
+# ────────────────────────────────
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.batch",
+        description="Corrige las tildes de archivos de texto sin interfaz gráfica."
+    )
+    parser.add_argument("files", nargs="*", help="archivos a corregir ('-' o nada = entrada estándar)")
+    parser.add_argument("-o", "--output", help="archivo de salida (por defecto, salida estándar)")
+    parser.add_argument("-i", "--in-place", action="store_true", help="sobrescribir cada archivo con su versión corregida")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="procesos en paralelo (por defecto, uno por núcleo)")
+    parser.add_argument("--chunk-size", type=float, default=DEFAULT_CHUNK_SIZE / (1024 * 1024),
+                        help="tamaño de bloque en MB (por defecto 4)")
+    parser.add_argument("--no-context", action="store_true",
+                        help="no desambiguar por contexto (el/él, si/sí...)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no mostrar estadísticas")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    files = [f for f in args.files if f != "-"]
+    use_stdin = not args.files or "-" in args.files
+
+    if args.in_place and (use_stdin or args.output):
+        print("Error: --in-place solo se puede usar con archivos y sin -o", file=sys.stderr)
+        return 2
+    if args.output and len(args.files) > 1:
+        print("Error: -o solo admite un archivo de entrada (usa --in-place)", file=sys.stderr)
+        return 2
+
+    chunk_size = max(int(args.chunk_size * 1024 * 1024), 4096)
+    context_enabled = not args.no_context
+    stats = BatchStats()
+
+    try:
+        # También compila lo que haga falta antes de que arranquen los procesos
+        _init_worker(context_enabled)
+    except (OSError, ValueError) as e:
+        print(f"Error: no se pudo abrir el diccionario: {e}", file=sys.stderr)
+        return 1
+
+    pool = None
+    if args.jobs > 1:
+        pool = Pool(args.jobs, initializer=_init_worker, initargs=(context_enabled,))
+
+    try:
+        if args.in_place:
+            for name in files:
+                _process_in_place(Path(name), pool, chunk_size, stats)
+        else:
+            target = open(args.output, "wb") if args.output else sys.stdout.buffer
+            try:
+                if use_stdin:
+                    process_stream(sys.stdin.buffer, target, pool, chunk_size, stats)
+                for name in files:
+                    with open(name, "rb") as source:
+                        process_stream(source, target, pool, chunk_size, stats)
+            finally:
+                if args.output:
+                    target.close()
+                else:
+                    target.flush()
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    if not args.quiet:
+        print(stats.report(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
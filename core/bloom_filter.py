@@ -0,0 +1,71 @@
+# core/bloom_filter.py
+
+import sys
+import zlib
+from array import array
+from typing import Iterable, Sequence
+
+# ────────────────────────────────
+# Parámetros
+# ────────────────────────────────
+# Con 12 bits por clave y 5 bits por consulta, los falsos positivos
+# rondan el 2-3 %. Cambiarlos cambia el formato: hay que subir
+# compiled_dictionary.VERSION para que se recompile
+BITS_PER_KEY = 12
+HASHES = 5
+_SEED = 0x9E3779B9
+
+
+def _locate(key: bytes, blocks: int):
+    """Bloque de 64 bits de la clave y máscara con sus HASHES bits."""
+    bits = zlib.crc32(key, _SEED)
+    mask = 0
+    for _ in range(HASHES):
+        mask |= 1 << (bits & 63)
+        bits >>= 6
+    return zlib.crc32(key) % blocks, mask
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom por bloques: todos los bits de una clave caen en el
+    mismo entero de 64 bits, así que una consulta son dos crc32, una
+    lectura y un AND. Dice con seguridad que una clave NO está; si dice
+    que sí, puede equivocarse (hay que confirmarlo en el diccionario).
+
+    Los bloques pueden ser un array('Q') o un memoryview sobre el mmap del
+    diccionario compilado (se leen en el orden de bytes nativo, como las
+    claves de ContextModel).
+    """
+
+    def __init__(self, blocks: Sequence[int]):
+        self._blocks = blocks
+        self._count = len(blocks)
+
+    @classmethod
+    def build(cls, keys: Iterable[bytes], count: int) -> "BloomFilter":
+        """Filtro para 'count' claves (en UTF-8)."""
+        size = -(-count * BITS_PER_KEY // 64) if count else 0
+        blocks = array("Q", bytes(8 * size))
+        for key in keys:
+            index, mask = _locate(key, size)
+            blocks[index] |= mask
+        return cls(blocks)
+
+    def might_contain(self, key: bytes) -> bool:
+        """False si la clave seguro que no está."""
+        if not self._count:
+            return False
+        index, mask = _locate(key, self._count)
+        return self._blocks[index] & mask == mask
+
+    @property
+    def nbytes(self) -> int:
+        return 8 * self._count
+
+    def to_bytes(self) -> bytes:
+        """Bloques en little-endian (el orden del formato compilado)."""
+        blocks = array("Q", self._blocks)
+        if sys.byteorder == "big":
+            blocks.byteswap()
+        return blocks.tobytes()
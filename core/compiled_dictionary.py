@@ -0,0 +1,241 @@
+# core/compiled_dictionary.py
+
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterator, Mapping, Optional, Tuple, Union
+
+from .bloom_filter import BloomFilter
+from .file_utils import atomic_write_bytes
+
+# ────────────────────────────────
+# Formato binario (little-endian)
+# ────────────────────────────────
+# Cabecera: magic, versión, nº de entradas, bloques del filtro de Bloom,
+#           sha256 del JSON origen
+# Índice:   una entrada de tamaño fijo por palabra, ordenado por clave (UTF-8)
+#           (offset clave, longitud clave, offset valor, longitud valor)
+# Blob:     claves y valores en UTF-8, uno detrás de otro
+# Filtro:   bloques uint64 del filtro de Bloom de las claves, al final del
+#           archivo y alineados a 8 bytes
+MAGIC = b"ACDX"
+VERSION = 2
+HEADER = struct.Struct("<4sIII32s")
+ENTRY = struct.Struct("<IHIH")
+
+
+def file_hash(path: Union[str, Path]) -> bytes:
+    """Devuelve el sha256 del contenido de un archivo."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+class CompiledDictionary:
+    """
+    Diccionario de solo lectura sobre un archivo binario mapeado en memoria.
+
+    Las consultas hacen una búsqueda binaria directamente sobre el mmap,
+    sin construir un dict de Python: el arranque y la memoria residente no
+    crecen con el tamaño del diccionario.
+    """
+
+    def __init__(self, buffer, file=None):
+        self._buffer = buffer
+        self._file = file
+
+        magic, version, count, filter_blocks, source_hash = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Formato de diccionario compilado no reconocido")
+
+        self.count = count
+        self.source_hash = source_hash
+        self._blob_start = HEADER.size + ENTRY.size * count
+
+        # Las palabras que no están (la mayoría de las que se escriben) se
+        # descartan con el filtro, sin la búsqueda binaria
+        self._view = memoryview(buffer)
+        self._filter_view = self._view[len(buffer) - 8 * filter_blocks:].cast("Q")
+        self.filter = BloomFilter(self._filter_view)
+
+    # ────────────────────────────────
+    # Apertura y construcción
+    # ────────────────────────────────
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "CompiledDictionary":
+        """Abre un diccionario compilado mapeándolo en memoria."""
+        f = open(path, "rb")
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(buffer, f)
+        except Exception:
+            f.close()
+            raise
+
+    @classmethod
+    def empty(cls) -> "CompiledDictionary":
+        """Diccionario vacío en memoria (para cuando no hay nada que cargar)."""
+        return cls(encode({}, b""))
+
+    @classmethod
+    def build(cls, path: Union[str, Path], mapping: Mapping[str, str], source_hash: bytes = b""):
+        """Compila un mapping en 'path' de forma atómica."""
+        atomic_write_bytes(path, encode(mapping, source_hash))
+
+    @classmethod
+    def load_or_build(cls, compiled_path: Union[str, Path], source_path: Union[str, Path],
+                      in_subprocess: bool = False) -> "CompiledDictionary":
+        """
+        Abre el diccionario compilado de 'source_path' (JSON). Solo se
+        recompila si el hash del JSON no coincide con el guardado.
+
+        in_subprocess=True compila en otro proceso: json.loads y la
+        ordenación son llamadas largas en C que retienen el GIL (cientos de
+        ms con 200.000 palabras) y, en una recarga en caliente, pararían
+        los hilos de corrección.
+        """
+        compiled_path = Path(compiled_path)
+        source_hash = file_hash(source_path)
+
+        if compiled_path.exists():
+            try:
+                compiled = cls.open(compiled_path)
+                if compiled.source_hash == source_hash:
+                    return compiled
+                compiled.close()
+            except Exception as e:
+                print(f"[Aviso] Diccionario compilado inválido, se regenera: {e}")
+
+        if in_subprocess:
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                data = pool.submit(compile_source, str(source_path), source_hash).result()
+        else:
+            data = compile_source(source_path, source_hash)
+
+        try:
+            atomic_write_bytes(compiled_path, data)
+        except OSError as e:
+            # En Windows no se puede reemplazar el archivo mientras la versión
+            # anterior siga mapeada (recarga en caliente): se usa en memoria
+            print(f"[Aviso] No se pudo guardar {compiled_path.name} ({e}), se usa en memoria")
+            return cls(data)
+        return cls.open(compiled_path)
+
+    def close(self):
+        """Libera el mapeo y el archivo."""
+        self._filter_view.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ────────────────────────────────
+    # Consultas
+    # ────────────────────────────────
+    @property
+    def nbytes(self) -> int:
+        """Tamaño del archivo mapeado (lo que ocupa si se lee entero)."""
+        return len(self._buffer)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) >= 0
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        index = self._find(key)
+        if index < 0:
+            return default
+        return self.value_at(index)
+
+    def key_at(self, index: int) -> str:
+        key_off, key_len, _, _ = ENTRY.unpack_from(self._buffer, HEADER.size + ENTRY.size * index)
+        start = self._blob_start + key_off
+        return self._buffer[start:start + key_len].decode("utf-8")
+
+    def value_at(self, index: int) -> str:
+        _, _, val_off, val_len = ENTRY.unpack_from(self._buffer, HEADER.size + ENTRY.size * index)
+        start = self._blob_start + val_off
+        return self._buffer[start:start + val_len].decode("utf-8")
+
+    def keys(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self.key_at(i)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        for i in range(self.count):
+            yield self.key_at(i), self.value_at(i)
+
+    def might_contain(self, key: str) -> bool:
+        """False si la clave seguro que no está (solo consulta el filtro)."""
+        return self.filter.might_contain(key.encode("utf-8"))
+
+    def rank(self, key: str) -> int:
+        """Número de claves menores que 'key' (posición en la que iría)."""
+        return self._bisect(key.encode("utf-8"))[0]
+
+    def _find(self, key: str) -> int:
+        """Búsqueda binaria de la clave. Devuelve su índice o -1."""
+        target = key.encode("utf-8")
+        if not self.filter.might_contain(target):
+            return -1
+        index, found = self._bisect(target)
+        return index if found else -1
+
+    def _bisect(self, target: bytes) -> Tuple[int, bool]:
+        buffer = self._buffer
+        blob_start = self._blob_start
+        lo, hi = 0, self.count
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key_off, key_len, _, _ = ENTRY.unpack_from(buffer, HEADER.size + ENTRY.size * mid)
+            start = blob_start + key_off
+            current = buffer[start:start + key_len]
+            if current < target:
+                lo = mid + 1
+            elif current > target:
+                hi = mid
+            else:
+                return mid, True
+        return lo, False
+
+
+def compile_source(source_path: Union[str, Path], source_hash: bytes = b"") -> bytes:
+    """Lee un diccionario JSON y lo devuelve en el formato compilado."""
+    mapping = json.loads(Path(source_path).read_text(encoding="utf-8"))
+    if not isinstance(mapping, dict):
+        raise ValueError(f"{source_path} no contiene un objeto JSON")
+    return encode(mapping, source_hash)
+
+
+def encode(mapping: Mapping[str, str], source_hash: bytes = b"") -> bytes:
+    """Serializa un mapping al formato compilado."""
+    entries = sorted(
+        (str(k).encode("utf-8"), str(v).encode("utf-8"))
+        for k, v in mapping.items()
+    )
+
+    index = bytearray()
+    blob = bytearray()
+    for key, value in entries:
+        key_off = len(blob)
+        blob += key
+        val_off = len(blob)
+        blob += value
+        index += ENTRY.pack(key_off, len(key), val_off, len(value))
+
+    bloom = BloomFilter.build((key for key, _ in entries), len(entries)).to_bytes()
+    header = HEADER.pack(MAGIC, VERSION, len(entries), len(bloom) // 8, source_hash.ljust(32, b"\0")[:32])
+    # Relleno para que el filtro quede alineado a 8 bytes
+    blob += bytes(-(len(header) + len(index) + len(blob)) % 8)
+    return bytes(header) + bytes(index) + bytes(blob) + bloom
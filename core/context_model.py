@@ -0,0 +1,190 @@
+# core/context_model.py
+
+import bisect
+import hashlib
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+from .compiled_dictionary import file_hash
+from .file_utils import atomic_write_bytes
+
+# ────────────────────────────────
+# Formato binario (little-endian)
+# ────────────────────────────────
+# Cabecera: magic, versión, nº de entradas, bytes de la lista de palabras
+#           ambiguas, sha256 del TSV de origen
+# Claves:   uint64 ordenados, hash de "contexto \x1f palabra"
+# Scores:   int8, en el mismo orden que las claves
+# Palabras: palabras ambiguas en UTF-8 separadas por '\n'
+MAGIC = b"ACTX"
+VERSION = 1
+HEADER = struct.Struct("<4sIII32s")
+
+
+# Las palabras de contexto se comparan sin tildes: "no sé" y "no se" son
+# el mismo contexto (la ñ se conserva)
+_FOLD = str.maketrans("áéíóúü", "aeiouu")
+
+
+def fold(word: str) -> str:
+    """Minúsculas y sin tildes."""
+    return word.lower().translate(_FOLD)
+
+
+def context_key(context: str, word: str) -> int:
+    """Hash de 64 bits de un contexto ('', 'de' o 'no se') y una palabra."""
+    data = f"{context}\x1f{word}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class ContextModel:
+    """
+    Tabla precompilada de bigramas/trigramas para palabras ambiguas
+    (el/él, si/sí, esta/está...).
+
+    Para cada palabra ambigua guarda un score por contexto: positivo si
+    en ese contexto lleva tilde, negativo si no. El contexto vacío es la
+    preferencia por defecto de la palabra. La tabla es un array ordenado
+    de hashes mapeado en memoria: la consulta es una búsqueda binaria en C
+    (bisect sobre un memoryview), en el rango de los microsegundos.
+    """
+
+    def __init__(self, buffer, file=None):
+        self._buffer = buffer
+        self._file = file
+
+        magic, version, count, words_len, source_hash = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Formato de tabla de contexto no reconocido")
+
+        self.count = count
+        self.source_hash = source_hash
+
+        keys_start = HEADER.size
+        scores_start = keys_start + 8 * count
+        words_start = scores_start + count
+
+        # Nota: el array se lee en el orden de bytes nativo (little-endian en x86/ARM)
+        view = self._view = memoryview(buffer)
+        self._keys = view[keys_start:scores_start].cast("Q")
+        self._scores = view[scores_start:words_start].cast("b")
+        words = bytes(view[words_start:words_start + words_len]).decode("utf-8")
+        self.ambiguous_words = frozenset(w for w in words.split("\n") if w)
+
+    # ────────────────────────────────
+    # Apertura y construcción
+    # ────────────────────────────────
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "ContextModel":
+        """Abre una tabla compilada mapeándola en memoria."""
+        f = open(path, "rb")
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(buffer, f)
+        except Exception:
+            f.close()
+            raise
+
+    @classmethod
+    def load_or_build(cls, compiled_path: Union[str, Path], source_path: Union[str, Path]) -> "ContextModel":
+        """Abre la tabla compilada; solo se recompila si cambia el hash del TSV."""
+        compiled_path = Path(compiled_path)
+        source_hash = file_hash(source_path)
+
+        if compiled_path.exists():
+            try:
+                model = cls.open(compiled_path)
+                if model.source_hash == source_hash:
+                    return model
+                model.close()
+            except Exception as e:
+                print(f"[Aviso] Tabla de contexto inválida, se regenera: {e}")
+
+        data = encode(read_rules(source_path), source_hash)
+        try:
+            atomic_write_bytes(compiled_path, data)
+        except OSError as e:
+            # La tabla anterior sigue mapeada (recarga en caliente en Windows)
+            print(f"[Aviso] No se pudo guardar {compiled_path.name} ({e}), se usa en memoria")
+            return cls(data)
+        return cls.open(compiled_path)
+
+    def close(self):
+        """Libera el mapeo y el archivo."""
+        self._keys.release()
+        self._scores.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ────────────────────────────────
+    # Consultas
+    # ────────────────────────────────
+    @property
+    def nbytes(self) -> int:
+        """Tamaño del archivo mapeado (lo que ocupa si se lee entero)."""
+        return len(self._buffer)
+
+    def is_ambiguous(self, word: str) -> bool:
+        return word in self.ambiguous_words
+
+    def score(self, word: str, previous: Sequence[str] = ()) -> Optional[int]:
+        """
+        Score de 'word' (en minúsculas) tras las palabras 'previous'.
+        Prueba trigrama, bigrama y preferencia por defecto, en ese orden.
+        """
+        contexts = []
+        if len(previous) >= 2:
+            contexts.append(f"{fold(previous[-2])} {fold(previous[-1])}")
+        if previous:
+            contexts.append(fold(previous[-1]))
+        contexts.append("")
+
+        for context in contexts:
+            score = self._get(context_key(context, word))
+            if score is not None:
+                return score
+        return None
+
+    def _get(self, key: int) -> Optional[int]:
+        index = bisect.bisect_left(self._keys, key)
+        if index < self.count and self._keys[index] == key:
+            return self._scores[index]
+        return None
+
+
+def read_rules(path: Union[str, Path]) -> Dict[tuple, int]:
+    """
+    Lee un TSV de reglas: contexto<TAB>palabra<TAB>score
+    El contexto son una o dos palabras separadas por espacio, o '*' para
+    la preferencia por defecto. Las líneas que empiezan por '#' se ignoran.
+    """
+    rules = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split("\t")
+            if len(parts) != 3:
+                raise ValueError(f"Línea {line_no}: se esperaban 3 columnas separadas por tabulador")
+            context, word, score = parts
+            context = "" if context.strip() == "*" else " ".join(fold(context).split())
+            rules[(context, word.strip().lower())] = max(-128, min(127, int(score)))
+    return rules
+
+
+def encode(rules: Dict[tuple, int], source_hash: bytes = b"") -> bytes:
+    """Serializa las reglas al formato compilado."""
+    entries = sorted((context_key(context, word), score) for (context, word), score in rules.items())
+    words = "\n".join(sorted({word for _, word in rules})).encode("utf-8")
+
+    header = HEADER.pack(MAGIC, VERSION, len(entries), len(words), source_hash.ljust(32, b"\0")[:32])
+    keys = struct.pack(f"<{len(entries)}Q", *(k for k, _ in entries))
+    scores = struct.pack(f"<{len(entries)}b", *(s for _, s in entries))
+    return header + keys + scores + words
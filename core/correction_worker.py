@@ -0,0 +1,182 @@
+# core/correction_worker.py
+
+import queue
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .word_buffer import Anchor
+
+
+class CorrectionWorker:
+    """
+    Hilo único de corrección alimentado por una cola acotada.
+
+    Sustituye al hilo por pulsación: los triggers se procesan en el orden
+    en que llegan, sin descartar palabras porque otra corrección esté en
+    curso. Los triggers que dependen del portapapeles se fusionan, ya que
+    todos leerían la misma palabra bajo el cursor.
+
+    Cuando la cola se vacía y el motor tiene correcciones aplazadas, el
+    hilo espera a que el usuario haga una pausa y las aplica (catch_up).
+    """
+
+    _STOP = object()
+
+    def __init__(self, engine, max_pending: int = 64):
+        self.engine = engine
+        self.metrics = engine.metrics
+        self.queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self.thread: Optional[threading.Thread] = None
+        self.is_running = False
+
+        self._lock = threading.Lock()
+        self._fallback_pending = False
+        self._fallback_anchor: Optional[Anchor] = None
+        self._fallback_previous: Tuple[str, ...] = ()
+        self._stats = {
+            'submitted': 0,
+            'processed': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'max_depth': 0,
+        }
+
+    # -------------------------------
+    # Control del hilo
+    # -------------------------------
+
+    def start(self):
+        """
+        Arranca el hilo de corrección. Si el de un stop() anterior sigue
+        vivo lanza RuntimeError: dos hilos sobre la misma cola romperían
+        el orden y se pisarían al inyectar.
+        """
+        if self.is_running:
+            return
+        if self.thread is not None and self.thread.is_alive():
+            raise RuntimeError("El hilo de corrección anterior todavía no ha terminado")
+
+        self.is_running = True
+        self.thread = threading.Thread(
+            target=self._run,
+            name="CorrectionWorker",
+            daemon=True
+        )
+        self.thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Detiene el hilo tras vaciar lo que quede en la cola. Si no termina
+        en 'timeout' segundos sigue en self.thread (se puede volver a
+        llamar a stop) y acaba solo al vaciar la cola.
+        """
+        thread = self.thread
+        if thread is None:
+            return
+
+        if self.is_running:
+            self.is_running = False
+            try:
+                self.queue.put(self._STOP, timeout=timeout)
+            except queue.Full:
+                # Cola llena: el hilo sale cuando la vacíe
+                pass
+
+        thread.join(timeout)
+        if thread.is_alive():
+            print("[Aviso] El hilo de corrección sigue ocupado; terminará al vaciar la cola")
+        else:
+            self.thread = None
+
+    # -------------------------------
+    # Encolado
+    # -------------------------------
+
+    def submit(self, event=None, word: Optional[str] = None,
+               previous: Tuple[str, ...] = (), anchor: Optional[Anchor] = None) -> bool:
+        """
+        Encola un trigger. word=None indica que hay que leer la palabra
+        del portapapeles; previous son las palabras anteriores (contexto)
+        y anchor el final de la palabra en el buffer.
+        Returns: True si se encoló (o se fusionó), False si se descartó.
+        """
+        received = time.perf_counter()
+        self.metrics.triggers.inc()
+
+        with self._lock:
+            self._stats['submitted'] += 1
+
+            if word is None:
+                # Se lee la palabra bajo el cursor: vale el último trigger
+                self._fallback_anchor = anchor
+                self._fallback_previous = previous
+                if self._fallback_pending:
+                    self._stats['coalesced'] += 1
+                    self.metrics.coalesced.inc()
+                    return True
+                self._fallback_pending = True
+
+            try:
+                self.queue.put_nowait((event, word, previous, received, anchor))
+            except queue.Full:
+                if word is None:
+                    self._fallback_pending = False
+                self._stats['dropped'] += 1
+                self.metrics.dropped.inc()
+                print("[Aviso] Cola de corrección llena, trigger descartado")
+                return False
+
+            depth = self.queue.qsize()
+            if depth > self._stats['max_depth']:
+                self._stats['max_depth'] = depth
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """Devuelve los contadores del worker y la profundidad actual de la cola."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['depth'] = self.queue.qsize()
+        return stats
+
+    # -------------------------------
+    # Bucle principal
+    # -------------------------------
+
+    def _run(self):
+        catch_up_timeout = getattr(self.engine, "catch_up_timeout", lambda: None)
+        while True:
+            try:
+                item = self.queue.get(timeout=catch_up_timeout())
+            except queue.Empty:
+                if not self.is_running:
+                    break
+                # Sin triggers nuevos: aplicar lo aplazado si el usuario paró
+                try:
+                    self.engine.catch_up()
+                except Exception as e:
+                    self.metrics.errors.inc()
+                    print(f"[Error] En el worker de corrección: {e}")
+                continue
+            if item is self._STOP:
+                break
+
+            event, word, previous, received, anchor = item
+            if word is None:
+                with self._lock:
+                    self._fallback_pending = False
+                    anchor = self._fallback_anchor
+                    previous = self._fallback_previous
+
+            try:
+                self.engine.process_trigger(event, word, previous, received, anchor)
+            except Exception as e:
+                self.metrics.errors.inc()
+                print(f"[Error] En el worker de corrección: {e}")
+            finally:
+                with self._lock:
+                    self._stats['processed'] += 1
+
+            if not self.is_running and self.queue.empty():
+                # stop() no pudo encolar _STOP (la cola estaba llena)
+                break
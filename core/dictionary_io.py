@@ -0,0 +1,93 @@
+# core/dictionary_io.py
+
+import csv
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple, Union
+
+# Formatos admitidos según la extensión del archivo
+SUPPORTED_FORMATS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".txt": "tsv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+HEADER_NAMES = {"sin tilde", "sin_tilde", "palabra", "word", "key", "clave"}
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """Devuelve el formato ('csv', 'tsv' o 'jsonl') según la extensión."""
+    fmt = SUPPORTED_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(
+            f"Formato no soportado: {Path(path).suffix or '(sin extensión)'}. "
+            f"Usa {', '.join(sorted(SUPPORTED_FORMATS))}"
+        )
+    return fmt
+
+
+def iter_entries(path: Union[str, Path]) -> Iterator[Tuple[int, str, str]]:
+    """
+    Lee un archivo de palabras línea a línea, sin cargarlo entero.
+    Produce (nº de línea, palabra sin tilde, palabra con tilde).
+
+    CSV/TSV: dos columnas, con cabecera opcional.
+    JSONL:   {"word": "camion", "value": "camión"} o ["camion", "camión"]
+    """
+    fmt = detect_format(path)
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if fmt == "jsonl":
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"Línea {line_no}: JSON inválido ({e})")
+                if isinstance(entry, dict):
+                    yield line_no, str(entry.get("word", "")), str(entry.get("value", ""))
+                elif isinstance(entry, list) and len(entry) >= 2:
+                    yield line_no, str(entry[0]), str(entry[1])
+                else:
+                    yield line_no, "", ""
+            return
+
+        reader = csv.reader(f, delimiter="," if fmt == "csv" else "\t")
+        for row in reader:
+            line_no = reader.line_num
+            if not row or all(not cell.strip() for cell in row):
+                continue
+            if line_no == 1 and row[0].strip().lower() in HEADER_NAMES:
+                continue
+            if len(row) < 2:
+                yield line_no, row[0], ""
+            else:
+                yield line_no, row[0], row[1]
+
+
+def write_entries(path: Union[str, Path], entries: Iterable[Tuple[str, str]]) -> int:
+    """
+    Escribe las palabras en el formato que indique la extensión.
+    Returns: número de palabras escritas.
+    """
+    fmt = detect_format(path)
+    count = 0
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "jsonl":
+            for word, value in entries:
+                f.write(json.dumps({"word": word, "value": value}, ensure_ascii=False) + "\n")
+                count += 1
+            return count
+
+        writer = csv.writer(f, delimiter="," if fmt == "csv" else "\t", lineterminator="\n")
+        writer.writerow(["sin_tilde", "con_tilde"])
+        for word, value in entries:
+            writer.writerow([word, value])
+            count += 1
+
+    return count
@@ -1,25 +1,130 @@
 # core/dictionary_manager.py
 
+import bisect
+import heapq
 import json
+import threading
+from array import array
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from . import dictionary_io
+from .compiled_dictionary import CompiledDictionary, file_hash
+from .context_model import ContextModel
+from .dictionary_snapshot import DictionarySnapshot
+from .dictionary_watcher import DictionaryWatcher
+from .language_packs import DEFAULT_LANGUAGE, LanguagePack, LoadedPack, PackCache, discover_packs
+from .search_index import SearchIndex, search_words
+from .text_corrector import CorrectionSpan, correct_text
+from .usage_stats import UsageStats
+from .user_dictionary_store import UserDictionaryStore
 
 
 class DictionaryManager:
     """Gestiona los diccionarios de palabras con y sin tilde."""
 
-    def __init__(self):
+    def __init__(self, data_dir: Optional[Path] = None, language: str = DEFAULT_LANGUAGE):
         self.base_dir = Path(__file__).resolve().parent.parent
-        self.data_dir = self.base_dir / "data"
-        self.default_dict_path = self.data_dir / "default_dictionary.json"
+        # data_dir permite usar otra carpeta (benchmarks, pruebas)
+        self.data_dir = Path(data_dir) if data_dir is not None else self.base_dir / "data"
         self.user_dict_path = self.data_dir / "user_dictionary.json"
-
-        # Diccionarios internos
-        self.dictionary: Dict[str, str] = {}
-        self.user_words: Set[str] = set()
+        self.user_journal_path = self.data_dir / "user_dictionary.journal"
+        self.user_lock_path = self.data_dir / "user_dictionary.lock"
+
+        # Idiomas instalados (español en data/, el resto en data/languages/).
+        # Solo el activo está abierto; los que se dejan de usar se guardan
+        # en una caché con tope de memoria para volver a ellos al instante
+        self.packs: Dict[str, LanguagePack] = discover_packs(self.data_dir)
+        self.language = DEFAULT_LANGUAGE
+        self._use_pack(self.packs[DEFAULT_LANGUAGE])
+        self._pack_cache = PackCache(budget=64 * 2**20)
+        # Correcciones hechas por palabra (SQLite)
+        self.usage_stats_path = self.data_dir / "usage_stats.db"
+
+        # Diccionarios internos: el base se consulta sobre el mmap sin
+        # convertirlo en dict; el de usuario es pequeño y va en memoria.
+        # Se publican juntos en una versión inmutable: leer es tomar la
+        # referencia, escribir es publicar una copia
+        self._snapshot = DictionarySnapshot.create(0, CompiledDictionary.empty(), {})
+        # Las escrituras se hacen de una en una; las lecturas no esperan
+        self._write_lock = threading.RLock()
+        # Las recargas también, pero sin bloquear las escrituras mientras cargan
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[DictionaryWatcher] = None
+        self._watch_interval = 2.0
+
+        # Funciones a avisar de cada cambio: callback(tipo, palabra) con
+        # tipo 'add', 'remove' o 'reset' (palabra vacía)
+        self._change_callbacks: List[Callable[[str, str], None]] = []
+
+        # Índice de búsqueda de la tabla (se construye al primer uso)
+        self._search_index: Optional[SearchIndex] = None
+        self._search_lock = threading.Lock()
+
+        # Etapa opcional de desambiguación por contexto
+        self.context_enabled = True
+
+        # Palabras más corregidas que se precargan en cada versión (nivel
+        # caliente, por delante del diccionario base)
+        self.hot_tier_size = 1000
 
         self._ensure_directories()
-        self._load_dictionaries()
+        if language != DEFAULT_LANGUAGE:
+            if language in self.packs:
+                self.language = language
+                self._use_pack(self.packs[language])
+            else:
+                print(f"[Aviso] Idioma '{language}' no instalado, se usa '{DEFAULT_LANGUAGE}'")
+        # Las ediciones del usuario van a un diario que se escribe en segundo plano
+        self.user_store = UserDictionaryStore(
+            self.user_dict_path, self.user_journal_path, self.user_lock_path
+        )
+        # Las estadísticas de uso también se escriben en segundo plano
+        self.usage_stats = UsageStats(self.usage_stats_path)
+        self.usage_stats.load()
+        self._snapshot = self._build_snapshot()
+
+    # ────────────────────────────────
+    # Diccionarios publicados
+    # ────────────────────────────────
+    @property
+    def base_dictionary(self) -> CompiledDictionary:
+        return self._snapshot.base
+
+    @property
+    def user_dictionary(self) -> Mapping[str, str]:
+        """Palabras del usuario (de solo lectura: se cambian con add_word/remove_word)."""
+        return self._snapshot.user
+
+    @property
+    def user_words(self):
+        return self._snapshot.user.keys()
+
+    @property
+    def context_model(self) -> Optional[ContextModel]:
+        return self._snapshot.context_model
+
+    def snapshot(self) -> DictionarySnapshot:
+        """Versión actual de los diccionarios (para varias consultas coherentes)."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def _use_pack(self, pack: LanguagePack):
+        """Apunta las rutas del diccionario base y de contexto a un idioma."""
+        self.default_dict_path = pack.dictionary_path
+        # Versión compilada del diccionario base (se regenera si cambia el JSON)
+        self.compiled_dict_path = pack.compiled_path
+        # Reglas de contexto para palabras ambiguas (el/él, si/sí...)
+        self.context_rules_path = pack.context_rules_path
+        self.compiled_context_path = pack.compiled_context_path
+
+    def _publish(self, snapshot: DictionarySnapshot):
+        # Una sola asignación: los lectores ven la versión anterior o la
+        # nueva, nunca una mezcla. Se llama con _write_lock tomado
+        self._snapshot = snapshot
 
     # ────────────────────────────────
     # Inicialización de archivos
@@ -107,73 +212,317 @@ class DictionaryManager:
     # ────────────────────────────────
     # Carga y actualización
     # ────────────────────────────────
-    def _load_dictionaries(self):
-        """Carga ambos diccionarios y los fusiona (prioriza el usuario)."""
-        default_dict = {}
+    def _build_snapshot(self, reloading: bool = False) -> DictionarySnapshot:
+        """
+        Carga ambos diccionarios sin publicarlos (el usuario tiene prioridad
+        al consultar). reloading: recarga en caliente; el base se recompila
+        en otro proceso y, si falla, se sigue con el actual.
+        """
+        base_dict: Optional[CompiledDictionary] = None
         user_dict = {}
 
-        # 1. Intentar cargar el diccionario por defecto de forma segura
+        # 1. Abrir el diccionario base compilado (se recompila si el JSON cambió)
         try:
-            default_dict = json.loads(self.default_dict_path.read_text(encoding="utf-8"))
+            base_dict = self._open_base_dictionary(in_subprocess=reloading)
         except Exception as e:
-            print(f"[Error] No se pudo cargar el diccionario por defecto: {e}")
-            # Si el diccionario por defecto falla, es un problema mayor.
-            # Podríamos intentar recrearlo.
-            self._create_default_dictionary()
-            try:
-                default_dict = json.loads(self.default_dict_path.read_text(encoding="utf-8"))
-            except Exception as e2:
-                print(f"[Error CRÍTICO] No se pudo recrear ni cargar el diccionario por defecto: {e2}")
-
-        # 2. Intentar cargar el diccionario del usuario de forma segura
+            if reloading:
+                # Un archivo a medio desplegar no debe sustituir al que funciona
+                print(f"[Error] No se pudo recargar el diccionario por defecto, se mantiene el actual: {e}")
+                base_dict = self.base_dictionary
+            else:
+                print(f"[Error] No se pudo cargar el diccionario por defecto: {e}")
+                # Si el diccionario por defecto falla, es un problema mayor.
+                # Podríamos intentar recrearlo (solo el español trae uno de serie).
+                if self.language == DEFAULT_LANGUAGE:
+                    self._create_default_dictionary()
+                    try:
+                        base_dict = self._open_base_dictionary()
+                    except Exception as e2:
+                        print(f"[Error CRÍTICO] No se pudo recrear ni cargar el diccionario por defecto: {e2}")
+
+        # 2. Cargar el diccionario del usuario (JSON + diario de cambios)
         try:
-            user_dict = json.loads(self.user_dict_path.read_text(encoding="utf-8"))
+            user_dict = self.user_store.load()
         except Exception as e:
             print(f"[Error] No se pudo cargar el diccionario de usuario: {e}")
-            # Si el archivo del usuario está corrupto, lo reseteamos a un JSON vacío
-            self.user_dict_path.write_text("{}", encoding="utf-8")
             user_dict = {}
 
-        # 3. Fusionar los diccionarios, dando prioridad al del usuario
-        self.user_words = set(user_dict.keys())
-        self.dictionary = {**default_dict, **user_dict}
+        # 3. Tabla de contexto (opcional: sin ella no se desambigua)
+        context_model = None
+        try:
+            context_model = self._open_context_model()
+        except Exception as e:
+            print(f"[Error] No se pudo cargar la tabla de contexto: {e}")
+            if reloading:
+                context_model = self.context_model
+
+        return DictionarySnapshot.create(
+            self._snapshot.version + 1,
+            base_dict if base_dict is not None else CompiledDictionary.empty(),
+            user_dict,
+            context_model,
+            # 4. Nivel caliente: las palabras más corregidas hasta ahora
+            self._hot_words(),
+        )
 
+    def _hot_words(self) -> List[str]:
+        return [w for w, _ in self.usage_stats.most_used(self.hot_tier_size)]
 
-    def reload(self):
-        """Recarga los diccionarios desde disco."""
-        self._load_dictionaries()
+    def _open_base_dictionary(self, in_subprocess: bool = False) -> CompiledDictionary:
+        """
+        Abre el diccionario base compilado, recompilándolo si hace falta.
+        El actual no se cierra: puede haber correcciones en curso usándolo
+        (se libera solo cuando deja de usarse).
+        """
+        current = self.base_dictionary
+        try:
+            if current.count and current.source_hash == file_hash(self.default_dict_path):
+                return current
+        except OSError:
+            pass
+        return CompiledDictionary.load_or_build(self.compiled_dict_path, self.default_dict_path,
+                                                in_subprocess=in_subprocess)
+
+    def _open_context_model(self) -> Optional[ContextModel]:
+        """Abre la tabla de contexto compilada, recompilándola si hace falta."""
+        current = self.context_model
+        if not self.context_rules_path.exists():
+            return None
+        if current is not None and current.source_hash == file_hash(self.context_rules_path):
+            return current
+        return ContextModel.load_or_build(self.compiled_context_path, self.context_rules_path)
+
+    def reload(self, force: bool = True) -> bool:
+        """
+        Recarga los diccionarios desde disco.
+
+        La versión nueva se construye aparte (puede tardar si hay que
+        recompilar) y se publica con una sola asignación: las correcciones
+        en curso terminan con la anterior y ninguna ve una a medio cargar.
+        Se construye sin _write_lock, así que add_word/remove_word no
+        esperan a la recarga; si alguna publica entretanto, se vuelve a
+        construir para no perderla (lo ya compilado no se recompila).
+        Con force=False no se publica nada si el contenido no cambió.
+        Devuelve True si se publicó una versión nueva.
+        """
+        with self._reload_lock:
+            while True:
+                # Lo pendiente de escribir debe estar en disco antes de releerlo
+                self.user_store.flush()
+                current = self._snapshot
+                snapshot = self._build_snapshot(reloading=True)
+                if not force and snapshot.same_content(current):
+                    return False
+                with self._write_lock:
+                    if self._snapshot is current:
+                        self._publish(snapshot)
+                        break
+
+        index = self._search_index
+        if index is not None and index.base is not snapshot.base:
+            # El base cambió: el índice anterior ya no sirve
+            self._search_index = None
+            self.prepare_search_index()
+
+        self._notify('reset')
+        return True
+
+    def start_watching(self, poll_interval: float = 2.0) -> DictionaryWatcher:
+        """
+        Recarga en segundo plano cuando cambian los archivos de data/
+        (diccionario base, de usuario o reglas de contexto).
+        """
+        self._watch_interval = poll_interval
+        if self._watcher is None:
+            self._watcher = DictionaryWatcher(
+                [self.default_dict_path, self.user_dict_path, self.context_rules_path],
+                self._on_files_changed,
+                poll_interval=poll_interval,
+            )
+            self._watcher.start()
+        return self._watcher
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _on_files_changed(self, paths):
+        # Nuestras propias escrituras (compactación del diario) también
+        # llegan aquí: solo se publica si el contenido cambió de verdad
+        if self.reload(force=False):
+            print(f"✓ Diccionarios recargados ({', '.join(sorted(p.name for p in paths))})")
+
+    # ────────────────────────────────
+    # Idiomas
+    # ────────────────────────────────
+    @property
+    def memory_budget(self) -> int:
+        """Bytes que pueden ocupar los idiomas abiertos (el activo incluido)."""
+        return self._pack_cache.budget
+
+    @memory_budget.setter
+    def memory_budget(self, value: int):
+        self._pack_cache.budget = value
+
+    def refresh_languages(self) -> Dict[str, LanguagePack]:
+        """Vuelve a buscar los paquetes instalados en data/languages/."""
+        self.packs = discover_packs(self.data_dir)
+        return self.packs
+
+    def switch_language(self, code: str) -> Tuple[bool, str]:
+        """
+        Cambia el idioma del diccionario base. Si el idioma se usó hace poco
+        sigue abierto y el cambio es inmediato; si no, se abre (y se compila
+        la primera vez). El diccionario de usuario es el mismo para todos.
+        """
+        code = code.lower()
+        pack = self.packs.get(code) or self.refresh_languages().get(code)
+        if pack is None:
+            return False, f"El idioma '{code}' no está instalado."
+
+        with self._write_lock:
+            if code == self.language:
+                return True, f"✅ Idioma: {pack.name}"
+
+            loaded = self._pack_cache.take(code)
+            if loaded is None:
+                try:
+                    # En otro proceso si hay que compilar: no frena la corrección
+                    loaded = pack.open(in_subprocess=True)
+                except Exception as e:
+                    return False, f"Error al cargar el idioma '{code}': {e}"
+
+            current = self._snapshot
+            self._use_pack(pack)
+            self._publish(DictionarySnapshot.create(
+                current.version + 1, loaded.base, current.user, loaded.context_model,
+                self._hot_words(),
+            ))
+            # El idioma anterior queda abierto mientras quepa en el presupuesto
+            previous_code, self.language = self.language, code
+            self._pack_cache.put(previous_code, LoadedPack(current.base, current.context_model),
+                                 active_bytes=loaded.nbytes)
+
+            if self._search_index is not None:
+                self._search_index = None
+                self.prepare_search_index()
+
+        # Fuera del cerrojo: el hilo del vigilante puede estar esperándolo
+        if self._watcher is not None:
+            self.stop_watching()
+            self.start_watching(self._watch_interval)
+
+        self._notify('reset')
+        return True, f"✅ Idioma: {pack.name}"
+
+    def cycle_language(self, enabled: Sequence[str]) -> Tuple[bool, str]:
+        """Pasa al siguiente idioma de 'enabled' (en ese orden) que esté instalado."""
+        codes = [c for c in enabled if c in self.packs]
+        if not codes:
+            return False, "No hay idiomas activados."
+        position = codes.index(self.language) + 1 if self.language in codes else 0
+        return self.switch_language(codes[position % len(codes)])
+
+    def preload_languages(self, codes: Sequence[str]):
+        """
+        Abre en segundo plano los idiomas activados que no están en uso,
+        para que cambiar a ellos sea inmediato (sin pasar del presupuesto).
+        """
+        def run():
+            for code in codes:
+                pack = self.packs.get(code)
+                if pack is None or code == self.language or code in self._pack_cache:
+                    continue
+                try:
+                    loaded = pack.open(in_subprocess=True)
+                except Exception as e:
+                    print(f"[Error] No se pudo precargar el idioma '{code}': {e}")
+                    continue
+                with self._write_lock:
+                    if code == self.language or code in self._pack_cache:
+                        # Se cambió a él mientras tanto
+                        continue
+                    snapshot = self._snapshot
+                    active = LoadedPack(snapshot.base, snapshot.context_model).nbytes
+                    if active + self._pack_cache.nbytes + loaded.nbytes > self.memory_budget:
+                        # Ya no cabe: se abrirá al cambiar a él
+                        break
+                    self._pack_cache.put(code, loaded, active_bytes=active)
+
+        threading.Thread(target=run, daemon=True, name="LanguagePreloader").start()
+
+    def close(self):
+        """Escribe las ediciones pendientes y libera el diccionario base."""
+        self.stop_watching()
+        self.user_store.close()
+        self.usage_stats.close()
+        self._pack_cache.clear()
+        snapshot = self._snapshot
+        snapshot.base.close()
+        if snapshot.context_model is not None:
+            snapshot.context_model.close()
+
+    # ────────────────────────────────
+    # Avisos de cambios
+    # ────────────────────────────────
+    def add_change_callback(self, callback: Callable[[str, str], None]):
+        """Registra una función a la que avisar de altas, bajas y recargas."""
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback: Callable[[str, str], None]):
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
+
+    def _notify(self, kind: str, word: str = ""):
+        for callback in list(self._change_callbacks):
+            try:
+                callback(kind, word)
+            except Exception as e:
+                print(f"[Error] Avisando de un cambio del diccionario: {e}")
 
     # ────────────────────────────────
     # Operaciones CRUD de palabras
     # ────────────────────────────────
-    def add_word(self, word_without: str, word_with: str) -> Tuple[bool, str]:
-        """Agrega una palabra personalizada al diccionario del usuario."""
+    def _validate_entry(self, word_without: str, word_with: str) -> Tuple[Optional[str], str, str]:
+        """
+        Normaliza y valida una palabra nueva.
+        Returns: (mensaje de error o None, sin tilde, con tilde)
+        """
         word_without = word_without.strip().lower()
         word_with = word_with.strip()
 
         if not word_without or not word_with:
-            return False, "Las palabras no pueden estar vacías."
+            return "Las palabras no pueden estar vacías.", word_without, word_with
 
         if not any(c in "áéíóúÁÉÍÓÚüÜñÑ" for c in word_with):
-            return False, "La palabra corregida debe contener al menos una tilde o carácter especial."
+            return ("La palabra corregida debe contener al menos una tilde o carácter especial.",
+                    word_without, word_with)
 
-        if word_without in self.dictionary:
+        existing = self._lookup(word_without)
+        if existing is not None:
             tipo = "usuario" if word_without in self.user_words else "base"
-            return False, f"Esa palabra ya existe en el diccionario {tipo}: {self.dictionary[word_without]}"
-
-        try:
-            # Recargamos el diccionario de usuario por si ha sido modificado externamente
-            user_dict = json.loads(self.user_dict_path.read_text(encoding="utf-8"))
-            user_dict[word_without] = word_with
+            return (f"Esa palabra ya existe en el diccionario {tipo}: {existing}",
+                    word_without, word_with)
 
-            self.user_dict_path.write_text(
-                json.dumps(user_dict, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
+        return None, word_without, word_with
 
-            # Actualizamos la versión en memoria
-            self.dictionary[word_without] = word_with
-            self.user_words.add(word_without)
+    def add_word(self, word_without: str, word_with: str) -> Tuple[bool, str]:
+        """Agrega una palabra personalizada al diccionario del usuario."""
+        try:
+            with self._write_lock:
+                # Se valida con el cerrojo tomado: dos altas a la vez de la
+                # misma palabra no pueden pasar las dos
+                error, word_without, word_with = self._validate_entry(word_without, word_with)
+                if error:
+                    return False, error
+
+                # Solo se añade una línea al diario, en segundo plano
+                self.user_store.add(word_without, word_with)
+
+                # Publicamos una versión nueva con la palabra
+                self._publish(self._snapshot.with_user_words(added={word_without: word_with}))
+            self._notify('add', word_without)
             return True, f"✅ '{word_with}' añadida correctamente."
 
         except Exception as e:
@@ -183,47 +532,223 @@ class DictionaryManager:
         """Elimina una palabra del diccionario de usuario."""
         word_without = word_without.strip().lower()
 
-        if word_without not in self.user_words:
-            return False, "Solo puedes eliminar palabras que hayas agregado."
-
         try:
-            # Recargamos para evitar conflictos
-            user_dict = json.loads(self.user_dict_path.read_text(encoding="utf-8"))
-            user_dict.pop(word_without, None)
+            with self._write_lock:
+                if word_without not in self.user_words:
+                    return False, "Solo puedes eliminar palabras que hayas agregado."
 
-            self.user_dict_path.write_text(
-                json.dumps(user_dict, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
-            
-            # Actualizamos la versión en memoria
-            self.dictionary.pop(word_without, None)
-            self.user_words.discard(word_without)
+                # Solo se añade una línea al diario, en segundo plano
+                self.user_store.remove(word_without)
+
+                # Publicamos una versión nueva sin la palabra
+                self._publish(self._snapshot.with_user_words(removed=[word_without]))
+            self._notify('remove', word_without)
 
             return True, f"✅ Palabra '{word_without}' eliminada correctamente."
 
         except Exception as e:
             return False, f"Error al eliminar palabra: {e}"
 
+    # ────────────────────────────────
+    # Importación y exportación masiva
+    # ────────────────────────────────
+    def import_words(self, path, max_reported: int = 20) -> Tuple[bool, str]:
+        """
+        Importa palabras desde un archivo CSV/TSV/JSONL leído en streaming.
+        Cada entrada se valida con las mismas reglas que add_word. Las
+        válidas se guardan de una sola vez; los conflictos se resumen en
+        el mensaje devuelto.
+        """
+        accepted: Dict[str, str] = {}
+        conflicts: List[str] = []
+        rejected = 0
+
+        try:
+            for line_no, word_without, word_with in dictionary_io.iter_entries(path):
+                error, key, value = self._validate_entry(word_without, word_with)
+                if error is None and key in accepted and accepted[key] != value:
+                    error = f"Repetida en el archivo con otro valor: {accepted[key]}"
+                if error:
+                    rejected += 1
+                    if len(conflicts) < max_reported:
+                        conflicts.append(f"Línea {line_no} ('{word_without}'): {error}")
+                    continue
+                accepted[key] = value
+        except Exception as e:
+            return False, f"Error al leer el archivo: {e}"
+
+        if accepted:
+            with self._write_lock:
+                try:
+                    # Un único lote en el diario para todo el archivo
+                    self.user_store.add_many(accepted.items())
+                except Exception as e:
+                    return False, f"Error al guardar palabras: {e}"
+
+                self._publish(self._snapshot.with_user_words(added=accepted))
+            self._notify('reset')
+
+        message = f"✅ {len(accepted)} palabras importadas, {rejected} rechazadas."
+        if conflicts:
+            message += "\n\n" + "\n".join(conflicts)
+            if rejected > len(conflicts):
+                message += f"\n... y {rejected - len(conflicts)} más."
+        return bool(accepted) or not rejected, message
+
+    def export_words(self, path, include_base: bool = False) -> Tuple[bool, str]:
+        """Exporta las palabras del usuario (o todas) a CSV/TSV/JSONL."""
+        if include_base:
+            entries = ((w, c) for w, c, _ in self.iter_all_words())
+        else:
+            entries = sorted(self.user_dictionary.items())
+
+        try:
+            count = dictionary_io.write_entries(path, entries)
+        except Exception as e:
+            return False, f"Error al exportar: {e}"
+        return True, f"✅ {count} palabras exportadas."
+
     # ────────────────────────────────
     # Búsqueda y utilidades
     # ────────────────────────────────
-    def get_corrected_word(self, word: str) -> str:
-        """Devuelve la palabra corregida manteniendo la capitalización."""
-        word_lower = word.lower()
-        corrected = self.dictionary.get(word_lower, word)
-
-        # Mantener formato de mayúsculas
-        if word.isupper():
-            return corrected.upper()
-        # Evitar error si la palabra es de un solo caracter
-        elif len(word) > 0 and word[0].isupper():
-            return corrected.capitalize()
+    def _lookup(self, word_lower: str, snapshot: Optional[DictionarySnapshot] = None) -> Optional[str]:
+        """Busca una palabra (ya en minúsculas) en usuario y después en base."""
+        if snapshot is None:
+            snapshot = self._snapshot
+        corrected = snapshot.user.get(word_lower)
+        if corrected is None:
+            corrected = snapshot.base.get(word_lower)
         return corrected
 
+    def get_corrected_word(self, word: str, previous: Sequence[str] = ()) -> str:
+        """
+        Devuelve la palabra corregida manteniendo la capitalización.
+        previous: palabras anteriores; las palabras ambiguas (el/él, si/sí...)
+        solo se corrigen si la tabla de contexto lo respalda.
+        """
+        # Una sola lectura: toda la consulta usa la misma versión
+        snapshot = self._snapshot
+        if self.context_enabled:
+            return snapshot.get_corrected_word(word, previous)
+        corrected, _ = snapshot.lookup(word)
+        return word if corrected is None else corrected
+
+    def might_correct(self, word: str) -> bool:
+        """
+        Comprobación previa, del orden de un microsegundo: False si la
+        palabra seguro que no está en ningún diccionario.
+        """
+        return self._snapshot.might_correct(word)
+
+    # ────────────────────────────────
+    # Estadísticas de uso
+    # ────────────────────────────────
+    def record_correction(self, word: str):
+        """Cuenta una corrección de 'word' (se guarda en segundo plano)."""
+        self.usage_stats.record(word.lower())
+
+    def usage_count(self, word_lower: str) -> int:
+        """Veces que se ha corregido una palabra (sin tilde, en minúsculas)."""
+        return self.usage_stats.count(word_lower)
+
+    def most_used(self, limit: int = 10) -> List[Tuple[str, str, int]]:
+        """Palabras más corregidas: (sin tilde, con tilde, veces)."""
+        snapshot = self._snapshot
+        result = []
+        for word, count in self.usage_stats.most_used(limit):
+            corrected = self._lookup(word, snapshot)
+            if corrected is not None:
+                result.append((word, corrected, count))
+        return result
+
+    def is_ambiguous(self, word_lower: str) -> bool:
+        """Indica si la corrección de la palabra depende del contexto."""
+        context_model = self.context_model
+        return (self.context_enabled and context_model is not None
+                and context_model.is_ambiguous(word_lower))
+
+    def correct_text(self, text: str, previous: Sequence[str] = ()) -> Tuple[str, List[CorrectionSpan]]:
+        """Corrige un texto completo: (texto corregido, tramos cambiados)."""
+        return correct_text(text, self, previous)
+
+    def base_word_count(self) -> int:
+        """Palabras del sistema que se ven (las tapadas por el usuario no cuentan)."""
+        snapshot = self._snapshot
+        return snapshot.base.count - snapshot.shadowed
+
+    def user_word_count(self) -> int:
+        return len(self.user_dictionary)
+
+    def word_count(self) -> int:
+        """Total de palabras distintas, sin recorrer los diccionarios."""
+        snapshot = self._snapshot
+        return snapshot.base.count - snapshot.shadowed + len(snapshot.user)
+
+    # ────────────────────────────────
+    # Búsqueda
+    # ────────────────────────────────
+    def prepare_search_index(self):
+        """Construye el índice de búsqueda en segundo plano (tarda ~1 s con 200.000 palabras)."""
+        threading.Thread(target=self._get_search_index, daemon=True,
+                         name="SearchIndexBuilder").start()
+
+    def _get_search_index(self) -> Optional[SearchIndex]:
+        base = self.base_dictionary
+        # Si se está construyendo en segundo plano, se espera a que termine
+        with self._search_lock:
+            index = self._search_index
+            if index is None or index.base is not base:
+                try:
+                    index = SearchIndex(base)
+                except Exception as e:
+                    # El diccionario base se cerró mientras se recorría (recarga)
+                    print(f"[Error] No se pudo construir el índice de búsqueda: {e}")
+                    return None
+                self._search_index = index
+            return index
+
+    def search(self, query: str) -> Tuple[array, List[str]]:
+        """
+        Busca 'query' sin distinguir mayúsculas ni tildes, en la palabra sin
+        tilde y en la corregida (por prefijo si tiene menos de 3 letras, si
+        no por subcadena).
+
+        Devuelve (índices del diccionario base, palabras del usuario), ambos
+        ordenados. Las palabras del sistema tapadas por el usuario solo
+        aparecen entre las del usuario.
+        """
+        snapshot = self._snapshot
+        index = self._get_search_index()
+        if index is None or index.base is not snapshot.base:
+            # Sin índice, o recargado entre medias: solo las del usuario
+            base_ids = array("I")
+        else:
+            base_ids = index.search(query)
+
+        user = snapshot.user
+        if snapshot.shadowed and base_ids:
+            base = snapshot.base
+            for word in user:
+                if word in base:
+                    shadowed = base.rank(word)
+                    position = bisect.bisect_left(base_ids, shadowed)
+                    if position < len(base_ids) and base_ids[position] == shadowed:
+                        del base_ids[position]
+
+        return base_ids, search_words(list(user.items()), query)
+
     def get_all_words(self) -> Dict[str, Tuple[str, bool]]:
         """Devuelve todas las palabras con info si son del usuario."""
-        return {
-            w: (c, w in self.user_words)
-            for w, c in self.dictionary.items()
-        }
\ No newline at end of file
+        snapshot = self._snapshot
+        words = {w: (c, False) for w, c in snapshot.base.items()}
+        words.update((w, (c, True)) for w, c in snapshot.user.items())
+        return words
+
+    def iter_all_words(self) -> Iterator[Tuple[str, str, bool]]:
+        """Recorre todas las palabras en orden (sin tilde, con tilde, es_usuario)
+        sin construir un dict con el diccionario completo."""
+        snapshot = self._snapshot
+        user = snapshot.user
+        base = ((w, c, False) for w, c in snapshot.base.items() if w not in user)
+        own = ((w, c, True) for w, c in sorted(user.items()))
+        return heapq.merge(base, own)
@@ -0,0 +1,186 @@
+# core/dictionary_snapshot.py
+
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .compiled_dictionary import CompiledDictionary
+from .context_model import ContextModel
+
+# Formas escritas recordadas por versión (se vacía al llenarse)
+VARIANT_CACHE_SIZE = 50_000
+
+# Forma escrita -> (corrección con su capitalización o None, es ambigua)
+Variant = Tuple[Optional[str], bool]
+
+
+def apply_case(original: str, corrected: str) -> str:
+    """
+    Copia a 'corrected' la capitalización de 'original' carácter a
+    carácter: "CamionES" -> "CamiónES", "mySQL"... Quitar una tilde no
+    cambia el número de caracteres; si la corrección es más larga, el
+    resto se deja como está.
+    """
+    if not original or original.islower():
+        return corrected
+    if original.isupper():
+        return corrected.upper()
+    if original[0].isupper() and original[1:].islower():
+        return corrected[:1].upper() + corrected[1:]
+    mask = "".join(c.upper() if o.isupper() else c for o, c in zip(original, corrected))
+    return mask + corrected[len(original):]
+
+
+class DictionarySnapshot(NamedTuple):
+    """
+    Versión inmutable de los diccionarios.
+
+    Una vez publicada nadie la modifica: cada alta, baja o recarga crea
+    una copia (copy-on-write) con el número de versión siguiente y la
+    publica con una sola asignación. Quien lee toma la referencia actual
+    sin cerrojos y puede hacer varias consultas seguidas sabiendo que
+    ninguna cambia por debajo. El base y la tabla de contexto son de solo
+    lectura y se comparten entre versiones; solo se copia el diccionario
+    del usuario, que es pequeño.
+
+    'variants' recuerda cada forma escrita (camion, Camion, CAMION...) con
+    su corrección ya capitalizada: repetir una palabra es una sola
+    consulta a un dict. Las del usuario se calculan al crear la versión;
+    las del base, que puede tener millones de entradas mapeadas en
+    memoria, la primera vez que se escriben. Al publicarse otra versión
+    la caché se descarta con ella.
+
+    'hot' es el nivel caliente: las formas de las palabras que más se
+    corrigen (según UsageStats), calculadas al crear la versión. Se
+    consulta antes que la caché y nunca se vacía, así que lo habitual no
+    llega al base ni siquiera recién arrancado.
+    """
+
+    version: int
+    base: CompiledDictionary
+    user: Mapping[str, str]                 # de solo lectura (MappingProxyType)
+    context_model: Optional[ContextModel]
+    shadowed: int                           # palabras de usuario que también están en el base
+    variants: Dict[str, Variant]            # caché de formas escritas (ver arriba)
+    hot_words: Tuple[str, ...]              # palabras más corregidas, de más a menos
+    hot: Mapping[str, Variant]              # sus formas, precalculadas
+
+    @classmethod
+    def create(cls, version: int, base: CompiledDictionary, user: Mapping[str, str],
+               context_model: Optional[ContextModel] = None,
+               hot_words: Sequence[str] = ()) -> "DictionarySnapshot":
+        user = dict(user)
+        shadowed = sum(1 for w in user if w in base)
+        hot_words = tuple(hot_words)
+        return cls(version, base, MappingProxyType(user), context_model, shadowed,
+                   _user_variants(user, context_model), hot_words,
+                   MappingProxyType(_hot_variants(hot_words, base, user, context_model)))
+
+    def lookup(self, word: str) -> Variant:
+        """
+        Corrección de 'word' tal como se escribió, con su capitalización
+        (None si no hay), y si es ambigua (depende del contexto).
+        """
+        variant = self.hot.get(word)
+        if variant is not None:
+            return variant
+        variant = self.variants.get(word)
+        if variant is not None:
+            return variant
+
+        word_lower = word.lower()
+        corrected = self.user.get(word_lower)
+        if corrected is None:
+            corrected = self.base.get(word_lower)
+        if corrected is not None:
+            corrected = apply_case(word, corrected)
+        variant = (corrected, self.context_model is not None and self.context_model.is_ambiguous(word_lower))
+
+        variants = self.variants
+        if len(variants) >= VARIANT_CACHE_SIZE:
+            variants.clear()
+        variants[word] = variant
+        return variant
+
+    def get_corrected_word(self, word: str, previous: Sequence[str] = ()) -> str:
+        """
+        Corrección de 'word' con su capitalización (o 'word' si no hay).
+        Las ambiguas solo se corrigen si la tabla de contexto lo respalda
+        con las palabras anteriores ('previous').
+        """
+        corrected, ambiguous = self.lookup(word)
+        if corrected is None:
+            return word
+        if ambiguous:
+            score = self.context_model.score(word.lower(), previous)
+            if score is None or score <= 0:
+                return word
+        return corrected
+
+    def is_ambiguous(self, word_lower: str) -> bool:
+        """Indica si la corrección de la palabra depende del contexto."""
+        return self.context_model is not None and self.context_model.is_ambiguous(word_lower)
+
+    def might_correct(self, word: str) -> bool:
+        """
+        False si 'word' seguro que no tiene corrección. Sin búsqueda en el
+        base: basta la caché de formas o el filtro de Bloom del compilado.
+        """
+        variant = self.hot.get(word) or self.variants.get(word)
+        if variant is not None:
+            return variant[0] is not None
+        word_lower = word.lower()
+        return word_lower in self.user or self.base.might_contain(word_lower)
+
+    def with_user_words(self, added: Optional[Mapping[str, str]] = None,
+                        removed: Iterable[str] = ()) -> "DictionarySnapshot":
+        """Copia con palabras de usuario añadidas y/o quitadas (versión siguiente)."""
+        user = dict(self.user)
+        shadowed = self.shadowed
+        removed = list(removed)
+
+        for word in removed:
+            if user.pop(word, None) is not None and word in self.base:
+                shadowed -= 1
+        for word, value in (added or {}).items():
+            if word not in user and word in self.base:
+                shadowed += 1
+            user[word] = value
+
+        hot = self.hot
+        if not set(self.hot_words).isdisjoint([*removed, *(added or {})]):
+            # Solo se recalcula si cambia alguna palabra caliente
+            hot = MappingProxyType(_hot_variants(self.hot_words, self.base, user, self.context_model))
+
+        return self._replace(version=self.version + 1, user=MappingProxyType(user), shadowed=shadowed,
+                             variants=_user_variants(user, self.context_model), hot=hot)
+
+    def same_content(self, other: "DictionarySnapshot") -> bool:
+        return (self.base is other.base and self.context_model is other.context_model
+                and self.user == other.user)
+
+
+def _user_variants(user: Mapping[str, str], context_model: Optional[ContextModel]) -> Dict[str, Variant]:
+    """Formas en minúsculas, Título y MAYÚSCULAS de las palabras del usuario."""
+    variants: Dict[str, Variant] = {}
+    for word, corrected in user.items():
+        ambiguous = context_model is not None and context_model.is_ambiguous(word)
+        for form in (word, word[:1].upper() + word[1:], word.upper()):
+            variants[form] = (apply_case(form, corrected), ambiguous)
+    return variants
+
+
+def _hot_variants(words: Sequence[str], base: CompiledDictionary, user: Mapping[str, str],
+                  context_model: Optional[ContextModel]) -> Dict[str, Variant]:
+    """Formas de las palabras calientes (el usuario manda sobre el base)."""
+    variants: Dict[str, Variant] = {}
+    for word in words:
+        corrected = user.get(word)
+        if corrected is None:
+            corrected = base.get(word)
+        if corrected is None:
+            # Ya no está en ningún diccionario
+            continue
+        ambiguous = context_model is not None and context_model.is_ambiguous(word)
+        for form in (word, word[:1].upper() + word[1:], word.upper()):
+            variants[form] = (apply_case(form, corrected), ambiguous)
+    return variants
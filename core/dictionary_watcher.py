@@ -0,0 +1,212 @@
+# core/dictionary_watcher.py
+"""
+Vigilancia de los archivos de diccionario.
+
+En Linux se usa inotify (por ctypes, sin dependencias); en el resto de
+sistemas, o si inotify no está disponible, se comprueba periódicamente la
+fecha de modificación, el tamaño y el inodo de cada archivo.
+
+Se vigilan las carpetas y no los archivos: las herramientas de despliegue
+suelen reemplazar el archivo (escribir un temporal y renombrarlo) y un
+vigilante sobre el archivo viejo no se enteraría.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# ────────────────────────────────
+# inotify (Linux)
+# ────────────────────────────────
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT = struct.Struct("iIII")
+
+
+def _load_inotify():
+    """Devuelve libc si tiene inotify, o None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class DictionaryWatcher:
+    """
+    Llama a callback(rutas_cambiadas) cuando cambia alguno de los archivos.
+
+    Los cambios se agrupan: se espera a que pasen 'debounce' segundos sin
+    cambios nuevos (una copia grande genera muchos eventos). El callback se
+    ejecuta en el hilo del vigilante, así que puede tardar sin bloquear a
+    nadie.
+    """
+
+    def __init__(self, paths: Iterable[Union[str, Path]], callback: Callable[[Set[Path]], None],
+                 poll_interval: float = 2.0, debounce: float = 0.5, use_inotify: bool = True):
+        self.paths = [Path(p).resolve() for p in paths]
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.mode = ""   # 'inotify' o 'polling', al arrancar
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake: Optional[Tuple[int, int]] = None
+        self._watches: Dict[int, Path] = {}   # descriptor de inotify -> carpeta
+
+    # ────────────────────────────────
+    # Ciclo de vida
+    # ────────────────────────────────
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+
+        inotify_fd = self._open_inotify() if self.use_inotify else None
+        self.mode = "inotify" if inotify_fd is not None else "polling"
+        if inotify_fd is not None:
+            self._wake = os.pipe()
+            target, args = self._run_inotify, (inotify_fd,)
+        else:
+            target, args = self._run_polling, ()
+
+        self._thread = threading.Thread(target=target, args=args, daemon=True,
+                                        name="DictionaryWatcher")
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        if self._wake is not None:
+            os.write(self._wake[1], b"x")
+        self._thread.join(timeout=5)
+        self._thread = None
+        if self._wake is not None:
+            for fd in self._wake:
+                os.close(fd)
+            self._wake = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    # ────────────────────────────────
+    # Avisos
+    # ────────────────────────────────
+    def _fire(self, changed: Set[Path]):
+        try:
+            self.callback(changed)
+        except Exception as e:
+            print(f"[Error] Recargando tras un cambio en {', '.join(p.name for p in changed)}: {e}")
+
+    # ────────────────────────────────
+    # inotify
+    # ────────────────────────────────
+    def _open_inotify(self) -> Optional[int]:
+        libc = _load_inotify()
+        if libc is None:
+            return None
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+
+        self._watches = {}
+        for directory in {p.parent for p in self.paths}:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                print(f"[Aviso] inotify no puede vigilar {directory}: "
+                      f"{os.strerror(ctypes.get_errno())}; se usa sondeo")
+                os.close(fd)
+                return None
+            self._watches[wd] = directory
+        return fd
+
+    def _run_inotify(self, fd: int):
+        watched = set(self.paths)
+        wake_fd = self._wake[0]
+        pending: Set[Path] = set()
+        try:
+            while not self._stop_event.is_set():
+                # Con cambios pendientes se espera solo hasta que venza el debounce
+                timeout = self.debounce if pending else None
+                ready, _, _ = select.select([fd, wake_fd], [], [], timeout)
+                if wake_fd in ready:
+                    break
+                if not ready:
+                    changed, pending = pending, set()
+                    self._fire(changed)
+                    continue
+                for path in self._read_events(fd):
+                    if path in watched:
+                        pending.add(path)
+        finally:
+            os.close(fd)
+
+    def _read_events(self, fd: int) -> List[Path]:
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        paths = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, _, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            directory = self._watches.get(wd)
+            if directory is not None and name:
+                paths.append(directory / os.fsdecode(name))
+        return paths
+
+    # ────────────────────────────────
+    # Sondeo (resto de sistemas)
+    # ────────────────────────────────
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _run_polling(self):
+        signatures = {p: self._signature(p) for p in self.paths}
+        pending: Set[Path] = set()
+        last_change = 0.0
+
+        while not self._stop_event.wait(self.debounce if pending else self.poll_interval):
+            for path in self.paths:
+                signature = self._signature(path)
+                if signature != signatures[path]:
+                    signatures[path] = signature
+                    pending.add(path)
+                    last_change = time.monotonic()
+
+            if pending and time.monotonic() - last_change >= self.debounce:
+                changed, pending = pending, set()
+                self._fire(changed)
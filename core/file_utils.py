@@ -0,0 +1,108 @@
+# core/file_utils.py
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Union
+
+# umask del proceso, para dar a los archivos nuevos los permisos de siempre
+# (os.umask solo se puede leer cambiándolo: se hace una vez al importar)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes):
+    """
+    Escribe un archivo de forma atómica: primero en un temporal del mismo
+    directorio y después os.replace. Si el proceso muere a mitad, el
+    archivo original queda intacto.
+
+    El archivo conserva sus permisos; uno nuevo recibe los de la umask
+    (mkstemp crearía el temporal con 0600).
+    """
+    path = Path(path)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Union[str, Path], text: str, encoding: str = "utf-8"):
+    """Versión de atomic_write_bytes para texto."""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+class FileLock:
+    """
+    Cerrojo exclusivo entre procesos basado en un archivo auxiliar.
+    Evita que dos instancias de la aplicación se pisen al escribir; dentro
+    del mismo proceso también excluye a los demás hilos.
+
+        with FileLock(ruta):
+            ...
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = None
+        self._thread_lock = threading.Lock()
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        try:
+            self._file = open(self.path, "a+b")
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        try:
+            if os.name == "nt":
+                import msvcrt
+                self._file.seek(0)
+                # LK_LOCK reintenta durante ~10 s antes de fallar
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        except BaseException:
+            self._file.close()
+            self._file = None
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            if os.name == "nt":
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+            self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
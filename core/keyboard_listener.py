@@ -1,18 +1,39 @@
 # core/keyboard_listener.py
 
-import keyboard
-import threading
+import sys
 from typing import Callable, Optional
 
+from .backends import KEY_DOWN, KeySource
+from .correction_worker import CorrectionWorker
+
 class KeyboardListener:
     """Escucha eventos del teclado globalmente y ejecuta acciones según teclas configuradas."""
     
-    def __init__(self, autocorrect_engine):
+    def __init__(self, autocorrect_engine, key_source: Optional[KeySource] = None,
+                 use_asyncio: bool = False):
         self.engine = autocorrect_engine
         self.is_listening = False
         self.toggle_callback: Optional[Callable] = None
         self.hotkey = "ctrl+shift+a"
-        self.trigger_handlers = []  # Para almacenar los manejadores de teclas
+        
+        # Atajo para pasar al siguiente idioma (None: desactivado)
+        self.language_callback: Optional[Callable] = None
+        self.language_hotkey: Optional[str] = "ctrl+shift+l"
+        
+        # Hook global de teclado (y ratón): por defecto, el del backend del motor
+        self.key_source = key_source if key_source is not None else autocorrect_engine.backend.key_source
+        
+        # Hilo único que procesa los triggers en orden (con use_asyncio,
+        # sobre un bucle de eventos con esperas cancelables)
+        if use_asyncio:
+            from .async_worker import AsyncCorrectionWorker
+            self.worker = AsyncCorrectionWorker(autocorrect_engine)
+        else:
+            self.worker = CorrectionWorker(autocorrect_engine)
+        
+        # Estado para el buffer de palabra del motor
+        self._pressed_modifiers = set()
+        self._last_window = None
 
         # Teclas que activan la corrección
         self.trigger_keys = [
@@ -21,6 +42,33 @@ class KeyboardListener:
             '!', '?', ')', ']', '}',
             'tab'
         ]
+        
+        # Triggers que cierran la frase: las palabras anteriores ya no son contexto
+        self.sentence_end_keys = {'enter', '.', '!', '?'}
+        
+        # Carácter que escribe cada trigger con nombre (el resto se escribe
+        # tal cual): el buffer cuenta cuánto texto hay tras cada palabra
+        self.trigger_chars = {'space': ' ', 'enter': '\n', 'tab': '\t'}
+        
+        # Teclas que mueven el cursor o cambian el texto sin que podamos
+        # seguirlo: invalidan el buffer de palabra
+        self.reset_keys = {
+            'left', 'right', 'up', 'down', 'home', 'end',
+            'page up', 'page down', 'delete', 'esc', 'insert'
+        }
+        
+        # Modificadores: no escriben nada por sí mismos
+        self.modifier_keys = {
+            'shift', 'left shift', 'right shift', 'caps lock',
+            'ctrl', 'left ctrl', 'right ctrl',
+            'alt', 'left alt', 'right alt', 'alt gr',
+            'windows', 'left windows', 'right windows'
+        }
+        self.shortcut_modifiers = {
+            'ctrl', 'left ctrl', 'right ctrl',
+            'alt', 'left alt', 'right alt', 'alt gr',
+            'windows', 'left windows', 'right windows'
+        }
     
     # -------------------------------
     # Configuración de callbacks
@@ -30,6 +78,23 @@ class KeyboardListener:
         """Establece el callback para cuando se active/desactive el autocorrector."""
         self.toggle_callback = callback
     
+    def set_language_callback(self, callback: Callable):
+        """Establece el callback del atajo de cambio de idioma."""
+        self.language_callback = callback
+    
+    def set_language_hotkey(self, hotkey: Optional[str]):
+        """Cambia (o desactiva con None) el atajo de cambio de idioma."""
+        if self.is_listening and self.language_hotkey:
+            try:
+                self.key_source.remove_hotkey(self.language_hotkey)
+            except Exception as e:
+                print(f"Advertencia al eliminar hotkey anterior: {e}")
+        
+        self.language_hotkey = hotkey.lower() if hotkey else None
+        
+        if self.is_listening and self.language_hotkey:
+            self.key_source.add_hotkey(self.language_hotkey, self._on_language_hotkey)
+    
     def set_hotkey(self, hotkey: str):
         """
         Cambia la combinación de teclas para activar/desactivar el autocorrector.
@@ -38,7 +103,7 @@ class KeyboardListener:
         if self.is_listening:
             # Eliminar el hotkey anterior si ya estaba escuchando
             try:
-                keyboard.remove_hotkey(self.hotkey)
+                self.key_source.remove_hotkey(self.hotkey)
             except Exception as e:
                 print(f"Advertencia al eliminar hotkey anterior: {e}")
         
@@ -46,7 +111,7 @@ class KeyboardListener:
         
         if self.is_listening:
             # Registrar el nuevo hotkey
-            keyboard.add_hotkey(self.hotkey, self._on_toggle_hotkey)
+            self.key_source.add_hotkey(self.hotkey, self._on_toggle_hotkey)
     
     # -------------------------------
     # Control del listener
@@ -58,14 +123,20 @@ class KeyboardListener:
             return
         
         try:
+            # Primero el worker: si el anterior sigue vivo no se instala nada
+            self.worker.start()
+            
             # Registrar hotkey para toggle
-            keyboard.add_hotkey(self.hotkey, self._on_toggle_hotkey)
+            self.key_source.add_hotkey(self.hotkey, self._on_toggle_hotkey)
+            if self.language_hotkey:
+                self.key_source.add_hotkey(self.language_hotkey, self._on_language_hotkey)
             
-            # Registrar triggers de corrección y guardar los handlers
-            for key in self.trigger_keys:
-                handler = keyboard.on_press_key(key, self._on_trigger_key, suppress=False)
-                self.trigger_handlers.append(handler)
+            # Un único hook para todas las teclas: alimenta el buffer de
+            # palabra y despacha los triggers de corrección. Los clics
+            # mueven el cursor: invalidan el buffer
+            self.key_source.start(self._on_key_event, self._on_click)
             
+            self.engine.word_buffer.invalidate()
             self.is_listening = True
             print(f"✓ Listener iniciado. Hotkey: {self.hotkey}")
             
@@ -80,18 +151,17 @@ class KeyboardListener:
         try:
             # Desregistrar hotkey
             try:
-                keyboard.remove_hotkey(self.hotkey)
+                self.key_source.remove_hotkey(self.hotkey)
+                if self.language_hotkey:
+                    self.key_source.remove_hotkey(self.language_hotkey)
             except Exception as e:
                 print(f"Advertencia al eliminar hotkey: {e}")
             
-            # Desregistrar triggers
-            for handler in self.trigger_handlers:
-                try:
-                    keyboard.unhook(handler)
-                except Exception as e:
-                    print(f"Advertencia al desregistrar handler: {e}")
+            # Desregistrar hooks de teclado y ratón
+            self.key_source.stop()
             
-            self.trigger_handlers.clear()
+            self._pressed_modifiers.clear()
+            self.worker.stop()
             self.is_listening = False
             print("✓ Listener detenido")
             
@@ -114,22 +184,98 @@ class KeyboardListener:
         except Exception as e:
             print(f"Error en toggle hotkey: {e}")
     
+    def _on_language_hotkey(self):
+        """Callback del atajo de cambio de idioma."""
+        if self.language_callback is None:
+            return
+        try:
+            self.language_callback()
+        except Exception as e:
+            print(f"Error en hotkey de idioma: {e}")
+    
+    def _on_key_event(self, event):
+        """
+        Callback para todos los eventos de teclado.
+        Mantiene el buffer de palabra del motor y detecta los triggers.
+        """
+        try:
+            name = event.name or ''
+            if len(name) > 1:
+                name = name.lower()
+            
+            if name in self.modifier_keys:
+                if event.event_type == KEY_DOWN:
+                    self._pressed_modifiers.add(name)
+                else:
+                    self._pressed_modifiers.discard(name)
+                return
+            
+            if event.event_type != KEY_DOWN:
+                return
+            
+            # Ignorar las teclas que enviamos nosotros al corregir
+            if self.engine.is_injected_event(event.time):
+                return
+            
+            buffer = self.engine.word_buffer
+            
+            window = self._foreground_window()
+            if window != self._last_window:
+                self._last_window = window
+                buffer.invalidate()
+            
+            if self._pressed_modifiers & self.shortcut_modifiers:
+                # Atajos (Ctrl+V, Ctrl+Z, Alt+Tab...) pueden cambiar texto o foco
+                buffer.invalidate()
+            elif name in self.trigger_keys:
+                self._on_trigger_key(event)
+            elif name == 'backspace':
+                buffer.backspace()
+            elif name in self.reset_keys:
+                buffer.invalidate()
+            elif len(name) == 1:
+                buffer.push_char(name)
+            else:
+                # Teclas desconocidas (F1, teclas muertas...): la palabra
+                # deja de ser fiable pero sabemos dónde acaba
+                buffer.push_char('\0')
+        except Exception as e:
+            print(f"Error procesando tecla: {e}")
+    
+    def _on_click(self):
+        """Callback del ratón: un clic puede mover el cursor."""
+        self.engine.word_buffer.invalidate()
+    
     def _on_trigger_key(self, event):
         """
         Callback cuando se presiona una tecla trigger.
-        Se ejecuta en un hilo separado para no bloquear la escritura.
+        La corrección se encola en el worker para no bloquear la escritura.
         """
+        # La palabra se cierra siempre, incluso con el motor inactivo
+        name = event.name if len(event.name or '') == 1 else (event.name or '').lower()
+        valid, word, previous, anchor = self.engine.word_buffer.end_word(
+            sentence_end=name in self.sentence_end_keys,
+            separator=self.trigger_chars.get(name, name if len(name) == 1 else None)
+        )
+        
         if not getattr(self.engine, "is_active", False):
             return
         
+        # Buffer válido pero sin palabra corregible: nada que hacer
+        if valid and word is None:
+            return
+        
+        # Palabra conocida que seguro no está en el diccionario (filtro de
+        # Bloom): ni se encola ni se toca el teclado
+        if valid and not self.engine.dict_manager.might_correct(word):
+            self.engine.metrics.skipped.inc()
+            return
+        
         try:
-            # Lanzar la corrección en un thread separado
-            thread = threading.Thread(
-                target=self.engine.process_trigger,
-                args=(event,),  # Se pasa el evento por si se usa
-                daemon=True
-            )
-            thread.start()
+            if valid:
+                self.worker.submit(event, word, previous, anchor)
+            else:
+                self.worker.submit(event, None, previous, anchor)
         except Exception as e:
             print(f"Error ejecutando trigger: {e}")
     
@@ -137,10 +283,21 @@ class KeyboardListener:
     # Utilidades
     # -------------------------------
     
-    def is_valid_hotkey(self, hotkey: str) -> bool:
-        """Valida si una combinación de teclas es válida."""
+    @staticmethod
+    def _foreground_window():
+        """Devuelve un identificador de la ventana activa (solo Windows)."""
+        if sys.platform != 'win32':
+            return None
         try:
-            keyboard.parse_hotkey(hotkey)
-            return True
+            import ctypes
+            return ctypes.windll.user32.GetForegroundWindow()
         except Exception:
-            return False
+            return None
+    
+    def get_worker_stats(self):
+        """Devuelve profundidad de cola y contadores de triggers descartados."""
+        return self.worker.stats()
+    
+    def is_valid_hotkey(self, hotkey: str) -> bool:
+        """Valida si una combinación de teclas es válida."""
+        return self.key_source.is_valid_hotkey(hotkey)
@@ -0,0 +1,144 @@
+# core/language_packs.py
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from .compiled_dictionary import CompiledDictionary
+from .context_model import ContextModel
+
+# El español vive directamente en data/ (como siempre); el resto de
+# idiomas en data/languages/<código>/ con los mismos archivos
+DEFAULT_LANGUAGE = "es"
+DEFAULT_NAME = "Español"
+PACKS_DIRNAME = "languages"
+MANIFEST_NAME = "pack.json"
+
+
+class LanguagePack(NamedTuple):
+    """
+    Paquete de idioma instalado: una carpeta con el mismo formato que
+    data/ (default_dictionary.json y, opcionalmente, context_rules.tsv y
+    pack.json con el nombre). Los .bin se compilan al abrirlo.
+    """
+    code: str
+    name: str
+    directory: Path
+
+    @property
+    def dictionary_path(self) -> Path:
+        return self.directory / "default_dictionary.json"
+
+    @property
+    def compiled_path(self) -> Path:
+        return self.directory / "default_dictionary.bin"
+
+    @property
+    def context_rules_path(self) -> Path:
+        return self.directory / "context_rules.tsv"
+
+    @property
+    def compiled_context_path(self) -> Path:
+        return self.directory / "context_rules.bin"
+
+    def open(self, in_subprocess: bool = False) -> "LoadedPack":
+        """Abre (compilándolos si hace falta) el diccionario y la tabla de contexto."""
+        base = CompiledDictionary.load_or_build(self.compiled_path, self.dictionary_path,
+                                                in_subprocess=in_subprocess)
+        context_model = None
+        if self.context_rules_path.exists():
+            try:
+                context_model = ContextModel.load_or_build(self.compiled_context_path,
+                                                           self.context_rules_path)
+            except Exception as e:
+                print(f"[Error] No se pudo cargar la tabla de contexto de '{self.code}': {e}")
+        return LoadedPack(base, context_model)
+
+
+class LoadedPack(NamedTuple):
+    """Diccionario y tabla de contexto abiertos de un idioma."""
+    base: CompiledDictionary
+    context_model: Optional[ContextModel]
+
+    @property
+    def nbytes(self) -> int:
+        size = self.base.nbytes
+        if self.context_model is not None:
+            size += self.context_model.nbytes
+        return size
+
+
+def discover_packs(data_dir: Path) -> Dict[str, LanguagePack]:
+    """Idiomas instalados en data_dir, por código (el español siempre está)."""
+    data_dir = Path(data_dir)
+    packs = {DEFAULT_LANGUAGE: LanguagePack(DEFAULT_LANGUAGE, DEFAULT_NAME, data_dir)}
+
+    packs_dir = data_dir / PACKS_DIRNAME
+    if not packs_dir.is_dir():
+        return packs
+
+    for directory in sorted(packs_dir.iterdir()):
+        code = directory.name.lower()
+        if code in packs or not (directory / "default_dictionary.json").is_file():
+            continue
+        name = code
+        try:
+            manifest = json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+            name = str(manifest.get("name") or code)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[Aviso] {MANIFEST_NAME} inválido en el paquete '{code}': {e}")
+        packs[code] = LanguagePack(code, name, directory)
+    return packs
+
+
+class PackCache:
+    """
+    Idiomas abiertos que no están en uso, del menos al más reciente.
+
+    Volver a uno de ellos es publicar una versión con su diccionario, sin
+    abrir ni compilar nada. Si entre todos (más el idioma activo, que no
+    está aquí) pasan de 'budget' bytes se sueltan los más antiguos; el
+    mapeo se libera cuando ninguna versión publicada los usa ya.
+    """
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self._packs: "OrderedDict[str, LoadedPack]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def take(self, code: str) -> Optional[LoadedPack]:
+        """Saca un idioma de la caché (pasa a ser el activo)."""
+        with self._lock:
+            self._sizes.pop(code, None)
+            return self._packs.pop(code, None)
+
+    def put(self, code: str, pack: LoadedPack, active_bytes: int = 0):
+        """Guarda un idioma que deja de estar activo (o precargado)."""
+        with self._lock:
+            self._packs[code] = pack
+            self._packs.move_to_end(code)
+            self._sizes[code] = pack.nbytes
+            self._evict(active_bytes)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._packs
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def clear(self):
+        with self._lock:
+            self._packs.clear()
+            self._sizes.clear()
+
+    def _evict(self, active_bytes: int):
+        while self._packs and active_bytes + sum(self._sizes.values()) > self.budget:
+            code, _ = self._packs.popitem(last=False)
+            self._sizes.pop(code, None)
+            print(f"Idioma '{code}' descargado de memoria (límite de {self.budget // 2**20} MB)")
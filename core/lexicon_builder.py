@@ -0,0 +1,354 @@
+# core/lexicon_builder.py
+"""
+Construcción del diccionario base a partir de una lista de palabras.
+
+Lee una lista de formas con frecuencias (una por línea: "palabra 123",
+"palabra<TAB>123", "123 palabra" o solo "palabra") y deriva las entradas
+sin tilde -> con tilde:
+
+    python -m core.lexicon_builder es_full.txt
+    python -m core.lexicon_builder es_full.txt.gz --min-count 5 --collisions colisiones.tsv
+    python -m core.lexicon_builder lista.txt -o /tmp/dic.json --no-merge -j 8
+
+La clave de cada forma se obtiene quitando los diacríticos con la
+normalización Unicode (NFD), salvo la tilde de la ñ. Cuando una clave
+corresponde a varias formas (publico/público/publicó) hay una colisión:
+se resuelve por frecuencia si una forma domina y, si no, se marca en el
+informe y no se escribe (a no ser que la palabra tenga reglas de contexto,
+que decidirán al escribir).
+
+La lista se lee en bloques repartidos entre varios procesos. El resultado
+se escribe en data/default_dictionary.json junto con su versión compilada,
+con el hash del JSON nuevo: la aplicación no tiene que recompilar y, si
+está abierta, lo recarga sola.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+import unicodedata
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .batch import iter_chunks
+from .compiled_dictionary import encode
+from .context_model import read_rules
+from .file_utils import atomic_write_bytes
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_MIN_RATIO = 0.9
+
+_COMBINING_TILDE = "\u0303"   # tilde de la ñ en NFD (n + U+0303)
+
+
+# ────────────────────────────────
+# Claves
+# ────────────────────────────────
+def strip_accents(word: str) -> str:
+    """Quita los diacríticos (á -> a, ü -> u) conservando la ñ."""
+    if word.isascii():
+        return word
+    chars = []
+    for ch in unicodedata.normalize("NFD", word):
+        if unicodedata.combining(ch):
+            if ch == _COMBINING_TILDE and chars and chars[-1] in "nN":
+                chars.append(ch)
+            continue
+        chars.append(ch)
+    return unicodedata.normalize("NFC", "".join(chars))
+
+
+def parse_line(line: str) -> Optional[Tuple[str, int]]:
+    """Devuelve (forma en minúsculas, frecuencia) o None si la línea no sirve."""
+    parts = line.replace(",", " ").split()
+    if len(parts) == 1:
+        word, count = parts[0], 1
+    elif len(parts) == 2 and parts[1].isdigit():
+        word, count = parts[0], int(parts[1])
+    elif len(parts) == 2 and parts[0].isdigit():
+        word, count = parts[1], int(parts[0])
+    else:
+        return None   # vacía, comentario o varias palabras
+
+    word = word.lower()
+    if not word.isascii():
+        word = unicodedata.normalize("NFC", word)
+    if not word.isalpha():
+        return None
+    return word, count
+
+
+# ────────────────────────────────
+# Trabajo de cada proceso
+# ────────────────────────────────
+def count_chunk(chunk: bytes) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Cuenta las formas de un bloque de líneas.
+    Returns: (formas con diacríticos, formas sin ellos)
+    """
+    accented: Dict[str, int] = {}
+    plain: Dict[str, int] = {}
+    for line in chunk.decode("utf-8", errors="replace").splitlines():
+        parsed = parse_line(line)
+        if parsed is None:
+            continue
+        word, count = parsed
+        target = plain if strip_accents(word) == word else accented
+        target[word] = target.get(word, 0) + count
+    return accented, plain
+
+
+# ────────────────────────────────
+# Colisiones
+# ────────────────────────────────
+class Collision(NamedTuple):
+    key: str
+    forms: Tuple[Tuple[str, int], ...]   # de más a menos frecuente (incluye la forma sin tilde)
+    chosen: Optional[str]                # forma escrita en el diccionario, o None
+    reason: str                          # 'frecuencia', 'contexto', 'sin tilde' o 'ambigua'
+
+    @property
+    def flagged(self) -> bool:
+        return self.reason == "ambigua"
+
+
+class LexiconStats:
+    """Contadores de una construcción."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.forms = 0
+        self.entries = 0
+        self.kept = 0          # entradas del diccionario anterior conservadas
+        self.started = time.perf_counter()
+
+    def report(self, collisions: List[Collision]) -> str:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        flagged = sum(1 for c in collisions if c.flagged)
+        return (
+            f"{self.bytes / (1024 * 1024):.2f} MB, {self.forms} formas, {self.entries} entradas "
+            f"({self.kept} del diccionario anterior), {len(collisions) - flagged} colisiones "
+            f"resueltas, {flagged} marcadas, en {elapsed:.2f} s"
+        )
+
+
+def resolve(accented: Dict[str, int], plain: Dict[str, int], min_ratio: float = DEFAULT_MIN_RATIO,
+            context_words: Iterable[str] = (), keep_ambiguous: bool = False,
+            min_count: int = 1) -> Tuple[Dict[str, str], List[Collision]]:
+    """
+    Agrupa las formas por clave y decide qué escribir.
+
+    Una forma gana si acumula al menos 'min_ratio' de las apariciones de
+    su clave (contando la forma sin tilde). Si gana la forma sin tilde no
+    se escribe nada: corregirla estropearía el caso frecuente.
+    Returns: (entradas sin tilde -> con tilde, colisiones)
+    """
+    context_words = set(context_words)
+    groups: Dict[str, Dict[str, int]] = {}
+    for word, count in accented.items():
+        if count >= min_count:
+            groups.setdefault(strip_accents(word), {})[word] = count
+
+    entries: Dict[str, str] = {}
+    collisions: List[Collision] = []
+    for key, forms in groups.items():
+        plain_count = plain.get(key, 0)
+        if plain_count >= min_count:
+            forms[key] = plain_count
+        if len(forms) == 1:
+            entries[key] = next(iter(forms))
+            continue
+
+        ranked = tuple(sorted(forms.items(), key=lambda fc: (-fc[1], fc[0])))
+        top, top_count = ranked[0]
+        best_accented = next(form for form, _ in ranked if form != key)
+        dominant = top_count >= min_ratio * sum(forms.values())
+
+        if key in context_words:
+            # Las reglas de contexto deciden al escribir si lleva tilde
+            chosen, reason = best_accented, "contexto"
+        elif dominant:
+            chosen, reason = (None, "sin tilde") if top == key else (top, "frecuencia")
+        else:
+            chosen = best_accented if keep_ambiguous and top != key else None
+            reason = "ambigua"
+
+        if chosen is not None:
+            entries[key] = chosen
+        collisions.append(Collision(key, ranked, chosen, reason))
+
+    collisions.sort(key=lambda c: c.key)
+    return entries, collisions
+
+
+def write_collisions(path: Union[str, Path], collisions: Iterable[Collision]) -> int:
+    """Informe TSV: clave, forma elegida, motivo y formas con su frecuencia."""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("clave\telegida\tmotivo\tformas\n")
+        for c in collisions:
+            forms = " ".join(f"{form}:{n}" for form, n in c.forms)
+            f.write(f"{c.key}\t{c.chosen or '-'}\t{c.reason}\t{forms}\n")
+            count += 1
+    return count
+
+
+# ────────────────────────────────
+# Lectura y escritura
+# ────────────────────────────────
+def _open_source(path: str):
+    if path == "-":
+        return sys.stdin.buffer
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def count_forms(paths: List[str], pool: Optional[Pool], chunk_size: int,
+                stats: LexiconStats) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Suma las frecuencias de todas las listas, repartiendo los bloques entre procesos."""
+    accented: Dict[str, int] = {}
+    plain: Dict[str, int] = {}
+
+    for path in paths:
+        source = _open_source(path)
+        try:
+            chunks = _counted(iter_chunks(source, chunk_size), stats)
+            results = pool.imap_unordered(count_chunk, chunks) if pool is not None else map(count_chunk, chunks)
+            for chunk_accented, chunk_plain in results:
+                for total, partial in ((accented, chunk_accented), (plain, chunk_plain)):
+                    if not total:
+                        total.update(partial)
+                        continue
+                    for word, count in partial.items():
+                        total[word] = total.get(word, 0) + count
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+
+    stats.forms = len(accented) + len(plain)
+    return accented, plain
+
+
+def _counted(chunks: Iterable[bytes], stats: LexiconStats) -> Iterable[bytes]:
+    for chunk in chunks:
+        stats.bytes += len(chunk)
+        yield chunk
+
+
+def write_dictionary(json_path: Union[str, Path], entries: Dict[str, str],
+                     compiled_path: Optional[Union[str, Path]] = None):
+    """
+    Escribe el JSON y su versión compilada, esta con el hash del JSON
+    nuevo para que DictionaryManager la use sin recompilar. El compilado
+    va primero: si el proceso muere entre medias, el JSON viejo ya no
+    coincide con él y se recompila al arrancar.
+    """
+    data = json.dumps(dict(sorted(entries.items())), ensure_ascii=False, indent=2).encode("utf-8")
+    if compiled_path is not None:
+        atomic_write_bytes(compiled_path, encode(entries, hashlib.sha256(data).digest()))
+    atomic_write_bytes(json_path, data)
+
+
+def read_context_words(path: Union[str, Path]) -> Set[str]:
+    """Palabras con reglas de contexto (vacío si no hay archivo de reglas)."""
+    try:
+        return {word for _, word in read_rules(path)}
+    except FileNotFoundError:
+        return set()
+
+
+# ────────────────────────────────
+# Línea de comandos
+# ────────────────────────────────
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.lexicon_builder",
+        description="Genera el diccionario base a partir de una lista de palabras con frecuencias."
+    )
+    parser.add_argument("lists", nargs="+", help="listas de palabras (.txt o .gz; '-' = entrada estándar)")
+    parser.add_argument("-o", "--output", default=str(DATA_DIR / "default_dictionary.json"),
+                        help="diccionario JSON a escribir (por defecto, el base de la aplicación)")
+    parser.add_argument("--no-compile", action="store_true", help="no escribir la versión compilada (.bin)")
+    parser.add_argument("--no-merge", action="store_true",
+                        help="descartar las entradas del diccionario anterior (por defecto se conservan y mandan)")
+    parser.add_argument("--min-count", type=int, default=1, help="frecuencia mínima de una forma (por defecto 1)")
+    parser.add_argument("--min-ratio", type=float, default=DEFAULT_MIN_RATIO,
+                        help="proporción de apariciones para resolver una colisión (por defecto 0.9)")
+    parser.add_argument("--keep-ambiguous", action="store_true",
+                        help="escribir también las colisiones marcadas, con la forma con tilde más frecuente")
+    parser.add_argument("--context-rules", default=str(DATA_DIR / "context_rules.tsv"),
+                        help="reglas de contexto (sus palabras se escriben aunque sean ambiguas)")
+    parser.add_argument("--collisions", help="informe TSV de colisiones")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="procesos en paralelo (por defecto, uno por núcleo)")
+    parser.add_argument("--chunk-size", type=float, default=DEFAULT_CHUNK_SIZE / (1024 * 1024),
+                        help="tamaño de bloque en MB (por defecto 4)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no mostrar estadísticas")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if not 0.5 < args.min_ratio <= 1:
+        print("Error: --min-ratio debe estar entre 0.5 (excluido) y 1", file=sys.stderr)
+        return 2
+
+    output = Path(args.output)
+    chunk_size = max(int(args.chunk_size * 1024 * 1024), 4096)
+    stats = LexiconStats()
+
+    pool = Pool(args.jobs) if args.jobs > 1 else None
+    try:
+        accented, plain = count_forms(args.lists, pool, chunk_size, stats)
+    except (OSError, EOFError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    try:
+        context_words = read_context_words(args.context_rules)
+    except (OSError, ValueError) as e:
+        print(f"Error en las reglas de contexto: {e}", file=sys.stderr)
+        return 1
+
+    entries, collisions = resolve(accented, plain, args.min_ratio, context_words,
+                                  args.keep_ambiguous, args.min_count)
+
+    if not args.no_merge and output.exists():
+        try:
+            previous = json.loads(output.read_text(encoding="utf-8"))
+            if not isinstance(previous, dict):
+                raise ValueError("no contiene un objeto JSON")
+        except (OSError, ValueError) as e:
+            print(f"Error: no se pudo leer {output}: {e}", file=sys.stderr)
+            return 1
+        # Las entradas revisadas a mano mandan sobre las derivadas
+        entries.update(previous)
+        stats.kept = len(previous)
+    stats.entries = len(entries)
+
+    try:
+        write_dictionary(output, entries, None if args.no_compile else output.with_suffix(".bin"))
+        if args.collisions:
+            write_collisions(args.collisions, collisions)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(stats.report(collisions), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+# core/metrics.py
+
+import bisect
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+from .file_utils import atomic_write_text
+
+# Límites de los buckets en segundos: de 50 µs a 5 s, en escala ~logarítmica
+DEFAULT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class Counter:
+    """Contador monótono."""
+
+    def __init__(self, name: str, help_text: str = ""):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
+
+    def reset(self):
+        with self._lock:
+            self.value = 0
+
+
+class Histogram:
+    """
+    Histograma de latencias con buckets fijos.
+
+    Registrar una muestra es un bisect y un incremento, así que se puede
+    llamar en el camino crítico de cada palabra. Los percentiles se
+    estiman a partir de los buckets (el límite superior del bucket donde
+    cae el percentil).
+    """
+
+    def __init__(self, name: str, help_text: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.bounds = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, seconds: float):
+        index = bisect.bisect_left(self.bounds, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def time(self) -> "_Timer":
+        """Mide la duración de un bloque: with histogram.time(): ..."""
+        return _Timer(self)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Percentil estimado (q entre 0 y 1), o None si no hay muestras."""
+        with self._lock:
+            counts = list(self.counts)
+            count = self.count
+            maximum = self.max
+        if count == 0:
+            return None
+
+        rank = q * count
+        seen = 0
+        for index, bucket in enumerate(counts):
+            seen += bucket
+            if seen >= rank and bucket:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], maximum)
+                return maximum
+        return maximum
+
+    def snapshot(self) -> Dict:
+        """Copia coherente del histograma, con buckets acumulados."""
+        with self._lock:
+            counts = list(self.counts)
+            count, total = self.count, self.sum
+            minimum, maximum = self.min, self.max
+
+        cumulative = {}
+        seen = 0
+        for bound, bucket in zip(self.bounds, counts):
+            seen += bucket
+            cumulative[repr(bound)] = seen
+        cumulative["+Inf"] = count
+
+        return {
+            "count": count,
+            "sum": total,
+            "min": minimum if count else None,
+            "max": maximum if count else None,
+            "mean": total / count if count else None,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            "buckets": cumulative,
+        }
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.min = float("inf")
+            self.max = 0.0
+
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Registro de contadores e histogramas del proceso.
+
+    Se puede consultar desde la interfaz (snapshot) o volcar a un archivo
+    JSON o de texto de Prometheus (dump), p. ej. para que un node_exporter
+    con textfile collector lo recoja.
+    """
+
+    def __init__(self, prefix: str = "autocorrect"):
+        self.prefix = prefix
+        self._metrics: Dict[str, Union[Counter, Histogram]] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        """Devuelve el contador 'name', creándolo si no existe."""
+        return self._get_or_create(Counter, name, help_text)
+
+    def histogram(self, name: str, help_text: str = "",
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Devuelve el histograma 'name', creándolo si no existe."""
+        return self._get_or_create(Histogram, name, help_text, buckets)
+
+    def _get_or_create(self, cls, name: str, help_text: str, *args):
+        full_name = f"{self.prefix}_{name}" if self.prefix else name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = self._metrics[full_name] = cls(full_name, help_text, *args)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"La métrica {full_name} ya existe con otro tipo")
+            return metric
+
+    def reset(self):
+        """Pone a cero todas las métricas."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+        self.started = time.time()
+
+    # ────────────────────────────────
+    # Exportación
+    # ────────────────────────────────
+    def snapshot(self) -> Dict:
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+
+        return {
+            "generated_at": time.time(),
+            "uptime_seconds": time.time() - self.started,
+            "counters": {name: m.value for name, m in metrics if isinstance(m, Counter)},
+            "histograms": {name: m.snapshot() for name, m in metrics if isinstance(m, Histogram)},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2, ensure_ascii=False)
+
+    def to_prometheus(self) -> str:
+        """Formato de texto de exposición de Prometheus."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+
+        lines = []
+        for name, metric in metrics:
+            if metric.help:
+                lines.append(f"# HELP {name} {metric.help}")
+            if isinstance(metric, Counter):
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name} {metric.value}")
+            else:
+                snap = metric.snapshot()
+                lines.append(f"# TYPE {name} histogram")
+                for bound, count in snap["buckets"].items():
+                    lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+                lines.append(f"{name}_sum {snap['sum']!r}")
+                lines.append(f"{name}_count {snap['count']}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Union[str, Path]) -> Path:
+        """
+        Vuelca las métricas a un archivo: JSON si la extensión es .json,
+        texto de Prometheus en cualquier otro caso (.prom, .txt...).
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".json":
+            content = self.to_json()
+        else:
+            content = self.to_prometheus()
+        atomic_write_text(path, content)
+        return path
+
+
+class PipelineMetrics(MetricsRegistry):
+    """
+    Métricas del camino de corrección, de la pulsación del trigger a la
+    inyección de la palabra corregida:
+
+        recibido → (cola) → palabra obtenida → consulta → inyección
+    """
+
+    def __init__(self, prefix: str = "autocorrect"):
+        super().__init__(prefix)
+
+        self.triggers = self.counter("triggers_total", "Triggers recibidos por el worker")
+        self.corrections = self.counter("corrections_total", "Palabras corregidas")
+        self.dropped = self.counter("dropped_total", "Triggers descartados por cola llena")
+        self.coalesced = self.counter("coalesced_total", "Triggers de portapapeles fusionados")
+        self.skipped = self.counter("skipped_total", "Palabras descartadas por el filtro sin pasar por el worker")
+        self.deferred = self.counter("deferred_total", "Correcciones aplazadas hasta una pausa del usuario")
+        self.catch_ups = self.counter("catch_ups_total", "Pausas en las que se aplicaron correcciones aplazadas")
+        self.stale = self.counter("stale_total", "Correcciones descartadas porque el texto ya no coincide")
+        self.clipboard_reads = self.counter("clipboard_reads_total", "Palabras leídas con el portapapeles")
+        self.errors = self.counter("errors_total", "Errores en el camino de corrección")
+
+        self.queue_wait = self.histogram("queue_wait_seconds", "Espera en la cola del worker")
+        self.word_acquire = self.histogram("word_acquire_seconds", "Obtención de la palabra (buffer o portapapeles)")
+        self.lookup = self.histogram("lookup_seconds", "Consulta del diccionario")
+        self.injection = self.histogram("injection_seconds", "Envío de las teclas de la corrección")
+        self.trigger_latency = self.histogram("trigger_latency_seconds", "Del trigger al final del procesamiento")
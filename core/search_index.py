@@ -0,0 +1,118 @@
+# core/search_index.py
+
+import bisect
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+from .context_model import fold
+
+
+def trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Índice de búsqueda sobre el diccionario base compilado.
+
+    Todo se compara en minúsculas y sin tildes (fold), así que "cancion"
+    encuentra "canción" y al revés. Se indexan la palabra sin tilde y la
+    corregida:
+
+    - Consultas de 1 o 2 letras: por prefijo, con búsqueda binaria sobre
+      las formas normalizadas ordenadas.
+    - Consultas de 3 o más: por subcadena, intersecando las listas de
+      trigramas y verificando solo los candidatos.
+
+    Los resultados son índices del diccionario base (CompiledDictionary),
+    en orden; las palabras del usuario se buscan aparte (son pocas y
+    cambian).
+    """
+
+    PREFIX_LENGTH = 3
+
+    def __init__(self, base_dictionary):
+        self.base = base_dictionary
+
+        forms: List[Tuple[str, int]] = []
+        postings: Dict[str, array] = {}
+        # Formas normalizadas de cada entrada, para verificar candidatos
+        # sin volver a leer el mmap ("clave" o "clave\x1fvalor")
+        folded: List[str] = []
+
+        for index, (key, value) in enumerate(base_dictionary.items()):
+            folded_key = fold(key)
+            folded_value = fold(value)
+            forms.append((folded_key, index))
+            grams = trigrams(folded_key)
+            if folded_value != folded_key:
+                forms.append((folded_value, index))
+                grams |= trigrams(folded_value)
+                folded.append(f"{folded_key}\x1f{folded_value}")
+            else:
+                folded.append(folded_key)
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                posting.append(index)
+
+        forms.sort()
+        self._prefix_forms = [form for form, _ in forms]
+        self._prefix_ids = array("I", (index for _, index in forms))
+        self._postings = postings
+        self._folded = folded
+
+    def search(self, query: str) -> array:
+        """Índices del diccionario base que coinciden con 'query', ordenados."""
+        query = fold(query.strip())
+        if not query:
+            return array("I", range(self.base.count))
+        if len(query) < self.PREFIX_LENGTH:
+            return self._search_prefix(query)
+        return self._search_substring(query)
+
+    def _search_prefix(self, query: str) -> array:
+        start = bisect.bisect_left(self._prefix_forms, query)
+        # '\U0010ffff' es mayor que cualquier carácter: cierra el rango del prefijo
+        end = bisect.bisect_left(self._prefix_forms, query + "\U0010ffff", start)
+        return array("I", sorted(set(self._prefix_ids[start:end])))
+
+    def _search_substring(self, query: str) -> array:
+        lists = []
+        for gram in trigrams(query):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return array("I")
+            lists.append(posting)
+
+        # Empezar por la lista más corta
+        lists.sort(key=len)
+        if len(query) == self.PREFIX_LENGTH:
+            # La consulta es el trigrama: la lista ya está ordenada y todos coinciden
+            return array("I", lists[0])
+
+        candidates = set(lists[0])
+        for posting in lists[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return array("I")
+
+        folded = self._folded
+        return array("I", sorted(index for index in candidates if query in folded[index]))
+
+
+def search_words(words: Iterable[Tuple[str, str]], query: str) -> List[str]:
+    """
+    Busca en pares (sin tilde, con tilde) con los mismos criterios que
+    SearchIndex, recorriéndolos (para el diccionario del usuario).
+    """
+    query = fold(query.strip())
+    prefix = len(query) < SearchIndex.PREFIX_LENGTH
+    matches = []
+    for word, corrected in words:
+        for form in (fold(word), fold(corrected)):
+            if form.startswith(query) if prefix else query in form:
+                matches.append(word)
+                break
+    return sorted(matches)
@@ -0,0 +1,183 @@
+# core/startup_profile.py
+"""
+Perfil del arranque de la aplicación.
+
+main.py mide cada fase (imports, QApplication, diccionario, listener,
+bandeja, ventana...) y, con --profile-startup, imprime el informe al
+entrar en el bucle de eventos:
+
+    python main.py --minimized --profile-startup
+    python main.py --minimized --profile-startup=arranque.json
+
+Para ver qué módulo cuesta cada import, Python ya trae -X importtime;
+este módulo resume su salida:
+
+    python -X importtime main.py --minimized 2> importtime.log
+    python -m core.startup_profile importtime.log --top 25
+
+No importa nada pesado: se carga antes que el resto de la aplicación.
+"""
+
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+PROFILE_FLAG = "--profile-startup"
+
+
+class Phase(NamedTuple):
+    name: str
+    start: float       # segundos desde el inicio del perfil
+    duration: float    # segundos
+    modules: int       # módulos importados durante la fase
+
+
+class StartupProfile:
+    """Tiempos de las fases del arranque, medidos con perf_counter."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Phase] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        modules_before = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append(Phase(name, start - self.started, end - start,
+                                     len(sys.modules) - modules_before))
+
+    def mark(self, name: str):
+        """Registra un instante (fase de duración cero)."""
+        self.phases.append(Phase(name, time.perf_counter() - self.started, 0.0, 0))
+
+    def total(self) -> float:
+        if not self.phases:
+            return 0.0
+        return max(p.start + p.duration for p in self.phases)
+
+    def snapshot(self) -> Dict:
+        return {
+            "total_ms": round(self.total() * 1000, 2),
+            "modules_loaded": len(sys.modules),
+            "phases": [
+                {
+                    "name": p.name,
+                    "start_ms": round(p.start * 1000, 2),
+                    "duration_ms": round(p.duration * 1000, 2),
+                    "modules": p.modules,
+                }
+                for p in self.phases
+            ],
+        }
+
+    def report(self) -> str:
+        lines = ["Perfil de arranque:"]
+        for p in self.phases:
+            if p.duration:
+                lines.append(f"  {p.name:<28} {p.duration * 1000:9.1f} ms"
+                             f"  (+{p.modules} módulos)")
+            else:
+                lines.append(f"  {p.name:<28} @ {p.start * 1000:7.1f} ms")
+        lines.append(f"  {'Total':<28} {self.total() * 1000:9.1f} ms"
+                     f"  ({len(sys.modules)} módulos cargados)")
+        return "\n".join(lines)
+
+    def dump(self, path: Union[str, Path]):
+        from .file_utils import atomic_write_text
+        atomic_write_text(path, json.dumps(self.snapshot(), indent=2, ensure_ascii=False))
+
+
+def requested(argv: Iterable[str]) -> Optional[str]:
+    """
+    Busca --profile-startup en los argumentos: None si no está, "" si está
+    sin archivo y la ruta si se pasó --profile-startup=archivo.json.
+    """
+    for arg in argv:
+        if arg == PROFILE_FLAG:
+            return ""
+        if arg.startswith(PROFILE_FLAG + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+# ────────────────────────────────
+# Resumen de -X importtime
+# ────────────────────────────────
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+# "import time:       412 |        781 |   encodings"
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportTiming]:
+    """Lee la salida de 'python -X importtime' (el resto de líneas se ignora)."""
+    timings = []
+    for line in lines:
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            # Cada nivel de anidamiento añade dos espacios al único inicial
+            depth = max(len(indent) - 1, 0) // 2
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), depth))
+    return timings
+
+
+def summarize_importtime(timings: List[ImportTiming], top: int = 20) -> str:
+    total = sum(t.cumulative_us for t in timings if t.depth == 0)
+    lines = [f"Imports: {len(timings)} módulos, {total / 1000:.1f} ms en total", "",
+             "Imports de primer nivel más lentos (acumulado):"]
+    roots = sorted((t for t in timings if t.depth == 0), key=lambda t: t.cumulative_us, reverse=True)
+    for t in roots[:top]:
+        lines.append(f"  {t.cumulative_us / 1000:9.1f} ms  {t.module}")
+
+    lines += ["", "Módulos más lentos (tiempo propio):"]
+    for t in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(f"  {t.self_us / 1000:9.1f} ms  {t.module}")
+    return "\n".join(lines)
+
+
+def build_parser():
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="python -m core.startup_profile",
+        description="Resume la salida de 'python -X importtime'."
+    )
+    parser.add_argument("log", nargs="?", help="archivo con la salida (por defecto, entrada estándar)")
+    parser.add_argument("--top", type=int, default=20, help="módulos a listar (por defecto 20)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        if args.log:
+            with open(args.log, encoding="utf-8", errors="replace") as f:
+                timings = parse_importtime(f)
+        else:
+            timings = parse_importtime(sys.stdin)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not timings:
+        print("Error: no hay líneas de 'import time:' (¿se ejecutó con -X importtime?)", file=sys.stderr)
+        return 1
+    print(summarize_importtime(timings, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# core/text_corrector.py
+
+import re
+from collections import deque
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+# Una palabra: solo letras, sin pegarse a dígitos ni guiones bajos
+# (así no se tocan identificadores, URLs con números, etc.)
+WORD_PATTERN = re.compile(r"(?<!\w)[a-zA-ZáéíóúüñÁÉÍÓÚÜÑ]+(?!\w)")
+
+# Lo que cierra una frase (como . ! ? Enter al escribir): a partir de ahí
+# las palabras anteriores ya no sirven de contexto. Se busca en la misma
+# pasada que las palabras
+SENTENCE_ENDS = frozenset(".!?\n\r")
+TOKEN_PATTERN = re.compile(WORD_PATTERN.pattern + r"|[.!?\n\r]")
+
+
+class CorrectionSpan(NamedTuple):
+    """Tramo corregido, con posiciones sobre el texto original."""
+    start: int
+    end: int
+    original: str
+    corrected: str
+
+
+class TextCorrector:
+    """
+    Corrige textos completos en una sola pasada, sin interfaz gráfica.
+
+    El texto se tokeniza una vez con un patrón precompilado y la salida se
+    construye uniendo trozos, en lugar de hacer un str.replace por palabra
+    (que era O(palabras × longitud) y cambiaba sub-palabras). Las palabras
+    que no dependen del contexto se cachean, así que un texto grande con
+    vocabulario repetido cuesta poco más que recorrerlo. Las ambiguas se
+    cachean junto con sus palabras anteriores.
+
+    dictionary: objeto con get_corrected_word(palabra, anteriores) e
+    is_ambiguous(palabra_en_minusculas), como DictionaryManager.
+    """
+
+    def __init__(self, dictionary, cache_size: int = 100_000):
+        self.dictionary = dictionary
+        self.cache_size = cache_size
+        self.words_seen = 0
+        self._cache: Dict[object, str] = {}
+        self._version = getattr(dictionary, "version", None)
+
+    def correct(self, text: str, previous: Sequence[str] = ()) -> Tuple[str, List[CorrectionSpan]]:
+        """
+        Returns: (texto corregido, lista de tramos cambiados)
+        previous: palabras anteriores al texto, como contexto inicial
+        """
+        # Si el diccionario publicó otra versión, lo cacheado ya no vale
+        version = getattr(self.dictionary, "version", None)
+        if version != self._version:
+            self._cache.clear()
+            self._version = version
+
+        get_corrected_word = self.dictionary.get_corrected_word
+        is_ambiguous = self.dictionary.is_ambiguous
+        cache = self._cache
+        history = deque((w.lower() for w in previous), maxlen=2)
+
+        parts = []
+        spans = []
+        last = 0
+        words = 0
+
+        for match in TOKEN_PATTERN.finditer(text):
+            word = match.group()
+            if word in SENTENCE_ENDS:
+                history.clear()
+                continue
+            words += 1
+            word_lower = word.lower()
+
+            corrected = cache.get(word)
+            if corrected is None:
+                if is_ambiguous(word_lower):
+                    # Depende del contexto: se cachea junto a las palabras anteriores
+                    key = (word, *history)
+                    corrected = cache.get(key)
+                    if corrected is None:
+                        corrected = self._store(key, get_corrected_word(word, history))
+                else:
+                    corrected = self._store(word, get_corrected_word(word))
+            history.append(word_lower)
+
+            if corrected != word:
+                start, end = match.span()
+                parts.append(text[last:start])
+                parts.append(corrected)
+                last = end
+                spans.append(CorrectionSpan(start, end, word, corrected))
+
+        self.words_seen += words
+        if not spans:
+            return text, spans
+
+        parts.append(text[last:])
+        return "".join(parts), spans
+
+    def _store(self, key, corrected: str) -> str:
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[key] = corrected
+        return corrected
+
+    def clear_cache(self):
+        """Vacía la caché (p. ej. tras recargar el diccionario)."""
+        self._cache.clear()
+
+
+def correct_text(text: str, dictionary, previous: Sequence[str] = ()) -> Tuple[str, List[CorrectionSpan]]:
+    """Atajo para corregir un único texto: (texto corregido, tramos cambiados)."""
+    return TextCorrector(dictionary).correct(text, previous)
@@ -0,0 +1,154 @@
+# core/usage_stats.py
+
+import atexit
+import heapq
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+class UsageStats:
+    """
+    Cuántas veces se ha corregido cada palabra, en una base SQLite del
+    usuario (modo WAL, para que leer no espere a quien escribe).
+
+    Contar una corrección no toca el disco: se suma en memoria y un hilo
+    de fondo vuelca lo pendiente cada flush_interval segundos en una sola
+    transacción. Los totales se leen al arrancar y se mantienen en memoria,
+    así que la interfaz y el diccionario los consultan sin ir a SQLite.
+    """
+
+    def __init__(self, db_path: Path, flush_interval: float = 5.0):
+        self.db_path = Path(db_path)
+        self.flush_interval = flush_interval
+
+        self._counts: Dict[str, int] = {}        # totales (disco + pendiente)
+        self._pending: Counter = Counter()       # aún no escrito
+        self._last_used: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self._available = False
+        self._thread = None
+        self._stop = threading.Event()
+        self._closed = False
+        atexit.register(self.close)
+
+    # ────────────────────────────────
+    # Lectura
+    # ────────────────────────────────
+    def load(self) -> bool:
+        """Abre la base (la crea si no existe) y lee los totales."""
+        try:
+            with closing(self._connect()) as db, db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS usage ("
+                    " word TEXT PRIMARY KEY,"
+                    " count INTEGER NOT NULL,"
+                    " last_used REAL NOT NULL)"
+                )
+                counts = dict(db.execute("SELECT word, count FROM usage"))
+        except sqlite3.Error as e:
+            # Sin estadísticas se sigue corrigiendo; solo no se guardan
+            print(f"[Error] No se pudieron cargar las estadísticas de uso: {e}")
+            self._available = False
+            return False
+
+        with self._lock:
+            for word, count in self._pending.items():
+                counts[word] = counts.get(word, 0) + count
+            self._counts = counts
+        self._available = True
+        return True
+
+    def count(self, word: str) -> int:
+        """Veces que se ha corregido 'word' (en minúsculas)."""
+        return self._counts.get(word, 0)
+
+    def most_used(self, limit: int) -> List[Tuple[str, int]]:
+        """Las 'limit' palabras más corregidas, de más a menos."""
+        with self._lock:
+            items = list(self._counts.items())
+        return heapq.nlargest(limit, items, key=lambda item: (item[1], item[0]))
+
+    def total(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    # ────────────────────────────────
+    # Escritura
+    # ────────────────────────────────
+    def record(self, word: str, times: int = 1):
+        """Suma una corrección de 'word' (en minúsculas); se escribe en segundo plano."""
+        with self._lock:
+            self._counts[word] = self._counts.get(word, 0) + times
+            self._pending[word] += times
+            self._last_used[word] = time.time()
+
+        if self._thread is None and self._available and not self._closed:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="UsageStatsWriter",
+                daemon=True
+            )
+            self._thread.start()
+
+    def flush(self) -> bool:
+        """Escribe ya lo pendiente. Returns: False si no se pudo."""
+        if not self._available:
+            return False
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            last_used, self._last_used = self._last_used, {}
+        if not pending:
+            return True
+
+        try:
+            with closing(self._connect()) as db, db:
+                db.executemany(
+                    "INSERT INTO usage (word, count, last_used) VALUES (?, ?, ?) "
+                    "ON CONFLICT(word) DO UPDATE SET"
+                    " count = count + excluded.count,"
+                    " last_used = max(last_used, excluded.last_used)",
+                    [(word, count, last_used.get(word, 0.0)) for word, count in pending.items()]
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"[Error] Guardando estadísticas de uso: {e}")
+            # Se devuelven a la cola para el siguiente intento
+            with self._lock:
+                self._pending.update(pending)
+                for word, used in last_used.items():
+                    self._last_used[word] = max(used, self._last_used.get(word, 0.0))
+            return False
+
+    def close(self):
+        """Escribe lo pendiente y detiene el hilo de fondo."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(5.0)
+            self._thread = None
+        self.flush()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Una conexión por lote: el hilo de fondo y quien llame a flush()
+        # no comparten objetos de sqlite3
+        db = sqlite3.connect(self.db_path, timeout=5.0)
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _run(self):
+        """Hilo de fondo: vuelca lo pendiente cada flush_interval segundos."""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
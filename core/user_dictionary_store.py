@@ -0,0 +1,247 @@
+# core/user_dictionary_store.py
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .file_utils import FileLock, atomic_write_text
+
+
+def read_user_words(json_path: Path, journal_path: Path) -> Dict[str, str]:
+    """
+    Palabras del usuario (JSON + diario) solo para leer: sin cerrojo y sin
+    tocar los archivos aunque estén dañados. Para procesos que no editan
+    el diccionario, como el corrector por lotes.
+    """
+    try:
+        words = json.loads(Path(json_path).read_text(encoding="utf-8"))
+        if not isinstance(words, dict):
+            raise ValueError("el archivo no contiene un objeto JSON")
+    except FileNotFoundError:
+        words = {}
+    except Exception as e:
+        print(f"[Aviso] Diccionario de usuario ilegible, se ignora: {e}")
+        words = {}
+    _apply_journal(words, Path(journal_path))
+    return words
+
+
+def _apply_journal(words: Dict[str, str], journal_path: Path) -> int:
+    """Aplica el diario de cambios sobre 'words'. Returns: operaciones leídas"""
+    entries = 0
+    if journal_path.exists():
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    # Línea a medio escribir tras un cierre inesperado
+                    continue
+                # El diario se puede editar a mano (y se recarga en caliente):
+                # las líneas que no son una operación completa se ignoran
+                if not isinstance(op, dict) or not isinstance(op.get("word"), str):
+                    continue
+                if op.get("op") == "add" and isinstance(op.get("value"), str):
+                    words[op["word"]] = op["value"]
+                elif op.get("op") == "remove":
+                    words.pop(op["word"], None)
+                else:
+                    continue
+                entries += 1
+    return entries
+
+
+class UserDictionaryStore:
+    """
+    Persistencia del diccionario de usuario mediante un diario de cambios.
+
+    Cada alta o baja se añade como una línea JSON a 'user_dictionary.journal'
+    en lugar de reescribir todo el JSON. Las escrituras se agrupan en un
+    hilo de fondo y, cuando el diario crece, se compacta en el archivo
+    principal con escritura atómica (temporal + rename). Todo el acceso a
+    disco va protegido por un cerrojo de archivo para que dos instancias
+    no pierdan las ediciones de la otra.
+    """
+
+    _STOP = object()
+
+    def __init__(self, json_path: Path, journal_path: Path, lock_path: Path,
+                 compact_threshold: int = 500, flush_interval: float = 0.5):
+        self.json_path = Path(json_path)
+        self.journal_path = Path(journal_path)
+        self.lock = FileLock(lock_path)
+        self.compact_threshold = compact_threshold
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._journal_entries = 0
+        self._thread = None
+        self._closed = False
+        atexit.register(self.close)
+
+    # ────────────────────────────────
+    # Lectura
+    # ────────────────────────────────
+    def load(self) -> Dict[str, str]:
+        """Lee el JSON principal y aplica encima el diario de cambios."""
+        with self.lock:
+            words, entries = self._read_disk_state()
+        self._journal_entries = entries
+        return words
+
+    def _read_disk_state(self) -> Tuple[Dict[str, str], int]:
+        """Estado en disco (JSON + diario). Debe llamarse con el cerrojo tomado."""
+        try:
+            words = json.loads(self.json_path.read_text(encoding="utf-8"))
+            if not isinstance(words, dict):
+                raise ValueError("el archivo no contiene un objeto JSON")
+        except FileNotFoundError:
+            words = {}
+        except Exception as e:
+            print(f"[Error] No se pudo cargar el diccionario de usuario: {e}")
+            # Si el archivo del usuario está corrupto, lo reseteamos a un JSON vacío
+            atomic_write_text(self.json_path, "{}")
+            words = {}
+
+        entries = _apply_journal(words, self.journal_path)
+        return words, entries
+
+    # ────────────────────────────────
+    # Escritura
+    # ────────────────────────────────
+    def add(self, word: str, value: str):
+        """Registra un alta (se escribe en segundo plano)."""
+        self._submit([{"op": "add", "word": word, "value": value}])
+
+    def add_many(self, items: Iterable[Tuple[str, str]]):
+        """Registra varias altas como un único lote."""
+        self._submit([{"op": "add", "word": w, "value": v} for w, v in items])
+
+    def remove(self, word: str):
+        """Registra una baja (se escribe en segundo plano)."""
+        self._submit([{"op": "remove", "word": word}])
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a que todo lo pendiente esté en disco."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def compact(self):
+        """Vuelca el diario en el JSON principal y lo vacía."""
+        with self.lock:
+            self._compact_locked()
+
+    def close(self):
+        """Escribe lo pendiente, compacta y detiene el hilo de fondo."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join(5.0)
+            self._thread = None
+
+        try:
+            if self._journal_entries:
+                self.compact()
+        except Exception as e:
+            print(f"[Error] Compactando diccionario de usuario: {e}")
+
+    def _submit(self, ops: List[dict]):
+        if not ops:
+            return
+        if self._closed:
+            raise RuntimeError("El almacén del diccionario de usuario está cerrado")
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="UserDictionaryWriter",
+                daemon=True
+            )
+            self._thread.start()
+        self._queue.put(ops)
+
+    def _run(self):
+        """Hilo de fondo: agrupa las operaciones y las añade al diario."""
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            pending: List[dict] = []
+            waiters: List[threading.Event] = []
+
+            # Agrupar todo lo que llegue durante el intervalo de escritura
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is self._STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    pending.extend(item)
+
+                if stop:
+                    break
+                remaining = deadline - time.monotonic() if pending else 0
+                try:
+                    item = self._queue.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    break
+
+            if pending:
+                try:
+                    self._append(pending)
+                except Exception as e:
+                    print(f"[Error] Guardando diccionario de usuario: {e}")
+
+            for waiter in waiters:
+                waiter.set()
+
+    def _append(self, ops: List[dict]):
+        lines = "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops)
+        with self.lock:
+            # Un cierre inesperado puede haber dejado la última línea a
+            # medias: sin el salto, la primera operación nueva se pegaría a
+            # ella y se descartaría con ella al leer el diario
+            if not self._journal_ends_cleanly():
+                lines = "\n" + lines
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_entries += len(ops)
+
+            if self._journal_entries >= self.compact_threshold:
+                self._compact_locked()
+
+    def _journal_ends_cleanly(self) -> bool:
+        """True si el diario está vacío o acaba en salto de línea (con el cerrojo tomado)."""
+        try:
+            with open(self.journal_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+    def _compact_locked(self):
+        # Se relee de disco para incluir lo que haya escrito otra instancia
+        words, _ = self._read_disk_state()
+        atomic_write_text(
+            self.json_path,
+            json.dumps(words, ensure_ascii=False, indent=2)
+        )
+        # El JSON ya contiene el diario: se puede vaciar
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self._journal_entries = 0
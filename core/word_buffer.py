@@ -0,0 +1,242 @@
+# core/word_buffer.py
+
+import threading
+import time
+from collections import deque
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class Anchor(NamedTuple):
+    """
+    Posición en el texto escrito desde la última vez que se perdió el
+    cursor. Solo vale mientras no cambie la generación (un clic, una
+    flecha o un atajo la cambian).
+    """
+    generation: int
+    position: int
+    edits: int = 0      # ediciones del motor ya aplicadas al crearla
+
+
+class WordEnd(NamedTuple):
+    """Resultado de WordBuffer.end_word."""
+    valid: bool                      # se sabe dónde empieza la palabra
+    word: Optional[str]              # None: nada que corregir
+    previous: Tuple[str, ...]        # palabras anteriores (contexto)
+    anchor: Optional[Anchor]         # final de la palabra (antes del separador)
+
+
+class WordBuffer:
+    """
+    Buffer de la palabra que se está escribiendo, construido a partir de
+    los eventos de teclado que ya recibe KeyboardListener.
+
+    Mientras el buffer es válido el motor conoce la última palabra sin
+    tocar el portapapeles. Cualquier evento que mueva el cursor sin que
+    lo veamos (flechas, clics, cambio de ventana, atajos con Ctrl/Alt)
+    lo invalida; deja de serlo en el siguiente separador de palabra.
+
+    Además guarda el texto escrito desde la última invalidación: con él
+    el motor sabe a cuántos caracteres del cursor queda cada palabra
+    pendiente de corregir aunque el usuario siga escribiendo.
+    """
+
+    LETTERS = "áéíóúüñÁÉÍÓÚÜÑ"
+
+    def __init__(self, max_length: int = 64, history_size: int = 2, max_typed: int = 4096):
+        self.max_length = max_length
+        self.max_typed = max_typed
+        self._chars = []
+        # Últimas palabras completas, para desambiguar por contexto
+        self._history = deque(maxlen=history_size)
+        self._tainted = False   # la palabra actual contiene algo que no es letra
+        self._valid = False     # solo tras un separador sabemos dónde empieza la palabra
+
+        # Texto escrito desde la última invalidación. Las posiciones son
+        # absolutas: _dropped caracteres ya se descartaron por el principio
+        self._typed: List[str] = []
+        self._dropped = 0
+        self._generation = 0
+        # Ediciones del motor que cambiaron la longitud: (posición, diferencia)
+        self._shifts: List[Tuple[int, int]] = []
+        self.last_input = time.monotonic()
+
+        self._lock = threading.Lock()
+
+    # ────────────────────────────────
+    # Alimentación desde el listener
+    # ────────────────────────────────
+    def push_char(self, char: str):
+        """
+        Añade un carácter imprimible a la palabra actual. '\\0' marca una
+        tecla desconocida: la palabra deja de valer y no se sabe cuántos
+        caracteres escribió.
+        """
+        with self._lock:
+            self.last_input = time.monotonic()
+            if char == "\0":
+                self._lose_position()
+            else:
+                self._append_typed(char)
+
+            if char.isalpha() and (char.isascii() or char in self.LETTERS):
+                if len(self._chars) >= self.max_length:
+                    self._tainted = True
+                    return
+                self._chars.append(char)
+            else:
+                self._tainted = True
+
+    def backspace(self):
+        """Borra el último carácter. Si la palabra ya estaba vacía, el cursor
+        vuelve a la palabra anterior, que no conocemos. Si tenía algo que
+        no es letra (no está en _chars) tampoco se sabe qué se borró."""
+        with self._lock:
+            self.last_input = time.monotonic()
+            if self._chars and not self._tainted:
+                self._chars.pop()
+                if self._typed:
+                    self._typed.pop()
+                else:
+                    self._lose_position()
+            else:
+                self._reset(valid=False)
+
+    def invalidate(self):
+        """El cursor se movió de forma que no podemos seguir (flechas, clic,
+        cambio de foco...)."""
+        with self._lock:
+            self.last_input = time.monotonic()
+            self._reset(valid=False)
+
+    def end_word(self, sentence_end: bool = False, separator: Optional[str] = None) -> WordEnd:
+        """
+        Cierra la palabra actual al recibir un separador.
+        Si valid es False el llamador debe usar el portapapeles; si word
+        es None no hay nada que corregir.
+
+        sentence_end: el separador cierra la frase (. ! ? Enter), así que
+        las palabras anteriores dejan de servir como contexto.
+        separator: carácter que escribe el separador (' ', '\\n', '.'...);
+        None si no se sabe, y entonces se pierde la posición del cursor.
+        """
+        with self._lock:
+            self.last_input = time.monotonic()
+            valid = self._valid
+            word = "".join(self._chars) if self._chars and not self._tainted else None
+            previous = tuple(self._history)
+            anchor = Anchor(self._generation, self._dropped + len(self._typed), len(self._shifts))
+
+            if valid and word is not None and not sentence_end:
+                self._history.append(word.lower())
+            else:
+                self._history.clear()
+
+            self._chars.clear()
+            self._tainted = False
+            self._valid = True
+            if separator is None:
+                self._lose_position()
+            else:
+                self._append_typed(separator)
+            return WordEnd(valid, word, previous, anchor)
+
+    # ────────────────────────────────
+    # Posición del cursor
+    # ────────────────────────────────
+    def typed_since(self, anchor: Anchor) -> Optional[str]:
+        """
+        Texto escrito desde 'anchor' hasta el cursor, o None si ya no se
+        puede saber (el cursor se perdió o el texto es demasiado antiguo).
+        """
+        with self._lock:
+            start = self._locate(anchor)
+            if start is None:
+                return None
+            return "".join(self._typed[start:])
+
+    def offsets_since(self, start: Anchor, anchors: List[Anchor]) -> Optional[Tuple[str, List[Optional[int]]]]:
+        """
+        Como typed_since(start), pero devuelve además la posición de cada
+        ancla dentro de ese texto (None si ya no se puede saber). Todo se
+        lee de una vez, sin que el listener pueda colarse entre medias.
+        """
+        with self._lock:
+            begin = self._locate(start)
+            if begin is None:
+                return None
+            offsets = []
+            for anchor in anchors:
+                index = self._locate(anchor)
+                offsets.append(index - begin if index is not None and index >= begin else None)
+            return "".join(self._typed[begin:]), offsets
+
+    def replace_typed(self, anchor: Anchor, old: str, new: str) -> bool:
+        """
+        Registra que el motor cambió 'old' por 'new' a partir de 'anchor'
+        (las anclas posteriores se desplazan si cambia la longitud).
+        """
+        with self._lock:
+            start = self._locate(anchor)
+            if start is None or "".join(self._typed[start:start + len(old)]) != old:
+                return False
+            self._typed[start:start + len(old)] = new
+            if len(new) != len(old):
+                end = self._dropped + start + len(old)
+                self._shifts.append((end, len(new) - len(old)))
+            return True
+
+    def _locate(self, anchor: Anchor) -> Optional[int]:
+        """Índice en _typed de una posición absoluta (con el lock tomado)."""
+        if anchor.generation != self._generation:
+            return None
+        # Las ediciones posteriores al ancla desplazan lo que va detrás
+        position = anchor.position
+        for shift_at, delta in self._shifts[anchor.edits:]:
+            if position >= shift_at:
+                position += delta
+        index = position - self._dropped
+        if index < 0 or index > len(self._typed):
+            return None
+        return index
+
+    def _append_typed(self, char: str):
+        self._typed.append(char)
+        if len(self._typed) > self.max_typed:
+            # Lo más antiguo ya no lo va a necesitar ninguna corrección
+            half = len(self._typed) // 2
+            del self._typed[:half]
+            self._dropped += half
+
+    def _lose_position(self):
+        self._generation += 1
+        self._typed.clear()
+        self._dropped = 0
+        self._shifts.clear()
+
+    # ────────────────────────────────
+    # Utilidades
+    # ────────────────────────────────
+    @property
+    def is_valid(self) -> bool:
+        return self._valid
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def idle_time(self) -> float:
+        """Segundos desde la última tecla del usuario."""
+        return time.monotonic() - self.last_input
+
+    def current_word(self) -> str:
+        """Devuelve la palabra en curso (para depuración)."""
+        with self._lock:
+            return "".join(self._chars)
+
+    def _reset(self, valid: bool):
+        if not valid:
+            self._history.clear()
+            self._lose_position()
+        self._chars.clear()
+        self._tainted = False
+        self._valid = valid
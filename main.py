@@ -9,21 +9,41 @@ Versión: 1.0.0
 
 import sys
 import os
+import threading
 from pathlib import Path
 
 # Agregar directorio raíz al path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
+# Se importa primero para medir también los demás imports
+from core.startup_profile import StartupProfile, requested as profile_requested
 
-# Importar módulos del proyecto
-from core.dictionary_manager import DictionaryManager
-from core.autocorrect_engine import AutocorrectEngine
-from core.keyboard_listener import KeyboardListener
-from ui.main_window import MainWindow
-from ui.tray_icon import TrayIcon
-from config.config_manager import ConfigManager
+PROFILE = StartupProfile()
+
+with PROFILE.phase("Imports: PyQt6"):
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+    from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+# Importar módulos del proyecto. La ventana principal (ui.main_window) se
+# importa al mostrarse y el icono de bandeja (pystray, PIL) cuando el bucle
+# de eventos ya está en marcha
+with PROFILE.phase("Imports: núcleo"):
+    from core.dictionary_manager import DictionaryManager
+    from core.autocorrect_engine import AutocorrectEngine
+    from core.backends import DEFAULT_BACKEND, create_backend
+    from core.keyboard_listener import KeyboardListener
+    from config.config_manager import ConfigManager
+
+
+class AppSignals(QObject):
+    """
+    Peticiones que llegan desde otros hilos (menú de la bandeja): se
+    atienden en el hilo de la interfaz, que es el único que puede crear
+    y mostrar ventanas.
+    """
+    show_requested = pyqtSignal()
+    quit_requested = pyqtSignal()
+    language_changed = pyqtSignal(str)
 
 
 class AutocorrectorApp:
@@ -31,40 +51,68 @@ class AutocorrectorApp:
     
     def __init__(self):
         # Inicializar QApplication
-        self.qt_app = QApplication(sys.argv)
-        self.qt_app.setApplicationName("Autocorrector de Tildes")
+        with PROFILE.phase("QApplication"):
+            self.qt_app = QApplication(sys.argv)
+            self.qt_app.setApplicationName("Autocorrector de Tildes")
+            # La app vive en la bandeja: cerrar la ventana no la termina
+            self.qt_app.setQuitOnLastWindowClosed(False)
         
         # Inicializar componentes
-        self.config = ConfigManager()
-        self.dict_manager = DictionaryManager()
-        self.engine = AutocorrectEngine(self.dict_manager)
-        self.listener = KeyboardListener(self.engine)
+        with PROFILE.phase("Configuración"):
+            self.config = ConfigManager()
+        with PROFILE.phase("Diccionarios"):
+            self.dict_manager = DictionaryManager(language=self.config.values.language)
+            self.dict_manager.memory_budget = self.config.values.language_memory_mb * 2**20
+        with PROFILE.phase("Motor y backend"):
+            self.engine = AutocorrectEngine(self.dict_manager, self.create_backend())
+            self.listener = KeyboardListener(
+                self.engine, use_asyncio=self.config.values.engine_core == 'asyncio')
         
         # Configurar listener callback
         self.listener.set_toggle_callback(self.on_toggle_from_hotkey)
+        # Vacío desactiva el atajo
+        self.listener.set_language_hotkey(self.config.values.language_hotkey or None)
+        self.listener.set_language_callback(self.on_language_hotkey)
         
-        # Interfaz gráfica
-        self.main_window = MainWindow(
-            self.dict_manager,
-            self.engine,
-            self.listener,
-            self.config
-        )
+        self.signals = AppSignals()
+        self.signals.show_requested.connect(self.show_window)
+        self.signals.quit_requested.connect(self.quit_app)
+        self.signals.language_changed.connect(self.on_language_changed)
         
-        # Icono de bandeja
-        self.tray_icon = TrayIcon(self.engine)
-        self.tray_icon.set_callbacks(
-            on_show=self.show_window,
-            on_quit=self.quit_app
-        )
+        # Interfaz gráfica: se construye la primera vez que se muestra
+        self.main_window = None
         
-        # Conectar señal de cierre de ventana
-        self.main_window.close_signal.connect(self.on_window_close)
+        # Icono de bandeja: se crea en start_tray, con el bucle de eventos en marcha
+        self.tray_icon = None
         
         # Estado
         self.window_visible = False
         self.minimized_mode = False
     
+    def ensure_main_window(self):
+        """Crea la ventana principal si aún no existe"""
+        if self.main_window is None:
+            with PROFILE.phase("Ventana principal"):
+                from ui.main_window import MainWindow
+                self.main_window = MainWindow(
+                    self.dict_manager,
+                    self.engine,
+                    self.listener,
+                    self.config
+                )
+                # Conectar señal de cierre de ventana
+                self.main_window.close_signal.connect(self.on_window_close)
+        return self.main_window
+    
+    def create_backend(self):
+        """Crea el backend de teclado configurado (por defecto, el del sistema)"""
+        name = self.config.values.input_backend
+        try:
+            return create_backend(name)
+        except (ValueError, RuntimeError, ImportError) as e:
+            print(f"[Aviso] Backend '{name}' no disponible ({e}), se usa '{DEFAULT_BACKEND}'")
+            return create_backend(DEFAULT_BACKEND)
+    
     def show_first_run_dialog(self):
         """Muestra diálogo informativo en primera ejecución"""
         msg = QMessageBox()
@@ -99,8 +147,8 @@ class AutocorrectorApp:
     
     def ask_background_mode(self):
         """Pregunta si desea ejecutar en segundo plano"""
-        if not self.config.get_setting('ask_background_on_startup', True):
-            return self.config.get_setting('run_in_background', True)
+        if not self.config.values.ask_background_on_startup:
+            return self.config.values.run_in_background
         
         msg = QMessageBox()
         msg.setWindowTitle("Modo de Ejecución")
@@ -126,10 +174,18 @@ class AutocorrectorApp:
             self.show_first_run_dialog()
         
         # Iniciar listener de teclado
-        self.listener.start()
+        with PROFILE.phase("Listener"):
+            self.listener.start()
+        
+        # Recargar los diccionarios cuando cambien en disco
+        if self.config.values.watch_dictionaries:
+            self.dict_manager.start_watching()
+        
+        # Los demás idiomas activados se abren en segundo plano
+        self.dict_manager.preload_languages(self.config.values.enabled_languages)
         
-        # Iniciar icono de bandeja
-        self.tray_icon.start()
+        # El icono de bandeja se crea en cuanto el bucle de eventos arranca
+        QTimer.singleShot(0, self.start_tray)
         
         # Decidir si mostrar ventana o minimizar
         if '--minimized' in sys.argv or self.ask_background_mode():
@@ -140,15 +196,48 @@ class AutocorrectorApp:
         else:
             self.show_window()
         
+        # El informe se imprime cuando el bucle de eventos ya está atendiendo
+        profile_path = profile_requested(sys.argv)
+        if profile_path is not None:
+            QTimer.singleShot(0, lambda: self.report_startup(profile_path))
+        
         # Ejecutar aplicación
         sys.exit(self.qt_app.exec())
     
+    def start_tray(self):
+        """Crea e inicia el icono de bandeja (aquí se importan pystray y PIL)"""
+        with PROFILE.phase("Bandeja"):
+            from ui.tray_icon import TrayIcon
+            self.tray_icon = TrayIcon(self.engine)
+            self.tray_icon.set_callbacks(
+                on_show=self.signals.show_requested.emit,
+                on_quit=self.signals.quit_requested.emit
+            )
+            self.tray_icon.start()
+    
+    def notify(self, title, message):
+        """Muestra una notificación en la bandeja, si el icono ya está visible"""
+        if self.tray_icon is not None and self.tray_icon.icon and self.tray_icon.icon.visible:
+            self.tray_icon.icon.notify(title, message)
+    
+    def report_startup(self, path):
+        """Imprime (y opcionalmente guarda) el perfil de arranque"""
+        PROFILE.mark("Bucle de eventos")
+        print(PROFILE.report())
+        if path:
+            try:
+                PROFILE.dump(path)
+            except OSError as e:
+                print(f"[Error] No se pudo guardar el perfil de arranque: {e}")
+    
     def show_window(self):
         """Muestra la ventana principal"""
         if not self.window_visible:
-            self.main_window.show()
-            self.main_window.raise_()
-            self.main_window.activateWindow()
+            window = self.ensure_main_window()
+            window.update_control_section_ui(self.engine.is_active)
+            window.show()
+            window.raise_()
+            window.activateWindow()
             self.window_visible = True
     
     def hide_window(self):
@@ -163,41 +252,64 @@ class AutocorrectorApp:
         self.hide_window()
         
         # Mostrar notificación
-        if self.tray_icon.icon and self.tray_icon.icon.visible:
-            self.tray_icon.icon.notify(
-                "Autocorrector de Tildes",
-                "La aplicación sigue ejecutándose en segundo plano"
-            )
+        self.notify(
+            "Autocorrector de Tildes",
+            "La aplicación sigue ejecutándose en segundo plano"
+        )
     
     def on_toggle_from_hotkey(self, new_state):
         """Callback cuando se usa el hotkey para toggle"""
         # Actualizar icono de bandeja
-        self.tray_icon.update_icon()
+        if self.tray_icon is not None:
+            self.tray_icon.update_icon()
         
-        # --- 3. Lógica de actualización de UI modificada ---
-        # Actualizar UI si está visible, llamando al nuevo método
+        # Actualizar UI si está visible
         if self.window_visible:
             self.main_window.update_control_section_ui(new_state)
-        # ----------------------------------------------------
         
         # Notificación
-        if self.tray_icon.icon and self.tray_icon.icon.visible:
-            status = "activado" if new_state else "desactivado"
-            self.tray_icon.icon.notify(
-                "Autocorrector",
-                f"Corrector {status}"
-            )
+        status = "activado" if new_state else "desactivado"
+        self.notify("Autocorrector", f"Corrector {status}")
+    
+    def on_language_hotkey(self):
+        """Callback del atajo de idioma (hilo del hook): no debe bloquearlo"""
+        threading.Thread(target=self.cycle_language, daemon=True, name="LanguageSwitch").start()
+    
+    def cycle_language(self):
+        """Pasa al siguiente idioma activado"""
+        enabled = self.config.values.enabled_languages
+        success, message = self.dict_manager.cycle_language(enabled)
+        print(message)
+        if success:
+            self.signals.language_changed.emit(self.dict_manager.language)
+    
+    def on_language_changed(self, code):
+        """Guarda el idioma elegido y lo refleja en la interfaz"""
+        self.config.set_setting('language', code)
+        
+        if self.main_window is not None:
+            self.main_window.update_language_ui(code)
+        
+        pack = self.dict_manager.packs.get(code)
+        self.notify("Autocorrector", f"Idioma: {pack.name if pack else code}")
     
     def quit_app(self):
         """Cierra completamente la aplicación"""
-        # Detener listener
+        # Detener listener y liberar el backend de teclado
         self.listener.stop()
+        self.engine.backend.close()
         
         # Detener icono de la bandeja
-        self.tray_icon.stop()
+        if self.tray_icon is not None:
+            self.tray_icon.stop()
+        
+        # Guardar ediciones pendientes del diccionario y de la configuración
+        self.dict_manager.close()
+        self.config.close()
         
         # Cerrar ventana
-        self.main_window.close()
+        if self.main_window is not None:
+            self.main_window.close()
         
         # Salir de Qt
         self.qt_app.quit()
@@ -205,6 +317,11 @@ class AutocorrectorApp:
 
 def main():
     """Punto de entrada principal"""
+    # El diccionario se recompila en otro proceso al recargarse en caliente:
+    # en el ejecutable de PyInstaller ese proceso vuelve a entrar por aquí
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     try:
         # Verificar que se ejecuta en Windows
         if sys.platform != 'win32':
@@ -0,0 +1,34 @@
+# tests/conftest.py
+"""Datos compartidos por las pruebas: diccionarios pequeños en memoria."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import compiled_dictionary, context_model  # noqa: E402
+from core.compiled_dictionary import CompiledDictionary  # noqa: E402
+from core.context_model import ContextModel  # noqa: E402
+from core.dictionary_snapshot import DictionarySnapshot  # noqa: E402
+
+# Algunas palabras del diccionario base, incluidas las ambiguas de las reglas
+BASE_WORDS = {
+    "camion": "camión",
+    "cancion": "canción",
+    "informacion": "información",
+    "despues": "después",
+    "el": "él",
+    "si": "sí",
+}
+
+
+@pytest.fixture
+def snapshot():
+    """Diccionario de prueba con las reglas de contexto que se distribuyen."""
+    base = CompiledDictionary(compiled_dictionary.encode(BASE_WORDS))
+    rules = context_model.read_rules(ROOT / "data" / "context_rules.tsv")
+    model = ContextModel(context_model.encode(rules))
+    return DictionarySnapshot.create(1, base, {}, model)
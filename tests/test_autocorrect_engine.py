@@ -0,0 +1,72 @@
+# tests/test_autocorrect_engine.py
+
+import pytest
+
+from core.autocorrect_engine import AutocorrectEngine, PendingCorrection, minimal_edit
+from core.backends.simulated import SimulatedBackend, SimulatedEditor
+
+
+class SnapshotDictionary:
+    """Lo que el motor usa de DictionaryManager, sobre un DictionarySnapshot."""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.recorded = []
+
+    def get_corrected_word(self, word, previous=()):
+        return self.snapshot.get_corrected_word(word, previous)
+
+    def record_correction(self, word):
+        self.recorded.append(word)
+
+
+@pytest.fixture
+def engine(snapshot):
+    engine = AutocorrectEngine(SnapshotDictionary(snapshot), SimulatedBackend())
+    engine.catch_up_idle = 0.0
+    engine.activate()
+    return engine
+
+
+def type_after_click(engine, text):
+    """El usuario hace clic al final del editor y escribe 'text' seguido de un espacio."""
+    editor = engine.backend.editor
+    engine.word_buffer.invalidate()
+    for char in text:
+        editor.write(char)
+        engine.word_buffer.push_char(char)
+    editor.write(" ")
+    return engine.word_buffer.end_word(separator=" ")
+
+
+@pytest.mark.parametrize("previous, expected", [
+    (("eso",), "eso sí "),
+    ((), "eso si "),
+])
+def test_catch_up_reads_word_with_its_context(engine, previous, expected):
+    engine.backend.editor.write("eso ")
+    end = type_after_click(engine, "si")
+    assert not end.valid
+
+    engine._defer(PendingCorrection(None, None, end.anchor, previous))
+    assert engine.catch_up() == (expected != "eso si ")
+
+    assert engine.backend.editor.text == expected
+
+
+@pytest.mark.parametrize("typed, corrected, expected", [
+    ("administracion", "administración", (1, 1, "ó")),
+    ("camion", "camión", (1, 1, "ó")),
+    ("arbol", "árbol", (4, 1, "á")),
+    ("esta", "está", (0, 1, "á")),
+    ("pinguino", "pingüino", (3, 1, "ü")),
+    ("camion", "camion", (0, 0, "")),
+    ("ai", "ahí", (0, 1, "hí")),
+    ("aa", "aaa", (0, 0, "a")),
+])
+def test_minimal_edit(typed, corrected, expected):
+    assert minimal_edit(typed, corrected) == expected
+    suffix, delete, insert = expected
+    # Aplicar la edición desde el final de lo escrito da la corrección
+    cut = len(typed) - suffix
+    assert typed[:cut - delete] + insert + typed[cut:] == corrected
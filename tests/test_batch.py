@@ -0,0 +1,70 @@
+# tests/test_batch.py
+
+import io
+import os
+import stat
+
+import pytest
+
+from core import batch
+from core.text_corrector import TextCorrector
+
+
+@pytest.fixture
+def corrector(snapshot, monkeypatch):
+    monkeypatch.setattr(batch, "_corrector", TextCorrector(snapshot))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="permisos POSIX")
+def test_in_place_keeps_file_mode(tmp_path, corrector):
+    path = tmp_path / "texto.txt"
+    path.write_bytes(b"el camion\n")
+    path.chmod(0o644)
+
+    batch._process_in_place(path, None, 4096, batch.BatchStats())
+
+    assert path.read_bytes() == "el camión\n".encode("utf-8")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def chunks_of(data, chunk_size):
+    return list(batch.iter_chunks(io.BytesIO(data), chunk_size))
+
+
+def test_chunks_end_at_line_breaks():
+    data = b"uno dos\ntres\ncuatro cinco\n"
+    chunks = chunks_of(data, 10)
+    assert b"".join(chunks) == data
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+
+def test_without_line_breaks_chunks_end_at_a_non_letter():
+    data = "camion cancion informacion".encode("utf-8")
+    chunks = chunks_of(data, 9)
+    assert b"".join(chunks) == data
+    for chunk in chunks[:-1]:
+        assert chunk[-1:] == b" "
+
+
+def test_a_word_longer_than_the_chunk_is_not_split():
+    data = b"a " + b"x" * 50 + b" b"
+    chunks = chunks_of(data, 8)
+    assert b"".join(chunks) == data
+    assert any(b"x" * 50 in chunk for chunk in chunks)
+
+
+def test_multibyte_characters_are_never_split():
+    data = "camión canción ñandú árbol pingüino\n".encode("utf-8") * 5
+    for chunk_size in range(1, 40):
+        chunks = chunks_of(data, chunk_size)
+        assert b"".join(chunks) == data
+        for chunk in chunks:
+            chunk.decode("utf-8")
+
+
+def test_chunks_cut_at_line_breaks_correct_like_a_single_pass(corrector):
+    data = "el camion. si, la cancion\nde el arbol\n".encode("utf-8") * 20
+    whole = batch.correct_chunk(data)[0]
+    pieces = b"".join(batch.correct_chunk(c)[0] for c in chunks_of(data, 16))
+    assert pieces == whole
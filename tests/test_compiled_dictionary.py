@@ -0,0 +1,70 @@
+# tests/test_compiled_dictionary.py
+
+from core.compiled_dictionary import CompiledDictionary, encode, file_hash
+
+WORDS = {
+    "camion": "camión",
+    "cancion": "canción",
+    "pinguino": "pingüino",
+    "arbol": "árbol",
+    "ñandu": "ñandú",
+    "a": "á",
+}
+
+
+def test_round_trip_through_a_file(tmp_path):
+    path = tmp_path / "dictionary.bin"
+    CompiledDictionary.build(path, WORDS, b"hash")
+    compiled = CompiledDictionary.open(path)
+    try:
+        assert len(compiled) == len(WORDS)
+        assert dict(compiled.items()) == WORDS
+        # Ordenadas por sus bytes UTF-8 (la búsqueda binaria depende de ello)
+        keys = list(compiled.keys())
+        assert keys == sorted(WORDS, key=lambda k: k.encode("utf-8"))
+        for word, corrected in WORDS.items():
+            assert word in compiled
+            assert compiled.get(word) == corrected
+            assert compiled.might_contain(word)
+        assert compiled.source_hash == b"hash".ljust(32, b"\0")
+    finally:
+        compiled.close()
+
+
+def test_missing_words_and_rank():
+    compiled = CompiledDictionary(encode(WORDS))
+    assert "camio" not in compiled
+    assert compiled.get("camiones") is None
+    assert compiled.get("camiones", "x") == "x"
+    assert compiled.rank("") == 0
+    assert compiled.rank("camion") == list(compiled.keys()).index("camion")
+    assert compiled.rank("zzz") == len(WORDS) - 1    # 'ñandu' va después en UTF-8
+    assert compiled.rank("￿") == len(WORDS)
+
+
+def test_empty_dictionary():
+    empty = CompiledDictionary.empty()
+    assert len(empty) == 0
+    assert "camion" not in empty
+    assert list(empty.items()) == []
+
+
+def test_load_or_build_recompiles_only_when_the_source_changes(tmp_path):
+    source = tmp_path / "default_dictionary.json"
+    compiled_path = tmp_path / "default_dictionary.bin"
+    source.write_text('{"camion": "camión"}', encoding="utf-8")
+
+    first = CompiledDictionary.load_or_build(compiled_path, source)
+    assert first.get("camion") == "camión"
+    assert first.source_hash == file_hash(source)
+    built = compiled_path.stat().st_mtime_ns
+    first.close()
+
+    again = CompiledDictionary.load_or_build(compiled_path, source)
+    assert compiled_path.stat().st_mtime_ns == built
+    again.close()
+
+    source.write_text('{"arbol": "árbol"}', encoding="utf-8")
+    changed = CompiledDictionary.load_or_build(compiled_path, source)
+    assert dict(changed.items()) == {"arbol": "árbol"}
+    changed.close()
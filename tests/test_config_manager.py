@@ -0,0 +1,32 @@
+# tests/test_config_manager.py
+
+import pytest
+
+pytest.importorskip("winreg")
+
+from config.config_manager import INPUT_BACKENDS, ConfigManager, Settings  # noqa: E402
+from core.backends import BACKENDS  # noqa: E402
+
+
+@pytest.fixture
+def validate():
+    manager = ConfigManager.__new__(ConfigManager)
+    manager.default_settings = Settings()._asdict()
+    return manager._validate
+
+
+def test_backend_names_match_the_registry():
+    assert INPUT_BACKENDS == tuple(BACKENDS)
+
+
+def test_optional_language_hotkey_can_be_empty(validate):
+    assert validate('language_hotkey', '') == (True, '')
+    assert validate('language_hotkey', None) == (True, '')
+    assert validate('hotkey', '') == (False, 'ctrl+shift+a')
+
+
+def test_backend_and_hotkeys_are_checked(validate):
+    assert validate('input_backend', 'evdev') == (True, 'evdev')
+    assert validate('input_backend', 'xyz') == (False, 'system')
+    assert validate('hotkey', 'Ctrl+Shift+B') == (True, 'ctrl+shift+b')
+    assert validate('hotkey', 'ctrl++') == (False, 'ctrl+shift+a')
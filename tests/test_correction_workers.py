@@ -0,0 +1,80 @@
+# tests/test_correction_workers.py
+
+import threading
+
+import pytest
+
+from core.async_worker import AsyncCorrectionWorker
+from core.correction_worker import CorrectionWorker
+from core.metrics import PipelineMetrics
+
+
+class BlockingEngine:
+    """Motor falso cuyo primer trigger se queda esperando a 'release'."""
+
+    def __init__(self):
+        self.metrics = PipelineMetrics()
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.processed = []
+
+    def catch_up_timeout(self):
+        return None
+
+    def catch_up(self):
+        pass
+
+    def process_trigger(self, event, word, previous, received, anchor):
+        self.started.set()
+        self.release.wait(5)
+        self.processed.append(word)
+
+    async def catch_up_async(self):
+        pass
+
+    async def process_trigger_async(self, event, word, previous, received, anchor):
+        self.started.set()
+        # Bloquea el bucle, como una llamada que no se puede cancelar
+        self.release.wait(5)
+        self.processed.append(word)
+
+
+@pytest.mark.parametrize("worker_class", [CorrectionWorker, AsyncCorrectionWorker])
+def test_stop_keeps_a_busy_thread_and_start_refuses(worker_class):
+    engine = BlockingEngine()
+    worker = worker_class(engine, max_pending=1)
+    worker.start()
+    worker.submit(word="camion")
+    assert engine.started.wait(5)
+    worker.submit(word="cancion")
+
+    worker.stop(timeout=0.1)
+    old_thread = worker.thread
+    assert old_thread is not None and old_thread.is_alive()
+    with pytest.raises(RuntimeError):
+        worker.start()
+
+    engine.release.set()
+    worker.stop(timeout=5)
+    assert worker.thread is None and not old_thread.is_alive()
+
+    worker.start()
+    assert worker.thread is not old_thread and worker.thread.is_alive()
+    worker.stop(timeout=5)
+    assert worker.thread is None
+
+
+def test_thread_worker_drains_queue_when_stop_could_not_enqueue():
+    engine = BlockingEngine()
+    worker = CorrectionWorker(engine, max_pending=1)
+    worker.start()
+    worker.submit(word="camion")
+    assert engine.started.wait(5)
+    worker.submit(word="cancion")
+
+    # La cola está llena: stop() no puede encolar la señal de parada
+    worker.stop(timeout=0.1)
+    engine.release.set()
+    worker.thread.join(5)
+    assert not worker.thread.is_alive()
+    assert engine.processed == ["camion", "cancion"]
@@ -0,0 +1,52 @@
+# tests/test_dictionary_manager.py
+
+import threading
+
+import pytest
+
+from core.dictionary_manager import DictionaryManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DictionaryManager(tmp_path)
+    yield manager
+    manager.close()
+
+
+def test_edits_do_not_wait_for_a_reload(manager):
+    building = threading.Event()
+    release = threading.Event()
+    build_snapshot = manager._build_snapshot
+    calls = []
+
+    def slow_build(reloading=False):
+        calls.append(reloading)
+        if len(calls) == 1:
+            building.set()
+            release.wait(5)
+        return build_snapshot(reloading)
+
+    manager._build_snapshot = slow_build
+    reload = threading.Thread(target=manager.reload)
+    reload.start()
+    results = []
+    add = threading.Thread(target=lambda: results.append(manager.add_word("pinguino", "pingüino")))
+    try:
+        assert building.wait(5)
+        # La recarga está a medias y el alta no la espera
+        add.start()
+        add.join(2)
+        assert not add.is_alive()
+    finally:
+        release.set()
+        reload.join(5)
+        if add.is_alive():
+            add.join(5)
+
+    assert results[0][0]
+
+    # La recarga se repitió y no perdió el alta publicada entretanto
+    assert len(calls) == 2
+    assert manager.user_dictionary["pinguino"] == "pingüino"
+    assert manager.get_corrected_word("pinguino") == "pingüino"
@@ -0,0 +1,37 @@
+# tests/test_dictionary_snapshot.py
+
+import pytest
+
+from core.dictionary_snapshot import apply_case
+
+
+@pytest.mark.parametrize("original, corrected, expected", [
+    ("camion", "camión", "camión"),
+    ("Camion", "camión", "Camión"),
+    ("CAMION", "camión", "CAMIÓN"),
+    ("CamionES", "camiónes", "CamiónES"),
+    ("cAmion", "camión", "cAmión"),
+    ("Ai", "ahí", "Ahí"),
+    ("aI", "ahí", "aHí"),
+    ("", "á", "á"),
+])
+def test_apply_case(original, corrected, expected):
+    assert apply_case(original, corrected) == expected
+
+
+def test_user_words_take_priority_and_keep_case(snapshot):
+    updated = snapshot.with_user_words(added={"camion": "camióncito"})
+    assert updated.version == snapshot.version + 1
+    assert updated.get_corrected_word("Camion") == "Camióncito"
+    assert snapshot.get_corrected_word("Camion") == "Camión"
+
+    removed = updated.with_user_words(removed=["camion"])
+    assert removed.get_corrected_word("CAMION") == "CAMIÓN"
+
+
+def test_ambiguous_words_need_context(snapshot):
+    assert snapshot.is_ambiguous("si")
+    assert not snapshot.is_ambiguous("camion")
+    assert snapshot.get_corrected_word("si") == "si"
+    assert snapshot.get_corrected_word("Si", ("eso",)) == "Sí"
+    assert snapshot.get_corrected_word("si", ("por",)) == "si"
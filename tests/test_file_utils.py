@@ -0,0 +1,36 @@
+# tests/test_file_utils.py
+
+import os
+import stat
+
+import pytest
+
+from core.file_utils import atomic_write_bytes, atomic_write_text
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="permisos POSIX")
+
+
+def test_atomic_write_replaces_content(tmp_path):
+    path = tmp_path / "datos.json"
+    atomic_write_text(path, "uno")
+    atomic_write_text(path, "dos")
+    assert path.read_text(encoding="utf-8") == "dos"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@posix_only
+def test_atomic_write_keeps_existing_mode(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_bytes(b"{}")
+    path.chmod(0o664)
+    atomic_write_bytes(path, b"[]")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o664
+
+
+@posix_only
+def test_atomic_write_uses_umask_for_new_files(tmp_path):
+    reference = tmp_path / "normal"
+    reference.write_bytes(b"")
+    path = tmp_path / "nuevo.bin"
+    atomic_write_bytes(path, b"\0")
+    assert stat.S_IMODE(path.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
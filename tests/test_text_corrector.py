@@ -0,0 +1,40 @@
+# tests/test_text_corrector.py
+
+from core.text_corrector import CorrectionSpan, TextCorrector, correct_text
+
+
+def test_corrects_words_and_reports_spans(snapshot):
+    text, spans = correct_text("el Camion y la CANCION", snapshot)
+    assert text == "el Camión y la CANCIÓN"
+    assert spans == [CorrectionSpan(3, 9, "Camion", "Camión"),
+                     CorrectionSpan(15, 22, "CANCION", "CANCIÓN")]
+
+
+def test_leaves_words_glued_to_digits_or_underscores(snapshot):
+    assert correct_text("camion2 camion_x", snapshot) == ("camion2 camion_x", [])
+
+
+def test_ambiguous_words_use_previous_words(snapshot):
+    assert correct_text("eso si vienes", snapshot)[0] == "eso sí vienes"
+    assert correct_text("es de el perro", snapshot)[0] == "es de él perro"
+    assert correct_text("si vienes", snapshot)[0] == "si vienes"
+
+
+def test_context_does_not_cross_sentence_ends(snapshot):
+    assert correct_text("eso. si vienes", snapshot)[0] == "eso. si vienes"
+    assert correct_text("Es de. el perro", snapshot)[0] == "Es de. el perro"
+    assert correct_text("eso! si", snapshot)[0] == "eso! si"
+    assert correct_text("eso?si", snapshot)[0] == "eso?si"
+    assert correct_text("eso\nsi vienes", snapshot)[0] == "eso\nsi vienes"
+    assert correct_text("eso, si vienes", snapshot)[0] == "eso, sí vienes"
+
+
+def test_initial_context_is_dropped_at_a_sentence_end(snapshot):
+    assert correct_text(" si", snapshot, previous=["eso"])[0] == " sí"
+    assert correct_text(". si", snapshot, previous=["eso"])[0] == ". si"
+
+
+def test_cache_keeps_contexts_apart(snapshot):
+    corrector = TextCorrector(snapshot)
+    assert corrector.correct("eso si. si")[0] == "eso sí. si"
+    assert corrector.correct("si eso si")[0] == "si eso sí"
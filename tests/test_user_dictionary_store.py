@@ -0,0 +1,65 @@
+# tests/test_user_dictionary_store.py
+
+import json
+
+import pytest
+
+from core.user_dictionary_store import UserDictionaryStore, read_user_words
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return (tmp_path / "user_dictionary.json",
+            tmp_path / "user_dictionary.journal",
+            tmp_path / "user_dictionary.lock")
+
+
+@pytest.fixture
+def store(paths):
+    store = UserDictionaryStore(*paths)
+    yield store
+    store.close()
+
+
+def write_journal(path, *lines):
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def test_journal_is_applied_over_the_json(paths, store):
+    json_path, journal_path, _ = paths
+    json_path.write_text(json.dumps({"a": "á", "camion": "camion"}), encoding="utf-8")
+    write_journal(journal_path,
+                  '{"op": "add", "word": "camion", "value": "camión"}\n',
+                  '{"op": "remove", "word": "a"}\n')
+    assert store.load() == {"camion": "camión"}
+
+
+def test_torn_last_line_is_skipped(paths, store):
+    _, journal_path, _ = paths
+    write_journal(journal_path,
+                  '{"op": "add", "word": "a", "value": "á"}\n',
+                  '{"op": "add", "word": "cam')
+    assert store.load() == {"a": "á"}
+
+
+def test_append_after_a_torn_line_is_not_lost(paths, store):
+    _, journal_path, _ = paths
+    write_journal(journal_path,
+                  '{"op": "add", "word": "a", "value": "á"}\n',
+                  '{"op": "add", "word": "cam')
+    store.add("camion", "camión")
+    assert store.flush()
+    assert store.load() == {"a": "á", "camion": "camión"}
+
+
+def test_malformed_operations_are_skipped(paths, store):
+    _, journal_path, _ = paths
+    write_journal(journal_path,
+                  '["add", "x", "y"]\n',
+                  '42\n',
+                  '{"op": "add", "word": "sin_valor"}\n',
+                  '{"op": "remove"}\n',
+                  '{"op": "rename", "word": "a"}\n',
+                  '{"op": "add", "word": "a", "value": "á"}\n')
+    assert store.load() == {"a": "á"}
+    assert read_user_words(paths[0], journal_path) == {"a": "á"}
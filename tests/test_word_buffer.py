@@ -0,0 +1,114 @@
+# tests/test_word_buffer.py
+
+from core.word_buffer import WordBuffer
+
+
+def type_word(buffer, text, separator=" ", sentence_end=False):
+    for char in text:
+        buffer.push_char(char)
+    return buffer.end_word(sentence_end=sentence_end, separator=separator)
+
+
+def test_backspace_on_a_tainted_word_invalidates():
+    buffer = WordBuffer()
+    type_word(buffer, "")
+    for char in "ab1":
+        buffer.push_char(char)
+    generation = buffer.generation
+
+    buffer.backspace()
+
+    assert not buffer.is_valid
+    assert buffer.generation != generation
+    assert buffer.current_word() == ""
+    assert buffer.end_word(separator=" ").valid is False
+
+
+def test_backspace_on_a_clean_word_removes_the_letter():
+    buffer = WordBuffer()
+    type_word(buffer, "")
+    for char in "camionx":
+        buffer.push_char(char)
+    buffer.backspace()
+    end = buffer.end_word(separator=" ")
+    assert end.valid and end.word == "camion"
+
+
+def test_end_word_returns_context_and_clears_it_at_sentence_end():
+    buffer = WordBuffer()
+    type_word(buffer, "")
+    assert type_word(buffer, "eso").previous == ()
+    end = type_word(buffer, "si", separator=".", sentence_end=True)
+    assert end.valid and end.word == "si" and end.previous == ("eso",)
+    assert type_word(buffer, "el").previous == ()
+
+
+def test_first_word_after_invalidation_is_not_valid():
+    buffer = WordBuffer()
+    buffer.invalidate()
+    end = type_word(buffer, "camion")
+    assert not end.valid and end.word == "camion" and end.previous == ()
+    assert type_word(buffer, "y").valid
+
+
+def test_anchor_tracks_text_typed_after_it():
+    buffer = WordBuffer()
+    type_word(buffer, "")
+    end = type_word(buffer, "camion")
+    assert buffer.typed_since(end.anchor) == " "
+    type_word(buffer, "y")
+    assert buffer.typed_since(end.anchor) == " y "
+
+
+def test_offsets_since_locates_each_anchor():
+    buffer = WordBuffer()
+    start = type_word(buffer, "").anchor
+    first = type_word(buffer, "camion").anchor
+    second = type_word(buffer, "cancion").anchor
+    text, offsets = buffer.offsets_since(start, [first, second])
+    assert text == " camion cancion "
+    assert offsets == [7, 15]
+    assert text[offsets[0] - len("camion"):offsets[0]] == "camion"
+
+
+def test_replace_typed_shifts_later_anchors():
+    buffer = WordBuffer()
+    start = type_word(buffer, "").anchor
+    ai = type_word(buffer, "ai").anchor
+    later = type_word(buffer, "camion").anchor
+
+    word_start = ai._replace(position=ai.position - 2)
+    assert buffer.replace_typed(word_start, "ai", "ahí")
+    assert buffer.typed_since(start) == " ahí camion "
+    # El ancla creada antes de la edición se desplaza un carácter
+    assert buffer.typed_since(later) == " "
+    # Lo sustituido tiene que coincidir con lo escrito
+    assert not buffer.replace_typed(word_start, "xx", "yy")
+
+
+def test_anchors_expire_when_the_cursor_is_lost():
+    buffer = WordBuffer()
+    type_word(buffer, "")
+    end = type_word(buffer, "camion")
+    buffer.invalidate()
+    assert buffer.typed_since(end.anchor) is None
+    assert buffer.offsets_since(end.anchor, []) is None
+    assert not buffer.replace_typed(end.anchor, " ", " ")
+
+
+def test_unknown_separator_loses_the_position():
+    buffer = WordBuffer()
+    type_word(buffer, "")
+    end = type_word(buffer, "camion", separator=None)
+    assert end.valid
+    assert buffer.typed_since(end.anchor) is None
+
+
+def test_old_text_is_dropped_but_recent_anchors_survive():
+    buffer = WordBuffer(max_typed=16)
+    start = type_word(buffer, "").anchor
+    for _ in range(10):
+        type_word(buffer, "abc")
+    recent = type_word(buffer, "camion").anchor
+    assert buffer.typed_since(start) is None
+    assert buffer.typed_since(recent) == " "
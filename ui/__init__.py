@@ -5,7 +5,20 @@
 Módulo ui - Interfaz gráfica de usuario
 """
 
-from .main_window import MainWindow
-from .tray_icon import TrayIcon
+import importlib
 
-__all__ = ['MainWindow', 'TrayIcon']
\ No newline at end of file
+__all__ = ['MainWindow', 'TrayIcon']
+
+# Importación diferida: con --minimized la ventana principal (y lo que
+# importa) no se carga hasta que se muestra por primera vez
+_EXPORTS = {
+    'MainWindow': '.main_window',
+    'TrayIcon': '.tray_icon',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,13 +2,15 @@
 import sys
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTableWidget,
-    QTableWidgetItem, QMessageBox, QGroupBox, QComboBox,
-    QCheckBox, QHeaderView
+    QPushButton, QLabel, QLineEdit, QTableView,
+    QMessageBox, QGroupBox, QComboBox,
+    QCheckBox, QHeaderView, QFileDialog, QAbstractItemView
 )
-# 1. Se eliminó QTimer que no se usaba
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont
+
+from .search_proxy_model import SearchProxyModel
+from .word_table_model import WordTableModel
 
 class MainWindow(QMainWindow):
     """Ventana principal de la aplicación"""
@@ -24,7 +26,7 @@ class MainWindow(QMainWindow):
         
         self.init_ui()
         self.load_settings()
-        self.populate_table()
+        self.update_word_count()
         self.update_control_section_ui(self.engine.is_active)
 
     def init_ui(self):
@@ -51,6 +53,9 @@ class MainWindow(QMainWindow):
         config_group = self.create_config_section()
         main_layout.addWidget(config_group)
         
+        diagnostics_group = self.create_diagnostics_section()
+        main_layout.addWidget(diagnostics_group)
+        
         self.apply_styles()
     
     def create_control_section(self):
@@ -99,7 +104,20 @@ class MainWindow(QMainWindow):
         input_layout.addWidget(self.word_with_input)
         input_layout.addWidget(self.add_btn)
         
+        bulk_layout = QHBoxLayout()
+        
+        self.import_btn = QPushButton("Importar archivo...")
+        self.import_btn.clicked.connect(self.import_words)
+        
+        self.export_btn = QPushButton("Exportar...")
+        self.export_btn.clicked.connect(self.export_words)
+        
+        bulk_layout.addStretch()
+        bulk_layout.addWidget(self.import_btn)
+        bulk_layout.addWidget(self.export_btn)
+        
         layout.addLayout(input_layout)
+        layout.addLayout(bulk_layout)
         group.setLayout(layout)
         return group
     
@@ -120,16 +138,35 @@ class MainWindow(QMainWindow):
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(self.delete_btn)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Sin Tilde", "Con Tilde", "Origen"])
+        # Modelo virtual: la vista solo pide las filas visibles
+        self.word_model = WordTableModel(self.dict_manager, self)
+        self.word_model.rowsInserted.connect(self.update_word_count)
+        self.word_model.rowsRemoved.connect(self.update_word_count)
+        self.word_model.dataChanged.connect(self.update_word_count)
+        self.word_model.modelReset.connect(self.update_word_count)
+        
+        # Búsqueda por índice (sin tildes) con retardo entre pulsaciones
+        self.filter_model = SearchProxyModel(self.word_model, self.dict_manager, self)
+        self.filter_model.modelReset.connect(self.update_word_count)
+        self.dict_manager.prepare_search_index()
+        
+        self.table = QTableView()
+        self.table.setModel(self.filter_model)
         header = self.table.horizontalHeader()
         if header is not None:
             header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
             header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+            # ResizeToContents recorrería todas las filas
+            header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+            header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
+        vertical_header = self.table.verticalHeader()
+        if vertical_header is not None:
+            # Altura fija: la vista no mide cada fila
+            vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            vertical_header.setVisible(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         
         layout.addLayout(search_layout)
@@ -164,11 +201,63 @@ class MainWindow(QMainWindow):
         self.background_check = QCheckBox("Ejecutar en segundo plano al iniciar")
         self.background_check.stateChanged.connect(self.toggle_background)
         
+        self.context_check = QCheckBox("Corregir palabras ambiguas según el contexto (el/él, si/sí, esta/está...)")
+        self.context_check.stateChanged.connect(self.toggle_context)
+        
+        # Idioma del diccionario base y los que se alternan con el atajo
+        language_layout = QHBoxLayout()
+        language_layout.addWidget(QLabel("Idioma:"))
+        
+        self.language_combo = QComboBox()
+        for code, pack in self.dict_manager.packs.items():
+            self.language_combo.addItem(pack.name, code)
+        self.language_combo.currentIndexChanged.connect(self.change_language)
+        language_layout.addWidget(self.language_combo)
+        
+        language_layout.addWidget(QLabel("Alternar con el atajo:"))
+        self.language_checks = {}
+        for code, pack in self.dict_manager.packs.items():
+            check = QCheckBox(pack.name)
+            check.stateChanged.connect(self.toggle_enabled_languages)
+            self.language_checks[code] = check
+            language_layout.addWidget(check)
+        language_layout.addStretch()
+        
         layout.addLayout(hotkey_layout)
+        layout.addLayout(language_layout)
         layout.addWidget(self.startup_check)
         layout.addWidget(self.background_check)
+        layout.addWidget(self.context_check)
+        
+        group.setLayout(layout)
+        return group
+    
+    def create_diagnostics_section(self):
+        """Crea el panel de diagnóstico (latencias y contadores del motor)"""
+        group = QGroupBox("Diagnóstico")
+        layout = QHBoxLayout()
+        
+        self.diagnostics_label = QLabel()
+        self.diagnostics_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        
+        self.export_metrics_btn = QPushButton("Exportar métricas...")
+        self.export_metrics_btn.clicked.connect(self.export_metrics)
+        
+        self.reset_metrics_btn = QPushButton("Reiniciar")
+        self.reset_metrics_btn.clicked.connect(self.reset_metrics)
+        
+        layout.addWidget(self.diagnostics_label, 1)
+        layout.addWidget(self.export_metrics_btn)
+        layout.addWidget(self.reset_metrics_btn)
         
         group.setLayout(layout)
+        
+        # Solo se refresca mientras la ventana está visible
+        self.diagnostics_timer = QTimer(self)
+        self.diagnostics_timer.setInterval(1000)
+        self.diagnostics_timer.timeout.connect(self.update_diagnostics)
+        self.update_diagnostics()
+        
         return group
     
     def apply_styles(self):
@@ -192,10 +281,10 @@ class MainWindow(QMainWindow):
                 padding: 8px; border: 2px solid #ddd; border-radius: 5px; background-color: white;
             }
             QLineEdit:focus { border-color: #4a90e2; }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #ddd; border-radius: 5px; background-color: white;
             }
-            QTableWidget::item:selected { background-color: #4a90e2; color: white; }
+            QTableView::item:selected { background-color: #4a90e2; color: white; }
             QHeaderView::section {
                 background-color: #e8e8e8; padding: 8px; border: none; font-weight: bold;
             }
@@ -236,29 +325,53 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Éxito", message)
             self.word_without_input.clear()
             self.word_with_input.clear()
-            self.populate_table()
         else:
             QMessageBox.warning(self, "Error", message)
     
+    def import_words(self):
+        """Importa un glosario completo desde CSV/TSV/JSONL"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Importar palabras", "",
+            "Glosarios (*.csv *.tsv *.txt *.jsonl *.ndjson)"
+        )
+        if not path:
+            return
+        
+        success, message = self.dict_manager.import_words(path)
+        
+        if success:
+            QMessageBox.information(self, "Importación", message)
+        else:
+            QMessageBox.warning(self, "Importación", message)
+    
+    def export_words(self):
+        """Exporta las palabras personalizadas a CSV/TSV/JSONL"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Exportar palabras", "mis_palabras.csv",
+            "CSV (*.csv);;TSV (*.tsv);;JSON Lines (*.jsonl)"
+        )
+        if not path:
+            return
+        
+        success, message = self.dict_manager.export_words(path)
+        
+        if success:
+            QMessageBox.information(self, "Exportación", message)
+        else:
+            QMessageBox.warning(self, "Exportación", message)
+    
     def delete_word(self):
         """Elimina la palabra seleccionada"""
-        current_row = self.table.currentRow()
+        current = self.table.currentIndex()
         
-        if current_row < 0:
+        if not current.isValid():
             QMessageBox.warning(self, "Error", "Por favor selecciona una palabra")
             return
         
-        item_without = self.table.item(current_row, 0)
-        item_origin = self.table.item(current_row, 2)
-
-        if item_without is None or item_origin is None:
-            QMessageBox.warning(self, "Error", "No se pudo obtener la palabra seleccionada")
-            return
-
-        word_without = item_without.text()
-        origin = item_origin.text()
+        row = self.filter_model.mapToSource(current).row()
+        word_without, _, is_user = self.word_model.entry(row)
         
-        if origin == "Sistema":
+        if not is_user:
             QMessageBox.warning(self, "Error", "No puedes eliminar palabras del diccionario base")
             return
         
@@ -267,96 +380,158 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
+            # El modelo recibe el aviso del diccionario y quita la fila
             success, message = self.dict_manager.remove_word(word_without)
             
             if success:
-                self.populate_table()
                 QMessageBox.information(self, "Éxito", message)
             else:
                 QMessageBox.warning(self, "Error", message)
     
-    def populate_table(self):
-        """Llena la tabla con todas las palabras del diccionario"""
-        words = self.dict_manager.get_all_words()
-        
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(words))
-        
-        for i, (word_without, (word_with, is_user)) in enumerate(sorted(words.items())):
-            item_without = QTableWidgetItem(word_without)
-            self.table.setItem(i, 0, item_without)
-            
-            item_with = QTableWidgetItem(word_with)
-            self.table.setItem(i, 1, item_with)
-            
-            origin = "Usuario" if is_user else "Sistema"
-            item_origin = QTableWidgetItem(origin)
-            
-            item_origin.setForeground(QColor("#27ae60" if is_user else "#7f8c8d"))
-            
-            self.table.setItem(i, 2, item_origin)
-        
-        self.update_word_count()
-    
     def filter_table(self, text):
-        """Filtra la tabla según el texto de búsqueda"""
-        for i in range(self.table.rowCount()):
-            item0 = self.table.item(i, 0)
-            item1 = self.table.item(i, 1)
-            match = (
-                (item0 is not None and text.lower() in item0.text().lower()) or
-                (item1 is not None and text.lower() in item1.text().lower())
-            )
-            self.table.setRowHidden(i, not match)
+        """Filtra la tabla según el texto de búsqueda (se aplica al dejar de escribir)"""
+        self.filter_model.set_query(text)
     
     def update_word_count(self):
-        """Actualiza el contador de palabras"""
-        total = self.table.rowCount()
-        
-        # Versión corregida y más segura
-        user_count = sum(1 for i in range(total) 
-                        if self.table.item(i, 2) and self.table.item(i, 2).text() == "Usuario") # type: ignore
-        
-        self.word_count_label.setText(
-            f"Total: {total} palabras ({user_count} personalizadas, "
-            f"{total - user_count} del sistema)"
-        )
-        
-        self.word_count_label.setText(
-            f"Total: {total} palabras ({user_count} personalizadas, {total - user_count} del sistema)"
-        )
+        """Actualiza el contador de palabras (sin recorrer la tabla)"""
+        total = self.dict_manager.word_count()
+        user_count = self.dict_manager.user_word_count()
+        
+        text = f"Total: {total} palabras ({user_count} personalizadas, {total - user_count} del sistema)"
+        if self.filter_model.is_filtered():
+            text += f" — {self.filter_model.rowCount()} coincidencias"
+        self.word_count_label.setText(text)
     
     def change_hotkey(self, hotkey):
         """Cambia el atajo de teclado"""
         if self.listener.is_valid_hotkey(hotkey):
             self.listener.set_hotkey(hotkey)
             self.config.set_setting('hotkey', hotkey)
-            self.config.save()
-    
-    # 2. Funciones de toggle corregidas
     
     def toggle_startup(self):
         """Activa/desactiva inicio automático con Windows"""
         enabled = self.startup_check.isChecked()
         self.config.set_setting('start_with_windows', enabled)
-        self.config.save()
         self.config.set_startup(enabled)
     
     def toggle_background(self):
         """Activa/desactiva ejecución en segundo plano"""
         enabled = self.background_check.isChecked()
         self.config.set_setting('run_in_background', enabled)
-        self.config.save()
+    
+    def toggle_context(self):
+        """Activa/desactiva la desambiguación por contexto"""
+        enabled = self.context_check.isChecked()
+        self.dict_manager.context_enabled = enabled
+        self.config.set_setting('context_disambiguation', enabled)
+    
+    def change_language(self, index):
+        """Cambia el idioma del diccionario base"""
+        code = self.language_combo.itemData(index)
+        if code is None or code == self.dict_manager.language:
+            return
+        
+        success, message = self.dict_manager.switch_language(code)
+        if not success:
+            QMessageBox.warning(self, "Idioma", message)
+            self.update_language_ui(self.dict_manager.language)
+            return
+        
+        self.config.set_setting('language', code)
+        check = self.language_checks.get(code)
+        if check is not None and not check.isChecked():
+            # El idioma elegido entra en la rotación del atajo
+            check.setChecked(True)
+    
+    def toggle_enabled_languages(self):
+        """Guarda los idiomas que se alternan con el atajo y los precarga"""
+        enabled = [code for code, check in self.language_checks.items() if check.isChecked()]
+        self.config.set_setting('enabled_languages', enabled)
+        self.dict_manager.preload_languages(enabled)
+    
+    def update_language_ui(self, code):
+        """Refleja el idioma activo (cambiado con el atajo)"""
+        index = self.language_combo.findData(code)
+        if index >= 0:
+            self.language_combo.blockSignals(True)
+            self.language_combo.setCurrentIndex(index)
+            self.language_combo.blockSignals(False)
     
     def load_settings(self):
         """Carga la configuración guardada"""
-        hotkey = self.config.get_setting('hotkey', 'ctrl+shift+a')
+        hotkey = self.config.values.hotkey
         index = self.hotkey_combo.findText(hotkey)
         if index >= 0:
             self.hotkey_combo.setCurrentIndex(index)
         
-        self.startup_check.setChecked(self.config.get_setting('start_with_windows', False))
-        self.background_check.setChecked(self.config.get_setting('run_in_background', True))
+        self.update_language_ui(self.dict_manager.language)
+        enabled = self.config.values.enabled_languages
+        for code, check in self.language_checks.items():
+            check.blockSignals(True)
+            check.setChecked(code in enabled)
+            check.blockSignals(False)
+        
+        self.startup_check.setChecked(self.config.values.start_with_windows)
+        self.background_check.setChecked(self.config.values.run_in_background)
+        
+        context_enabled = self.config.values.context_disambiguation
+        self.dict_manager.context_enabled = context_enabled
+        self.context_check.setChecked(context_enabled)
+    
+    def update_diagnostics(self):
+        """Refresca el panel de diagnóstico"""
+        metrics = self.engine.metrics
+        latency = metrics.trigger_latency.snapshot()
+        worker = self.listener.get_worker_stats()
+        
+        def ms(value):
+            return "—" if value is None else f"{value * 1000:.1f} ms"
+        
+        top = self.dict_manager.most_used(5)
+        top_text = ", ".join(f"{c} ({n})" for _, c, n in top) if top else "—"
+        
+        self.diagnostics_label.setText(
+            f"Triggers: {metrics.triggers.value}   "
+            f"Correcciones: {metrics.corrections.value}   "
+            f"Descartados: {metrics.dropped.value}   "
+            f"Errores: {metrics.errors.value}   "
+            f"En cola: {worker['depth']}\n"
+            f"Latencia por palabra — p50: {ms(latency['p50'])}   "
+            f"p90: {ms(latency['p90'])}   p99: {ms(latency['p99'])}   "
+            f"máx: {ms(latency['max'])}\n"
+            f"Más corregidas: {top_text}"
+        )
+    
+    def export_metrics(self):
+        """Vuelca las métricas a JSON o a texto de Prometheus"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Exportar métricas", "autocorrector_metrics.json",
+            "JSON (*.json);;Prometheus (*.prom)"
+        )
+        if not path:
+            return
+        
+        try:
+            self.engine.metrics.dump(path)
+            QMessageBox.information(self, "Métricas", f"Métricas guardadas en {path}")
+        except OSError as e:
+            QMessageBox.warning(self, "Métricas", f"No se pudieron guardar las métricas: {e}")
+    
+    def reset_metrics(self):
+        """Pone a cero los contadores e histogramas"""
+        self.engine.metrics.reset()
+        self.update_diagnostics()
+    
+    def showEvent(self, event): # type: ignore
+        """Evento al mostrar la ventana"""
+        self.update_diagnostics()
+        self.diagnostics_timer.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event): # type: ignore
+        """Evento al ocultar la ventana"""
+        self.diagnostics_timer.stop()
+        super().hideEvent(event)
     
     def closeEvent(self, event): # type: ignore
         """Evento al cerrar la ventana"""
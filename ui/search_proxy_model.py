@@ -0,0 +1,162 @@
+# ui/search_proxy_model.py
+import bisect
+from typing import List, Optional
+
+from PyQt6.QtCore import QAbstractProxyModel, QModelIndex, QTimer
+
+
+class SearchProxyModel(QAbstractProxyModel):
+    """
+    Filtro de la tabla respaldado por el índice de DictionaryManager.
+
+    QSortFilterProxyModel pregunta a cada fila del modelo si coincide, lo
+    que con un diccionario grande son segundos por pulsación. Aquí la
+    búsqueda la resuelve el índice y el proxy solo guarda la lista
+    ordenada de filas que coinciden. Sin búsqueda muestra el modelo tal
+    cual, reenviando las inserciones y borrados.
+
+    El texto se aplica con un retardo (debounce): escribir una palabra
+    lanza una única búsqueda cuando se deja de teclear.
+    """
+
+    DEBOUNCE_MS = 150
+
+    def __init__(self, source_model, dict_manager, parent=None):
+        super().__init__(parent)
+        self.dict_manager = dict_manager
+        self._query = ""
+        self._pending_query = ""
+        self._rows: Optional[List[int]] = None   # None: sin filtro
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._apply_pending_query)
+
+        self.setSourceModel(source_model)
+        source_model.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        source_model.rowsInserted.connect(self._on_rows_inserted)
+        source_model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        source_model.rowsRemoved.connect(self._on_rows_removed)
+        source_model.dataChanged.connect(self._on_data_changed)
+        source_model.modelAboutToBeReset.connect(self.beginResetModel)
+        source_model.modelReset.connect(self._on_model_reset)
+
+    # ────────────────────────────────
+    # Búsqueda
+    # ────────────────────────────────
+    def set_query(self, text: str):
+        """Programa la búsqueda de 'text' (se aplica tras DEBOUNCE_MS sin cambios)."""
+        self._pending_query = text
+        self._debounce.start()
+
+    def set_query_now(self, text: str):
+        """Aplica la búsqueda sin esperar."""
+        self._debounce.stop()
+        self._pending_query = text
+        self._apply_pending_query()
+
+    def query(self) -> str:
+        return self._query
+
+    def is_filtered(self) -> bool:
+        return self._rows is not None
+
+    def _apply_pending_query(self):
+        query = self._pending_query.strip()
+        if query == self._query:
+            return
+        self.beginResetModel()
+        self._query = query
+        self._rows = self._search()
+        self.endResetModel()
+
+    def _search(self) -> Optional[List[int]]:
+        if not self._query:
+            return None
+        base_ids, user_words = self.dict_manager.search(self._query)
+        return self.sourceModel().rows_for(base_ids, user_words)
+
+    def _refresh(self):
+        """Repite la búsqueda actual (el modelo cambió)."""
+        self.beginResetModel()
+        self._rows = self._search()
+        self.endResetModel()
+
+    # ────────────────────────────────
+    # Interfaz de QAbstractProxyModel
+    # ────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self._rows is None:
+            return self.sourceModel().rowCount()
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        row = proxy_index.row()
+        if self._rows is not None:
+            if row >= len(self._rows):
+                return QModelIndex()
+            row = self._rows[row]
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._rows is not None:
+            position = bisect.bisect_left(self._rows, row)
+            if position >= len(self._rows) or self._rows[position] != row:
+                return QModelIndex()
+            row = position
+        return self.index(row, source_index.column())
+
+    # ────────────────────────────────
+    # Cambios del modelo de origen
+    # ────────────────────────────────
+    # Sin filtro las filas coinciden una a una y se reenvían; con filtro
+    # se repite la búsqueda (un alta puede coincidir o no)
+    def _on_rows_about_to_be_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.endInsertRows()
+        else:
+            self._refresh()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+
+    def _on_rows_removed(self, parent, first, last):
+        if self._rows is None:
+            self.endRemoveRows()
+        else:
+            self._refresh()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        if self._rows is None:
+            self.dataChanged.emit(self.mapFromSource(top_left), self.mapFromSource(bottom_right))
+        else:
+            # El valor visible cambió: puede entrar o salir del resultado
+            self._refresh()
+
+    def _on_model_reset(self):
+        self._rows = self._search()
+        self.endResetModel()
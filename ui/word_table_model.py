@@ -0,0 +1,210 @@
+# ui/word_table_model.py
+import bisect
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+
+
+class WordTableModel(QAbstractTableModel):
+    """
+    Modelo de la tabla del diccionario leído directamente de DictionaryManager.
+
+    No copia las palabras: las filas son el diccionario base compilado
+    (ordenado, en mmap) intercalado con las palabras del usuario que no
+    están en él. Solo se guarda la lista ordenada de esas palabras y la
+    fila que ocupa cada una, así que resolver una fila es una búsqueda
+    binaria y la vista solo pide las filas visibles. Las altas y bajas
+    llegan como inserciones/borrados de una fila.
+    """
+
+    HEADERS = ("Sin Tilde", "Con Tilde", "Origen", "Usos")
+    USER_COLOR = QColor("#27ae60")
+    SYSTEM_COLOR = QColor("#7f8c8d")
+
+    # Los avisos del diccionario pueden llegar desde otro hilo: se
+    # reenvían por una señal para aplicarlos en el hilo de la interfaz
+    _dictionary_changed = pyqtSignal(str, str)
+
+    def __init__(self, dict_manager, parent=None):
+        super().__init__(parent)
+        self.dict_manager = dict_manager
+
+        # Versión de los diccionarios que se muestra: una recarga en otro
+        # hilo no la cambia hasta que llega su aviso
+        self._snapshot = dict_manager.snapshot()
+        self._user_keys: List[str] = []   # palabras de usuario fuera del base, ordenadas
+        self._positions: List[int] = []   # fila de cada una de ellas
+        self._rebuild()
+
+        self._dictionary_changed.connect(self._apply_change)
+        dict_manager.add_change_callback(self._on_dictionary_changed)
+
+    # ────────────────────────────────
+    # Interfaz de QAbstractTableModel
+    # ────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._snapshot.base.count + len(self._user_keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            word_without, word_with, is_user = self.entry(index.row())
+            column = index.column()
+            if column == 0:
+                return word_without
+            if column == 1:
+                return word_with
+            if column == 2:
+                return "Usuario" if is_user else "Sistema"
+            # Veces que se ha corregido (estadísticas de uso, en memoria)
+            count = self.dict_manager.usage_count(word_without)
+            return str(count) if count else ""
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 3:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == 2:
+            is_user = self.entry(index.row())[2]
+            return self.USER_COLOR if is_user else self.SYSTEM_COLOR
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    # ────────────────────────────────
+    # Filas
+    # ────────────────────────────────
+    def entry(self, row: int) -> Tuple[str, str, bool]:
+        """Devuelve (sin tilde, con tilde, es_usuario) de una fila."""
+        user = self._snapshot.user
+        j = bisect.bisect_left(self._positions, row)
+        if j < len(self._positions) and self._positions[j] == row:
+            word = self._user_keys[j]
+            return word, user.get(word, ""), True
+
+        # Antes de esta fila hay j palabras de usuario intercaladas
+        base = self._snapshot.base
+        base_index = row - j
+        word = base.key_at(base_index)
+        own = user.get(word)
+        if own is not None:
+            return word, own, True
+        return word, base.value_at(base_index), False
+
+    def row_of(self, word: str) -> Optional[int]:
+        """Fila de una palabra (sin tilde, en minúsculas), o None."""
+        base = self._snapshot.base
+        j = bisect.bisect_left(self._user_keys, word)
+        if j < len(self._user_keys) and self._user_keys[j] == word:
+            return self._positions[j]
+        if word in base:
+            return base.rank(word) + j
+        return None
+
+    def rows_for(self, base_ids: Sequence[int], user_words: Iterable[str]) -> List[int]:
+        """
+        Filas (ordenadas) de un resultado de DictionaryManager.search:
+        índices del diccionario base y palabras del usuario.
+        """
+        if self._snapshot.base is not self.dict_manager.base_dictionary:
+            # Los índices son del base nuevo; el aviso de recarga está en camino
+            return []
+        rows = list(base_ids)
+        if self._positions:
+            # Delante del índice base i van las palabras de usuario cuyo
+            # rango es <= i; ambos están ordenados, basta un recorrido
+            ranks = [p - j for j, p in enumerate(self._positions)]
+            j = 0
+            for k, base_index in enumerate(rows):
+                while j < len(ranks) and ranks[j] <= base_index:
+                    j += 1
+                rows[k] = base_index + j
+
+        extra = [row for row in map(self.row_of, user_words) if row is not None]
+        if extra:
+            rows = sorted(set(rows).union(extra))
+        return rows
+
+    def _rebuild(self):
+        self._snapshot = snapshot = self.dict_manager.snapshot()
+        base = snapshot.base
+        self._user_keys = sorted(w for w in snapshot.user if w not in base)
+        self._positions = [j + base.rank(w) for j, w in enumerate(self._user_keys)]
+
+    # ────────────────────────────────
+    # Cambios incrementales
+    # ────────────────────────────────
+    def _on_dictionary_changed(self, kind: str, word: str):
+        self._dictionary_changed.emit(kind, word)
+
+    def _apply_change(self, kind: str, word: str):
+        snapshot = self.dict_manager.snapshot()
+        if snapshot.base is not self._snapshot.base:
+            # Hubo una recarga: su aviso 'reset' aún no ha llegado
+            kind = 'reset'
+        else:
+            self._snapshot = snapshot
+
+        if kind == 'add':
+            self._insert_user_word(word)
+        elif kind == 'remove':
+            self._remove_user_word(word)
+        else:
+            self.beginResetModel()
+            self._rebuild()
+            self.endResetModel()
+
+    def _insert_user_word(self, word: str):
+        base = self._snapshot.base
+        if word in base:
+            # Tapa una palabra del sistema: la fila ya existe, cambia su contenido
+            self._row_changed(base.rank(word) + bisect.bisect_left(self._user_keys, word))
+            return
+
+        j = bisect.bisect_left(self._user_keys, word)
+        if j < len(self._user_keys) and self._user_keys[j] == word:
+            self._row_changed(self._positions[j])
+            return
+
+        row = j + base.rank(word)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._user_keys.insert(j, word)
+        self._positions.insert(j, row)
+        for k in range(j + 1, len(self._positions)):
+            self._positions[k] += 1
+        self.endInsertRows()
+
+    def _remove_user_word(self, word: str):
+        j = bisect.bisect_left(self._user_keys, word)
+        if j >= len(self._user_keys) or self._user_keys[j] != word:
+            # Era una palabra del base tapada: vuelve a verse la del sistema
+            row = self.row_of(word)
+            if row is not None:
+                self._row_changed(row)
+            return
+
+        row = self._positions[j]
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._user_keys[j]
+        del self._positions[j]
+        for k in range(j, len(self._positions)):
+            self._positions[k] -= 1
+        self.endRemoveRows()
+
+    def _row_changed(self, row: int):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def detach(self):
+        """Deja de escuchar los cambios del diccionario."""
+        self.dict_manager.remove_change_callback(self._on_dictionary_changed)